@@ -0,0 +1,46 @@
+"""Secondary indexes for hot queries
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # find_by_contest_id: WHERE contest_id ORDER BY round, match_order（filesort 回避）
+    op.create_index(
+        "ix_matches_contest_round_order",
+        "matches",
+        ["contest_id", "round", "match_order"],
+    )
+    # 完了試合のみを対象とする集計（順位表など）
+    op.create_index("ix_matches_contest_status", "matches", ["contest_id", "status"])
+    # selectinload(ContestModel.players): WHERE contest_id IN (...)
+    op.create_index("ix_players_contest_seed", "players", ["contest_id", "seed"])
+    # 一覧の絞り込み・並び替え
+    op.create_index(
+        "ix_contests_game_title_status_created",
+        "contests",
+        ["game_title_id", "status", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    # 外部キー列の索引は MySQL が要求するため、複合索引を落とす前に単一列索引を戻す
+    op.create_index("contest_id", "matches", ["contest_id"])
+    op.create_index("contest_id", "players", ["contest_id"])
+    op.create_index("game_title_id", "contests", ["game_title_id"])
+
+    op.drop_index("ix_contests_game_title_status_created", table_name="contests")
+    op.drop_index("ix_players_contest_seed", table_name="players")
+    op.drop_index("ix_matches_contest_status", table_name="matches")
+    op.drop_index("ix_matches_contest_round_order", table_name="matches")
@@ -0,0 +1,187 @@
+"""Store UUID keys as BINARY(16)
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-18
+
+既存データを残したまま CHAR(36) の UUID 列を BINARY(16) に変換する。
+1. 変換先の一時列（<列名>_new）を追加
+2. 主キー順に BATCH_SIZE 件ずつ変換してコミット
+3. 外部キー・索引を外し、旧列を削除して一時列をリネーム
+4. 外部キー・索引を張り直す
+各手順は現在のスキーマを確認してから実行するため、途中で失敗しても
+再実行すれば続きから処理される。
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.engine import Connection
+
+from alembic import op
+
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 10000
+TMP_SUFFIX = "_new"
+
+# テーブルごとの UUID 列（先頭が主キー）
+UUID_COLUMNS: dict[str, list[str]] = {
+    "game_titles": ["game_title_id"],
+    "contests": ["contest_id", "game_title_id"],
+    "players": ["player_id", "contest_id"],
+    "matches": ["match_id", "contest_id", "player1_id", "player2_id"],
+}
+
+# (テーブル, 列, 参照テーブル, 参照列)
+FOREIGN_KEYS: list[tuple[str, str, str, str]] = [
+    ("contests", "game_title_id", "game_titles", "game_title_id"),
+    ("players", "contest_id", "contests", "contest_id"),
+    ("matches", "contest_id", "contests", "contest_id"),
+]
+
+# 002 で作成した索引（UUID 列を含むため張り直す）
+INDEXES: list[tuple[str, str, list[str]]] = [
+    ("ix_contests_game_title_status_created", "contests", ["game_title_id", "status", "created_at"]),
+    ("ix_players_contest_seed", "players", ["contest_id", "seed"]),
+    ("ix_matches_contest_round_order", "matches", ["contest_id", "round", "match_order"]),
+    ("ix_matches_contest_status", "matches", ["contest_id", "status"]),
+]
+
+
+def upgrade() -> None:
+    _convert(column_type="BINARY(16)", expression="UUID_TO_BIN({})")
+
+
+def downgrade() -> None:
+    _convert(column_type="CHAR(36)", expression="BIN_TO_UUID({})")
+
+
+def _convert(column_type: str, expression: str) -> None:
+    bind = op.get_bind()
+    pending = [
+        table
+        for table, columns in UUID_COLUMNS.items()
+        if not _is_converted(bind, table, columns[0], column_type)
+    ]
+
+    for table in pending:
+        existing = _column_names(bind, table)
+        for column in UUID_COLUMNS[table]:
+            if column in existing and column + TMP_SUFFIX not in existing:
+                op.execute(
+                    f"ALTER TABLE {table} ADD COLUMN {column}{TMP_SUFFIX} "
+                    f"{column_type} NULL"
+                )
+
+    # バッチごとにコミットし、ロック保持時間と undo ログを抑える
+    with op.get_context().autocommit_block():
+        for table in pending:
+            _backfill(bind, table, expression)
+
+    if pending:
+        for table, column, _, _ in FOREIGN_KEYS:
+            name = _foreign_key_name(bind, table, column)
+            if name is not None:
+                op.drop_constraint(name, table, type_="foreignkey")
+        for name, table, _ in INDEXES:
+            if table in pending and _has_index(bind, table, name):
+                op.drop_index(name, table_name=table)
+
+        for table in pending:
+            _swap_columns(bind, table, column_type)
+
+    for table, column, ref_table, ref_column in FOREIGN_KEYS:
+        if _foreign_key_name(bind, table, column) is None:
+            op.create_foreign_key(None, table, ref_table, [column], [ref_column])
+    for name, table, columns in INDEXES:
+        if not _has_index(bind, table, name):
+            op.create_index(name, table, columns)
+
+
+def _backfill(bind: Connection, table: str, expression: str) -> None:
+    existing = _column_names(bind, table)
+    columns = [
+        c for c in UUID_COLUMNS[table] if c in existing and c + TMP_SUFFIX in existing
+    ]
+    if not columns:
+        return
+    primary_key = UUID_COLUMNS[table][0]
+    assignments = ", ".join(
+        f"{c}{TMP_SUFFIX} = {expression.format(c)}" for c in columns
+    )
+
+    # 主キー範囲で区切って走査し、変換済みの行（一時列が非 NULL）は書き込まない
+    last: str = ""
+    while True:
+        bound = bind.execute(
+            sa.text(
+                f"SELECT {primary_key} FROM {table} WHERE {primary_key} > :last "
+                f"ORDER BY {primary_key} LIMIT 1 OFFSET {BATCH_SIZE - 1}"
+            ),
+            {"last": last},
+        ).scalar()
+        condition = f"{primary_key} > :last"
+        if bound is not None:
+            condition += f" AND {primary_key} <= :bound"
+        bind.execute(
+            sa.text(
+                f"UPDATE {table} SET {assignments} WHERE {condition} "
+                f"AND {primary_key}{TMP_SUFFIX} IS NULL"
+            ),
+            {"last": last, "bound": bound},
+        )
+        if bound is None:
+            break
+        last = bound
+
+
+def _swap_columns(bind: Connection, table: str, column_type: str) -> None:
+    columns = UUID_COLUMNS[table]
+    existing = _column_names(bind, table)
+
+    old_columns = [c for c in columns if c in existing and c + TMP_SUFFIX in existing]
+    if old_columns:
+        drops = ", ".join(f"DROP COLUMN {c}" for c in old_columns)
+        if columns[0] in old_columns:
+            drops = "DROP PRIMARY KEY, " + drops
+        op.execute(f"ALTER TABLE {table} {drops}")
+
+    existing = _column_names(bind, table)
+    tmp_columns = [c for c in columns if c + TMP_SUFFIX in existing]
+    if tmp_columns:
+        changes = ", ".join(
+            f"CHANGE COLUMN {c}{TMP_SUFFIX} {c} {column_type} NOT NULL"
+            for c in tmp_columns
+        )
+        if columns[0] in tmp_columns:
+            changes += f", ADD PRIMARY KEY ({columns[0]})"
+        op.execute(f"ALTER TABLE {table} {changes}")
+
+
+def _is_converted(
+    bind: Connection, table: str, primary_key: str, column_type: str
+) -> bool:
+    columns = {c["name"]: c for c in sa.inspect(bind).get_columns(table)}
+    if primary_key not in columns or primary_key + TMP_SUFFIX in columns:
+        return False
+    current = str(columns[primary_key]["type"]).upper()
+    return current.startswith(column_type.split("(")[0])
+
+
+def _column_names(bind: Connection, table: str) -> set[str]:
+    return {c["name"] for c in sa.inspect(bind).get_columns(table)}
+
+
+def _foreign_key_name(bind: Connection, table: str, column: str) -> str | None:
+    for fk in sa.inspect(bind).get_foreign_keys(table):
+        if fk["constrained_columns"] == [column]:
+            return fk["name"]  # type: ignore[no-any-return]
+    return None
+
+
+def _has_index(bind: Connection, table: str, name: str) -> bool:
+    return any(ix["name"] == name for ix in sa.inspect(bind).get_indexes(table))
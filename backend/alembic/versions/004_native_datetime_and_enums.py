@@ -0,0 +1,51 @@
+"""Native DATETIME(6) and ENUM columns
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-18
+
+contests.created_at を ISO 文字列から DATETIME(6) に、status / format を
+ENUM に変換する。MySQL は 'T' 区切りの ISO 8601 文字列を DATETIME として
+解釈できるため、MODIFY でそのまま変換される（002 の複合索引も再構築される）。
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CONTEST_FORMATS = ("ROUND_ROBIN", "SINGLE_ELIMINATION")
+CONTEST_STATUSES = ("PRE_REGISTRATION", "IN_PROGRESS", "COMPLETED")
+MATCH_STATUSES = ("PENDING", "COMPLETED")
+
+
+def _enum(values: tuple[str, ...]) -> str:
+    return "ENUM(" + ", ".join(f"'{v}'" for v in values) + ")"
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE contests "
+        "MODIFY created_at DATETIME(6) NOT NULL, "
+        f"MODIFY format {_enum(CONTEST_FORMATS)} NOT NULL, "
+        f"MODIFY status {_enum(CONTEST_STATUSES)} NOT NULL"
+    )
+    op.execute(f"ALTER TABLE matches MODIFY status {_enum(MATCH_STATUSES)} NOT NULL")
+    # 作成日時での絞り込み・並び替え（InnoDB の二次索引は主キーを含む）
+    op.create_index("ix_contests_created_at", "contests", ["created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_contests_created_at", table_name="contests")
+    op.execute("ALTER TABLE matches MODIFY status VARCHAR(50) NOT NULL")
+    # DATETIME → 文字列は 'YYYY-MM-DD HH:MM:SS.ffffff' となり fromisoformat で読める
+    op.execute(
+        "ALTER TABLE contests "
+        "MODIFY created_at VARCHAR(50) NOT NULL, "
+        "MODIFY format VARCHAR(50) NOT NULL, "
+        "MODIFY status VARCHAR(50) NOT NULL"
+    )
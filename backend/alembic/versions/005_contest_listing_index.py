@@ -0,0 +1,26 @@
+"""Index for status-filtered contest listing
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # GET /contests?status=... を (created_at, contest_id) 降順のキーセットで読む
+    op.create_index(
+        "ix_contests_status_created", "contests", ["status", "created_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_contests_status_created", table_name="contests")
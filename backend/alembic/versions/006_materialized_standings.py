@@ -0,0 +1,91 @@
+"""Materialized standings table
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18
+
+試合結果の記録時に増分で更新する順位表テーブルを作成し、
+既存のプレイヤーと完了済み試合から初期値を投入する。
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import mysql
+
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 完了試合を player1 側・player2 側の2行に展開して集計する
+BACKFILL = """
+INSERT INTO standings
+    (contest_id, player_id, wins, losses, matches_played, game_wins, game_losses)
+SELECT
+    p.contest_id,
+    p.player_id,
+    COALESCE(SUM(s.won), 0),
+    COALESCE(SUM(1 - s.won), 0),
+    COUNT(s.won),
+    COALESCE(SUM(s.game_wins), 0),
+    COALESCE(SUM(s.game_losses), 0)
+FROM players p
+LEFT JOIN (
+    SELECT contest_id, player1_id AS player_id,
+           player1_wins > player2_wins AS won,
+           player1_wins AS game_wins, player2_wins AS game_losses
+    FROM matches WHERE status = 'COMPLETED'
+    UNION ALL
+    SELECT contest_id, player2_id,
+           player2_wins > player1_wins,
+           player2_wins, player1_wins
+    FROM matches WHERE status = 'COMPLETED'
+) s ON s.contest_id = p.contest_id AND s.player_id = p.player_id
+GROUP BY p.contest_id, p.player_id
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "standings",
+        sa.Column(
+            "contest_id",
+            mysql.BINARY(16),
+            sa.ForeignKey("contests.contest_id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "player_id",
+            mysql.BINARY(16),
+            sa.ForeignKey("players.player_id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("wins", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("losses", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("matches_played", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("game_wins", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("game_losses", sa.Integer, nullable=False, server_default="0"),
+        sa.Column(
+            "game_difference",
+            sa.Integer,
+            sa.Computed("game_wins - game_losses", persisted=True),
+        ),
+    )
+    # 順位順の読み出し（総当たり / トーナメント）
+    op.create_index(
+        "ix_standings_contest_wins_diff",
+        "standings",
+        ["contest_id", "wins", "game_difference"],
+    )
+    op.create_index(
+        "ix_standings_contest_wins_played",
+        "standings",
+        ["contest_id", "wins", "matches_played"],
+    )
+    op.execute(BACKFILL)
+
+
+def downgrade() -> None:
+    op.drop_table("standings")
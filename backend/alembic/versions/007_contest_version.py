@@ -0,0 +1,28 @@
+"""Per-contest version for standings caching
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 試合・プレイヤーの書き込みごとに増やし、順位表キャッシュの鍵・ETag に使う
+    op.add_column(
+        "contests",
+        sa.Column("version", sa.BigInteger, nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("contests", "version")
@@ -0,0 +1,34 @@
+"""Bracket links for winner advancement
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-18
+
+トーナメントの各試合に勝者の進出先（試合と枠）を持たせる。
+既存のブラケットには値を入れないため、勝ち上がりは再生成後から有効になる。
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import mysql
+
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "matches", sa.Column("next_match_id", mysql.BINARY(16), nullable=True)
+    )
+    op.add_column(
+        "matches", sa.Column("next_match_slot", sa.SmallInteger, nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("matches", "next_match_slot")
+    op.drop_column("matches", "next_match_id")
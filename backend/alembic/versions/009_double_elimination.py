@@ -0,0 +1,45 @@
+"""Double elimination format and loser links
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-18
+
+contests.format に DOUBLE_ELIMINATION を追加し、勝者側の試合から
+敗者側へ落ちる先（試合と枠）を matches に持たせる。
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import mysql
+
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CONTEST_FORMATS = ("ROUND_ROBIN", "SINGLE_ELIMINATION", "DOUBLE_ELIMINATION")
+
+
+def _enum(values: tuple[str, ...]) -> str:
+    return "ENUM(" + ", ".join(f"'{v}'" for v in values) + ")"
+
+
+def upgrade() -> None:
+    op.execute(f"ALTER TABLE contests MODIFY format {_enum(CONTEST_FORMATS)} NOT NULL")
+    op.add_column(
+        "matches", sa.Column("loser_next_match_id", mysql.BINARY(16), nullable=True)
+    )
+    op.add_column(
+        "matches", sa.Column("loser_next_match_slot", sa.SmallInteger, nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("matches", "loser_next_match_slot")
+    op.drop_column("matches", "loser_next_match_id")
+    # ダブルエリミネーションのコンテストが残っていると失敗する
+    op.execute(
+        f"ALTER TABLE contests MODIFY format {_enum(CONTEST_FORMATS[:2])} NOT NULL"
+    )
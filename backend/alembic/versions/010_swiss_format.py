@@ -0,0 +1,37 @@
+"""Swiss contest format
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CONTEST_FORMATS = (
+    "ROUND_ROBIN",
+    "SINGLE_ELIMINATION",
+    "DOUBLE_ELIMINATION",
+    "SWISS",
+)
+
+
+def _enum(values: tuple[str, ...]) -> str:
+    return "ENUM(" + ", ".join(f"'{v}'" for v in values) + ")"
+
+
+def upgrade() -> None:
+    op.execute(f"ALTER TABLE contests MODIFY format {_enum(CONTEST_FORMATS)} NOT NULL")
+
+
+def downgrade() -> None:
+    # スイス式のコンテストが残っていると失敗する
+    op.execute(
+        f"ALTER TABLE contests MODIFY format {_enum(CONTEST_FORMATS[:-1])} NOT NULL"
+    )
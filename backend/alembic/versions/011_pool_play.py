@@ -0,0 +1,44 @@
+"""Pool play format
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-18
+
+予選リーグ（プール）→ 決勝トーナメントの形式を追加し、
+試合にプール番号を持たせる（決勝トーナメントの試合は NULL）。
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "011"
+down_revision: Union[str, None] = "010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CONTEST_FORMATS = (
+    "ROUND_ROBIN",
+    "SINGLE_ELIMINATION",
+    "DOUBLE_ELIMINATION",
+    "SWISS",
+    "POOL_PLAY",
+)
+
+
+def _enum(values: tuple[str, ...]) -> str:
+    return "ENUM(" + ", ".join(f"'{v}'" for v in values) + ")"
+
+
+def upgrade() -> None:
+    op.execute(f"ALTER TABLE contests MODIFY format {_enum(CONTEST_FORMATS)} NOT NULL")
+    op.add_column("matches", sa.Column("pool", sa.SmallInteger, nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("matches", "pool")
+    # 予選リーグのコンテストが残っていると失敗する
+    op.execute(
+        f"ALTER TABLE contests MODIFY format {_enum(CONTEST_FORMATS[:-1])} NOT NULL"
+    )
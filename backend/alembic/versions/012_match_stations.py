@@ -0,0 +1,34 @@
+"""Station assignment for matches
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-18
+
+試合に対戦中の台の番号を持たせる。1つの台で同時に進む試合は1つのため、
+(contest_id, station) に一意制約を張る（未割り当ての NULL は重複可）。
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "012"
+down_revision: Union[str, None] = "011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("matches", sa.Column("station", sa.SmallInteger, nullable=True))
+    op.create_index(
+        "uq_matches_contest_station",
+        "matches",
+        ["contest_id", "station"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_matches_contest_station", table_name="matches")
+    op.drop_column("matches", "station")
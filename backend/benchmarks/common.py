@@ -0,0 +1,69 @@
+"""ベンチマーク共通処理
+
+TEST_DATABASE_URL の MySQL に対して実行する（docker compose up mysql_test）。
+backend ディレクトリから `python -m benchmarks.<name>` で起動する。
+"""
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from src.domain.contest.contest import Contest
+from src.domain.contest.value_objects import ContestFormat, ContestStatus
+from src.domain.game_title.game_title import GameTitle
+from src.infrastructure.mysql.contest_repository import MySQLContestRepository
+from src.infrastructure.mysql.game_title_repository import MySQLGameTitleRepository
+from src.infrastructure.mysql.models import Base
+from src.infrastructure.settings import Settings
+
+
+@asynccontextmanager
+async def bench_engine() -> AsyncIterator[AsyncEngine]:
+    engine = create_async_engine(Settings().test_database_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
+
+
+def session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+async def create_contest(
+    session: AsyncSession, n_players: int, format: ContestFormat
+) -> Contest:
+    game_title = GameTitle(game_title_id=uuid4(), name="Bench")
+    await MySQLGameTitleRepository(session).save(game_title)
+    contest = Contest(
+        contest_id=uuid4(),
+        name=f"bench-{n_players}",
+        game_title_id=game_title.game_title_id,
+        format=format,
+        best_of=3,
+        status=ContestStatus.PRE_REGISTRATION,
+        created_at=datetime.now(),
+        players=[],
+    )
+    for i in range(n_players):
+        contest.add_player(name=f"Player{i + 1}", seed=i + 1)
+    await MySQLContestRepository(session).save(contest)
+    return contest
+
+
+async def timed(fn: Callable[[], Awaitable[object]]) -> float:
+    """fn の実行時間をミリ秒で返す"""
+    start = time.perf_counter()
+    await fn()
+    return (time.perf_counter() - start) * 1000
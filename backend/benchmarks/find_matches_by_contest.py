@@ -0,0 +1,200 @@
+"""find_by_contest_id の CHAR(36) / BINARY(16) 比較
+
+    python -m benchmarks.find_matches_by_contest [--contests 1000] [--per-contest 1000]
+
+同じ試合データを旧形式（CHAR(36) + uuid.UUID(str) 変換）の legacy_matches と
+現行の matches（BINARY(16)）に投入し、コンテスト単位の取得時間と索引サイズを比較する。
+既定では 1000 コンテスト x 1000 試合 = 100万行。
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import uuid
+from datetime import datetime
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.mysql import CHAR
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from benchmarks.common import bench_engine, session_factory, timed
+from src.domain.contest.value_objects import ContestFormat, ContestStatus
+from src.domain.match.match import Match
+from src.domain.match.value_objects import MatchStatus
+from src.infrastructure.mysql.match_repository import (
+    BULK_INSERT_CHUNK_SIZE,
+    MySQLMatchRepository,
+)
+from src.infrastructure.mysql.models import ContestModel, GameTitleModel
+
+SAMPLES = 50
+
+legacy_metadata = sa.MetaData()
+legacy_matches = sa.Table(
+    "legacy_matches",
+    legacy_metadata,
+    sa.Column("match_id", CHAR(36), primary_key=True),
+    sa.Column("contest_id", CHAR(36), nullable=False),
+    sa.Column("player1_id", CHAR(36), nullable=False),
+    sa.Column("player2_id", CHAR(36), nullable=False),
+    sa.Column("player1_character", sa.String(100)),
+    sa.Column("player2_character", sa.String(100)),
+    sa.Column("player1_wins", sa.Integer, nullable=False),
+    sa.Column("player2_wins", sa.Integer, nullable=False),
+    sa.Column("comment", sa.Text),
+    sa.Column("status", sa.String(50), nullable=False),
+    sa.Column("round", sa.Integer),
+    sa.Column("match_order", sa.Integer, nullable=False),
+    sa.Index("ix_legacy_contest_round_order", "contest_id", "round", "match_order"),
+)
+
+
+async def populate(
+    session: AsyncSession, n_contests: int, per_contest: int
+) -> list[uuid.UUID]:
+    game_title_id = uuid.uuid4()
+    await session.execute(
+        sa.insert(GameTitleModel).values(game_title_id=game_title_id, name="Bench")
+    )
+    contest_ids = [uuid.uuid4() for _ in range(n_contests)]
+    await session.execute(
+        sa.insert(ContestModel),
+        [
+            {
+                "contest_id": cid,
+                "name": "bench",
+                "game_title_id": game_title_id,
+                "format": ContestFormat.ROUND_ROBIN,
+                "best_of": 3,
+                "status": ContestStatus.IN_PROGRESS,
+                "created_at": datetime.now(),
+            }
+            for cid in contest_ids
+        ],
+    )
+
+    repo = MySQLMatchRepository(session)
+    for cid in contest_ids:
+        matches = [
+            Match(
+                match_id=uuid.uuid4(),
+                contest_id=cid,
+                player1_id=uuid.uuid4(),
+                player2_id=uuid.uuid4(),
+                player1_character=None,
+                player2_character=None,
+                player1_wins=0,
+                player2_wins=0,
+                comment=None,
+                status=MatchStatus.PENDING,
+                round=i // 10 + 1,
+                match_order=i + 1,
+            )
+            for i in range(per_contest)
+        ]
+        await repo.save_all(matches)
+        legacy_rows = [
+            {
+                **repo._to_row(m),
+                "match_id": str(m.match_id),
+                "contest_id": str(m.contest_id),
+                "player1_id": str(m.player1_id),
+                "player2_id": str(m.player2_id),
+                "status": m.status.value,
+            }
+            for m in matches
+        ]
+        for start in range(0, len(legacy_rows), BULK_INSERT_CHUNK_SIZE):
+            await session.execute(
+                sa.insert(legacy_matches).values(
+                    legacy_rows[start : start + BULK_INSERT_CHUNK_SIZE]
+                )
+            )
+        await session.commit()
+
+    for table in ("matches", "legacy_matches"):
+        await session.execute(sa.text(f"ANALYZE TABLE {table}"))
+    return contest_ids
+
+
+async def find_legacy(session: AsyncSession, contest_id: uuid.UUID) -> list[Match]:
+    """CHAR(36) 時代の find_by_contest_id 相当"""
+    result = await session.execute(
+        sa.select(legacy_matches)
+        .where(legacy_matches.c.contest_id == str(contest_id))
+        .order_by(legacy_matches.c.round, legacy_matches.c.match_order)
+    )
+    return [
+        Match(
+            match_id=uuid.UUID(row.match_id),
+            contest_id=uuid.UUID(row.contest_id),
+            player1_id=uuid.UUID(row.player1_id),
+            player2_id=uuid.UUID(row.player2_id),
+            player1_character=row.player1_character,
+            player2_character=row.player2_character,
+            player1_wins=row.player1_wins,
+            player2_wins=row.player2_wins,
+            comment=row.comment,
+            status=MatchStatus(row.status),
+            round=row.round,
+            match_order=row.match_order,
+        )
+        for row in result
+    ]
+
+
+async def index_size_mb(session: AsyncSession, table: str) -> tuple[float, float]:
+    row = (
+        await session.execute(
+            sa.text(
+                "SELECT data_length, index_length FROM information_schema.tables "
+                "WHERE table_schema = DATABASE() AND table_name = :table"
+            ),
+            {"table": table},
+        )
+    ).one()
+    return row.data_length / 2**20, row.index_length / 2**20
+
+
+async def main(n_contests: int, per_contest: int) -> None:
+    async with bench_engine() as engine:
+        async with engine.begin() as conn:
+            await conn.run_sync(legacy_metadata.drop_all)
+            await conn.run_sync(legacy_metadata.create_all)
+
+        sessions = session_factory(engine)
+        async with sessions() as session:
+            contest_ids = await populate(session, n_contests, per_contest)
+
+        samples = random.sample(contest_ids, min(SAMPLES, len(contest_ids)))
+        async with sessions() as session:
+            repo = MySQLMatchRepository(session)
+            legacy_ms = [
+                await timed(lambda: find_legacy(session, cid)) for cid in samples
+            ]
+            binary_ms = [
+                await timed(lambda: repo.find_by_contest_id(cid)) for cid in samples
+            ]
+
+            print(f"rows: {n_contests * per_contest}, samples: {len(samples)}")
+            print(f"{'schema':>10} {'median(ms)':>11} {'data(MB)':>9} {'index(MB)':>10}")
+            for name, table, times in (
+                ("CHAR(36)", "legacy_matches", legacy_ms),
+                ("BINARY(16)", "matches", binary_ms),
+            ):
+                data_mb, index_mb = await index_size_mb(session, table)
+                print(
+                    f"{name:>10} {statistics.median(times):>11.2f} "
+                    f"{data_mb:>9.1f} {index_mb:>10.1f}"
+                )
+
+        async with engine.begin() as conn:
+            await conn.run_sync(legacy_metadata.drop_all)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--contests", type=int, default=1000)
+    parser.add_argument("--per-contest", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(main(args.contests, args.per_contest))
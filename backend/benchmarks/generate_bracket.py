@@ -0,0 +1,74 @@
+"""POST /contests/{id}/matches/generate 相当の処理時間を計測する
+
+    python -m benchmarks.generate_bracket [--legacy]
+
+--legacy を付けると、1試合ずつ save() する旧実装の時間も併記する
+（1024人では50万試合を超えるため旧実装は計測しない）。
+peak(MB) は生成中の Python ヒープの最大使用量（tracemalloc）。
+試合をチャンク単位で保存するため、人数を増やしてもほぼ一定になる。
+"""
+import argparse
+import asyncio
+import tracemalloc
+
+from benchmarks.common import bench_engine, create_contest, session_factory, timed
+from src.application.match.commands import GenerateBracketCommand
+from src.application.match.handlers import MatchCommandHandler
+from src.domain.contest.value_objects import ContestFormat
+from src.domain.match.bracket_generator import BracketGenerator
+from src.infrastructure.mysql.contest_repository import MySQLContestRepository
+from src.infrastructure.mysql.match_repository import MySQLMatchRepository
+
+PLAYER_COUNTS = (64, 256, 1024, 2048)
+LEGACY_MAX_PLAYERS = 256
+
+
+async def main(legacy: bool) -> None:
+    async with bench_engine() as engine:
+        sessions = session_factory(engine)
+        print(
+            f"{'players':>8} {'matches':>9} {'bulk(ms)':>10} "
+            f"{'peak(MB)':>9} {'legacy(ms)':>11}"
+        )
+        for n in PLAYER_COUNTS:
+            async with sessions() as session:
+                contest = await create_contest(session, n, ContestFormat.ROUND_ROBIN)
+                await session.commit()
+
+            async with sessions() as session:
+                handler = MatchCommandHandler(
+                    MySQLContestRepository(session),
+                    MySQLMatchRepository(session),
+                    BracketGenerator(),
+                )
+                command = GenerateBracketCommand(contest_id=contest.contest_id)
+                tracemalloc.start()
+                bulk_ms = await timed(lambda: handler.handle_generate_bracket(command))
+                peak_mb = tracemalloc.get_traced_memory()[1] / 2**20
+                tracemalloc.stop()
+                await session.rollback()
+
+            legacy_ms = "-"
+            if legacy and n <= LEGACY_MAX_PLAYERS:
+                async with sessions() as session:
+                    repo = MySQLMatchRepository(session)
+                    matches = BracketGenerator().generate_round_robin(contest)
+
+                    async def save_one_by_one() -> None:
+                        for match in matches:
+                            await repo.save(match)
+
+                    legacy_ms = f"{await timed(save_one_by_one):.1f}"
+                    await session.rollback()
+
+            n_matches = n * (n - 1) // 2
+            print(
+                f"{n:>8} {n_matches:>9} {bulk_ms:>10.1f} "
+                f"{peak_mb:>9.1f} {legacy_ms:>11}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--legacy", action="store_true")
+    asyncio.run(main(parser.parse_args().legacy))
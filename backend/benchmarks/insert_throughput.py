@@ -0,0 +1,102 @@
+"""matches テーブルへの挿入スループット比較（uuid4 / UUIDv7）
+
+    python -m benchmarks.insert_throughput [--rows 500000]
+
+主キーだけを変えた同じ試合データを、ブラケット生成と同じ save_all で
+BULK_INSERT_CHUNK_SIZE 件ずつコミットしながら投入する。
+テーブルが buffer pool を超える規模になるほど、ランダムな uuid4 の不利が大きくなる。
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from collections.abc import Callable
+from datetime import datetime
+
+import sqlalchemy as sa
+
+from benchmarks.common import bench_engine, session_factory
+from src.domain.contest.value_objects import ContestFormat, ContestStatus
+from src.domain.match.match import Match
+from src.domain.match.value_objects import MatchStatus
+from src.domain.shared.id_provider import new_id
+from src.infrastructure.mysql.match_repository import (
+    BULK_INSERT_CHUNK_SIZE,
+    MySQLMatchRepository,
+)
+from src.infrastructure.mysql.models import ContestModel, GameTitleModel, MatchModel
+
+
+async def run(rows: int, id_factory: Callable[[], uuid.UUID]) -> tuple[float, float]:
+    """(rows/s, index_length MB) を返す"""
+    async with bench_engine() as engine:
+        sessions = session_factory(engine)
+        contest_id = new_id()
+        async with sessions() as session:
+            game_title_id = new_id()
+            await session.execute(
+                sa.insert(GameTitleModel).values(
+                    game_title_id=game_title_id, name="Bench"
+                )
+            )
+            await session.execute(
+                sa.insert(ContestModel).values(
+                    contest_id=contest_id,
+                    name="bench",
+                    game_title_id=game_title_id,
+                    format=ContestFormat.ROUND_ROBIN,
+                    best_of=3,
+                    status=ContestStatus.IN_PROGRESS,
+                    created_at=datetime.now(),
+                )
+            )
+            await session.commit()
+
+        async with sessions() as session:
+            repo = MySQLMatchRepository(session)
+            start = time.perf_counter()
+            for offset in range(0, rows, BULK_INSERT_CHUNK_SIZE):
+                await repo.save_all(
+                    [
+                        Match(
+                            match_id=id_factory(),
+                            contest_id=contest_id,
+                            player1_id=new_id(),
+                            player2_id=new_id(),
+                            player1_character=None,
+                            player2_character=None,
+                            player1_wins=0,
+                            player2_wins=0,
+                            comment=None,
+                            status=MatchStatus.PENDING,
+                            round=None,
+                            match_order=offset + i + 1,
+                        )
+                        for i in range(min(BULK_INSERT_CHUNK_SIZE, rows - offset))
+                    ]
+                )
+                await session.commit()
+            elapsed = time.perf_counter() - start
+
+            await session.execute(sa.text(f"ANALYZE TABLE {MatchModel.__tablename__}"))
+            data_length = await session.scalar(
+                sa.text(
+                    "SELECT data_length FROM information_schema.tables "
+                    "WHERE table_schema = DATABASE() AND table_name = 'matches'"
+                )
+            )
+        return rows / elapsed, (data_length or 0) / 2**20
+
+
+async def main(rows: int) -> None:
+    print(f"rows: {rows}")
+    print(f"{'key':>6} {'rows/s':>10} {'clustered(MB)':>14}")
+    for name, factory in (("uuid4", uuid.uuid4), ("uuid7", new_id)):
+        rate, size_mb = await run(rows, factory)
+        print(f"{name:>6} {rate:>10.0f} {size_mb:>14.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=500_000)
+    asyncio.run(main(parser.parse_args().rows))
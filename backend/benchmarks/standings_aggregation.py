@@ -0,0 +1,81 @@
+"""順位表集計の Python / SQL 比較
+
+    python -m benchmarks.standings_aggregation [--players 1000]
+
+総当たり（N(N-1)/2 試合）をすべて完了させた状態で、
+全試合を読み込んで Python で集計する従来の経路と、
+MySQL 側で UNION ALL + GROUP BY して N 行だけ受け取る経路の時間を比べる。
+集計部分だけの比較として、読み込み済みの試合に対する Python の計算時間も出す。
+"""
+import argparse
+import asyncio
+import random
+import statistics
+
+from benchmarks.common import bench_engine, create_contest, session_factory, timed
+from src.application.standings.handlers import StandingsQueryHandler
+from src.application.standings.queries import GetStandingsQuery
+from src.domain.contest.contest import Contest
+from src.domain.contest.value_objects import ContestFormat
+from src.domain.match.bracket_generator import BracketGenerator
+from src.domain.match.match import Match
+from src.domain.standings.engine import PythonStandingsEngine
+from src.infrastructure.mysql.contest_repository import MySQLContestRepository
+from src.infrastructure.mysql.match_repository import MySQLMatchRepository
+from src.infrastructure.mysql.standings_repository import MySQLStandingsRepository
+
+SAMPLES = 5
+
+
+async def main(n_players: int) -> None:
+    async with bench_engine() as engine:
+        sessions = session_factory(engine)
+        async with sessions() as session:
+            contest = await create_contest(
+                session, n_players, ContestFormat.ROUND_ROBIN
+            )
+            matches = BracketGenerator().generate_round_robin(contest)
+            for match in matches:
+                winner_wins, loser_wins = 2, random.randint(0, 1)
+                if random.random() < 0.5:
+                    match.record_result(None, None, winner_wins, loser_wins, None, 3)
+                else:
+                    match.record_result(None, None, loser_wins, winner_wins, None, 3)
+            await MySQLMatchRepository(session).save_all(matches)
+            await session.commit()
+
+        async with sessions() as session:
+            # standings_repository を渡さない場合は全試合を読み込んで Python で集計する
+            handler = StandingsQueryHandler(
+                MySQLContestRepository(session), MySQLMatchRepository(session)
+            )
+            query = GetStandingsQuery(contest_id=contest.contest_id)
+            python_ms = [
+                await timed(lambda: handler.handle_get_standings(query))
+                for _ in range(SAMPLES)
+            ]
+
+            repo = MySQLStandingsRepository(session)
+            sql_ms = [
+                await timed(lambda: repo.compute(contest.contest_id))
+                for _ in range(SAMPLES)
+            ]
+
+        print(f"players: {n_players}, matches: {len(matches)}")
+        print(f"{'path':>14} {'median(ms)':>11}")
+        print(f"{'handler':>14} {statistics.median(python_ms):>11.1f}")
+        print(f"{'sql':>14} {statistics.median(sql_ms):>11.1f}")
+        engine_ms = [
+            await timed(lambda: _compute(contest, matches)) for _ in range(SAMPLES)
+        ]
+        print(f"{'engine':>14} {statistics.median(engine_ms):>11.1f}")
+
+
+async def _compute(contest: Contest, matches: list[Match]) -> None:
+    PythonStandingsEngine().compute(contest, matches)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--players", type=int, default=1000)
+    asyncio.run(main(parser.parse_args().players))
@@ -0,0 +1,165 @@
+"""台割り当ての違いによる大会全体の所要時間をシミュレーションで比べる
+
+    python -m benchmarks.station_scheduler [--seed N]
+
+DB は使わない。台が空くたびに試合を呼び、試合時間（6〜15分の一様乱数）が
+経過したら結果を記録して勝者・敗者を進出先に入れる。
+
+- naive: 呼べる試合のうち match_order が最も小さいものを呼ぶ（運営の手作業に相当）
+- scheduler: StationScheduler（クリティカルパスの長い試合から呼ぶ）。
+  本番と同じく、結果が記録されるたびにキューを組み直す
+
+試合時間と勝敗は試合ごとに固定し、両方式で同じ値を使う。
+"""
+import argparse
+import copy
+import heapq
+import random
+from collections.abc import Callable
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from src.domain.contest.contest import Contest
+from src.domain.contest.value_objects import ContestFormat, ContestStatus
+from src.domain.match.bracket_generator import BracketGenerator
+from src.domain.match.match import Match
+from src.domain.match.scheduler import StationScheduler
+from src.domain.match.value_objects import MatchStatus
+
+# (形式, 人数)
+EVENTS = (
+    (ContestFormat.SINGLE_ELIMINATION, 512),
+    (ContestFormat.DOUBLE_ELIMINATION, 256),
+    (ContestFormat.POOL_PLAY, 256),
+    (ContestFormat.ROUND_ROBIN, 32),
+)
+STATION_COUNTS = (20, 40, 60)
+
+# 台が空いたときに呼ぶ試合と台を返す方式
+_Policy = Callable[[list[Match], int, set[UUID]], list[tuple[Match, int]]]
+
+
+def make_contest(n_players: int, format: ContestFormat) -> Contest:
+    contest = Contest(
+        contest_id=uuid4(),
+        name=f"bench-{n_players}",
+        game_title_id=uuid4(),
+        format=format,
+        best_of=3,
+        status=ContestStatus.PRE_REGISTRATION,
+        created_at=datetime.now(),
+        players=[],
+    )
+    for i in range(n_players):
+        contest.add_player(name=f"Player{i + 1}", seed=i + 1)
+    return contest
+
+
+def generate(contest: Contest) -> list[Match]:
+    generator = BracketGenerator()
+    if contest.format == ContestFormat.DOUBLE_ELIMINATION:
+        # リセット戦の有無で試合数が変わらないよう、リセットなしで比べる
+        return generator.generate_double_elimination(contest, grand_final_reset=False)
+    if contest.format == ContestFormat.POOL_PLAY:
+        return list(generator.iter_pools(contest, 8))
+    if contest.format == ContestFormat.ROUND_ROBIN:
+        return generator.generate_round_robin(contest)
+    return generator.generate_single_elimination(contest)
+
+
+def naive(
+    matches: list[Match], stations: int, entrants: set[UUID]
+) -> list[tuple[Match, int]]:
+    pending = [m for m in matches if m.status == MatchStatus.PENDING]
+    playing = [m for m in pending if m.station is not None]
+    busy = {p for m in playing for p in (m.player1_id, m.player2_id)}
+    occupied = {m.station for m in playing}
+    free = [s for s in range(1, stations + 1) if s not in occupied]
+
+    called: list[tuple[Match, int]] = []
+    for match in sorted(pending, key=lambda m: m.match_order):
+        if len(called) == len(free):
+            break
+        players = (match.player1_id, match.player2_id)
+        if match.station is None and all(
+            p in entrants and p not in busy for p in players
+        ):
+            called.append((match, free[len(called)]))
+            busy.update(players)
+    return called
+
+
+def scheduled(
+    matches: list[Match], stations: int, entrants: set[UUID]
+) -> list[tuple[Match, int]]:
+    scheduler = StationScheduler(matches, stations, entrants)
+    by_id = {m.match_id: m for m in matches}
+    called: list[tuple[Match, int]] = []
+    while (assignment := scheduler.next_assignment()) is not None:
+        called.append((by_id[assignment.match.match_id], assignment.station))
+    return called
+
+
+def simulate(
+    matches: list[Match], entrants: set[UUID], stations: int, policy: _Policy, seed: int
+) -> float:
+    """全試合が終わるまでの時間（分）"""
+    by_id = {m.match_id: m for m in matches}
+    outcomes = {
+        m.match_id: (rng.uniform(6, 15), rng.random() < 0.5)
+        for m in matches
+        for rng in [random.Random(seed * 1_000_003 + m.match_order)]
+    }
+    running: list[tuple[float, UUID]] = []
+    now = 0.0
+    while True:
+        for match, station in policy(matches, stations, entrants):
+            match.station = station
+            heapq.heappush(running, (now + outcomes[match.match_id][0], match.match_id))
+        if not running:
+            break
+
+        now, match_id = heapq.heappop(running)
+        match = by_id[match_id]
+        # 結果の記録で台は空く（Match.record_result が station を外す）
+        p1_wins = outcomes[match_id][1]
+        match.record_result(None, None, *((2, 1) if p1_wins else (1, 2)), None, 3)
+        for target, slot, player_id in (
+            (match.next_match_id, match.next_match_slot, match.winner_id),
+            (match.loser_next_match_id, match.loser_next_match_slot, match.loser_id),
+        ):
+            if target is not None and player_id is not None:
+                if slot == 1:
+                    by_id[target].player1_id = player_id
+                else:
+                    by_id[target].player2_id = player_id
+    return now
+
+
+def main(seed: int) -> None:
+    print(
+        f"{'format':>20} {'players':>8} {'stations':>9} {'matches':>8} "
+        f"{'naive(min)':>11} {'scheduler(min)':>15} {'saved':>7}"
+    )
+    for format, n in EVENTS:
+        contest = make_contest(n, format)
+        entrants = {p.player_id for p in contest.players}
+        matches = generate(contest)
+        for stations in STATION_COUNTS:
+            naive_min = simulate(
+                copy.deepcopy(matches), entrants, stations, naive, seed
+            )
+            scheduled_min = simulate(
+                copy.deepcopy(matches), entrants, stations, scheduled, seed
+            )
+            saved = 1 - scheduled_min / naive_min
+            print(
+                f"{format.value:>20} {n:>8} {stations:>9} {len(matches):>8} "
+                f"{naive_min:>11.1f} {scheduled_min:>15.1f} {saved:>7.1%}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seed", type=int, default=1)
+    main(parser.parse_args().seed)
@@ -1,6 +1,8 @@
 """Contest ハンドラ"""
+import base64
+import binascii
 from datetime import datetime
-from uuid import uuid4
+from uuid import UUID
 
 from src.application.contest.commands import (
     AddPlayerCommand,
@@ -10,13 +12,17 @@ from src.application.contest.commands import (
 )
 from src.application.contest.queries import (
     ContestDTO,
+    ContestPageDTO,
+    ContestSummaryDTO,
     GetContestQuery,
     ListContestsQuery,
     PlayerDTO,
 )
 from src.domain.contest.contest import Contest
+from src.domain.contest.contest_summary import ContestSummary
 from src.domain.contest.repository import ContestRepository
 from src.domain.contest.value_objects import ContestStatus
+from src.domain.shared.id_provider import new_id
 
 
 class ContestNotFoundError(Exception):
@@ -24,13 +30,18 @@ class ContestNotFoundError(Exception):
         super().__init__(f"Contest not found: {contest_id}")
 
 
+class InvalidCursorError(Exception):
+    def __init__(self, cursor: str) -> None:
+        super().__init__(f"Invalid cursor: {cursor}")
+
+
 class ContestCommandHandler:
     def __init__(self, repository: ContestRepository) -> None:
         self._repository = repository
 
     async def handle_create(self, command: CreateContestCommand) -> ContestDTO:
         contest = Contest(
-            contest_id=uuid4(),
+            contest_id=new_id(),
             name=command.name,
             game_title_id=command.game_title_id,
             format=command.format,
@@ -99,7 +110,48 @@ class ContestQueryHandler:
             raise ContestNotFoundError(query.contest_id)
         return ContestCommandHandler(self._repository)._to_dto(contest)
 
-    async def handle_list(self, query: ListContestsQuery) -> list[ContestDTO]:
-        contests = await self._repository.find_all()
-        handler = ContestCommandHandler(self._repository)
-        return [handler._to_dto(c) for c in contests]
+    async def handle_list(self, query: ListContestsQuery) -> ContestPageDTO:
+        after = _decode_cursor(query.cursor) if query.cursor is not None else None
+        # 1件多く取得して次ページの有無を判定する
+        summaries = await self._repository.find_summaries(
+            limit=query.limit + 1,
+            after=after,
+            status=query.status,
+            game_title_id=query.game_title_id,
+            created_from=query.created_from,
+            created_to=query.created_to,
+        )
+        page = summaries[: query.limit]
+        next_cursor = (
+            _encode_cursor(page[-1]) if len(summaries) > query.limit else None
+        )
+        return ContestPageDTO(
+            items=[self._to_summary_dto(s) for s in page],
+            next_cursor=next_cursor,
+        )
+
+    def _to_summary_dto(self, summary: ContestSummary) -> ContestSummaryDTO:
+        return ContestSummaryDTO(
+            contest_id=summary.contest_id,
+            name=summary.name,
+            game_title_id=summary.game_title_id,
+            format=summary.format,
+            best_of=summary.best_of,
+            status=summary.status,
+            created_at=summary.created_at,
+            player_count=summary.player_count,
+        )
+
+
+def _encode_cursor(summary: ContestSummary) -> str:
+    raw = f"{summary.created_at.isoformat()}|{summary.contest_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, contest_id = raw.split("|")
+        return datetime.fromisoformat(created_at), UUID(contest_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError(cursor) from e
@@ -13,7 +13,12 @@ class GetContestQuery:
 
 @dataclass(frozen=True)
 class ListContestsQuery:
-    pass
+    limit: int = 50
+    cursor: str | None = None
+    status: ContestStatus | None = None
+    game_title_id: UUID | None = None
+    created_from: datetime | None = None
+    created_to: datetime | None = None
 
 
 @dataclass(frozen=True)
@@ -34,3 +39,21 @@ class ContestDTO:
     status: ContestStatus
     created_at: datetime
     players: list[PlayerDTO]
+
+
+@dataclass(frozen=True)
+class ContestSummaryDTO:
+    contest_id: UUID
+    name: str
+    game_title_id: UUID
+    format: ContestFormat
+    best_of: int
+    status: ContestStatus
+    created_at: datetime
+    player_count: int
+
+
+@dataclass(frozen=True)
+class ContestPageDTO:
+    items: list[ContestSummaryDTO]
+    next_cursor: str | None
@@ -1,10 +1,9 @@
 """GameTitle ハンドラ"""
-from uuid import uuid4
-
 from src.application.game_title.commands import CreateGameTitleCommand
 from src.application.game_title.queries import GameTitleDTO, GetGameTitlesQuery
 from src.domain.game_title.game_title import GameTitle
 from src.domain.game_title.repository import GameTitleRepository
+from src.domain.shared.id_provider import new_id
 
 
 class GameTitleCommandHandler:
@@ -12,7 +11,7 @@ class GameTitleCommandHandler:
         self._repository = repository
 
     async def handle_create(self, command: CreateGameTitleCommand) -> GameTitleDTO:
-        game_title = GameTitle(game_title_id=uuid4(), name=command.name)
+        game_title = GameTitle(game_title_id=new_id(), name=command.name)
         await self._repository.save(game_title)
         return GameTitleDTO(
             game_title_id=game_title.game_title_id,
@@ -0,0 +1,67 @@
+"""Bracket・台割り当てのキャッシュ"""
+from collections import OrderedDict
+from uuid import UUID
+
+from src.domain.match.bracket import Bracket
+from src.domain.match.scheduler import StationScheduler
+
+_Key = tuple[UUID, int]
+_SchedulerKey = tuple[UUID, int, int]
+
+
+class BracketCache:
+    """(contest_id, version) をキーにしたプロセス内 LRU キャッシュ。
+    StandingsCache と同じく、書き込みで版数が進むと古いキーは参照されなくなる。
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[_Key, Bracket] = OrderedDict()
+
+    def get(self, contest_id: UUID, version: int) -> Bracket | None:
+        key = (contest_id, version)
+        bracket = self._entries.get(key)
+        if bracket is not None:
+            self._entries.move_to_end(key)
+        return bracket
+
+    def put(self, contest_id: UUID, version: int, bracket: Bracket) -> None:
+        key = (contest_id, version)
+        self._entries[key] = bracket
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+
+class SchedulerCache:
+    """(contest_id, version, 台数) ごとの StationScheduler。
+    台の割り当ては版数を進めないため、結果が記録されるまで同じキューから取り出し続ける。
+    別のワーカーの割り当ては反映されないが、assign_station が保存済みの割り当てと
+    突き合わせて断るため、呼び出し元はキューを組み直してやり直す。
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[_SchedulerKey, StationScheduler] = OrderedDict()
+
+    def get(
+        self, contest_id: UUID, version: int, stations: int
+    ) -> StationScheduler | None:
+        key = (contest_id, version, stations)
+        scheduler = self._entries.get(key)
+        if scheduler is not None:
+            self._entries.move_to_end(key)
+        return scheduler
+
+    def put(
+        self,
+        contest_id: UUID,
+        version: int,
+        stations: int,
+        scheduler: StationScheduler,
+    ) -> None:
+        key = (contest_id, version, stations)
+        self._entries[key] = scheduler
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
@@ -6,6 +6,32 @@ from uuid import UUID
 @dataclass(frozen=True)
 class GenerateBracketCommand:
     contest_id: UUID
+    # レスポンスに含める先頭の試合数
+    page_size: int = 50
+    # ダブルエリミネーションで、敗者側の勝者が勝った場合のリセット戦を作るか
+    grand_final_reset: bool = True
+    # 予選リーグの1プールあたりの人数
+    pool_size: int = 8
+
+
+@dataclass(frozen=True)
+class GenerateNextRoundCommand:
+    contest_id: UUID
+    page_size: int = 50
+
+
+@dataclass(frozen=True)
+class GenerateTopCutCommand:
+    contest_id: UUID
+    advance_per_pool: int = 2
+    page_size: int = 50
+
+
+@dataclass(frozen=True)
+class CallNextMatchCommand:
+    contest_id: UUID
+    # 会場の台数
+    stations: int
 
 
 @dataclass(frozen=True)
@@ -1,21 +1,46 @@
 """Match ハンドラ"""
-from uuid import uuid4
+from collections.abc import Iterable
+from functools import partial
+from itertools import batched
+from uuid import UUID
 
 from src.application.contest.handlers import ContestNotFoundError
+from src.application.match.cache import BracketCache, SchedulerCache
 from src.application.match.commands import (
     AddMatchCommand,
+    CallNextMatchCommand,
     DeleteMatchCommand,
     GenerateBracketCommand,
+    GenerateNextRoundCommand,
+    GenerateTopCutCommand,
     RecordMatchResultCommand,
 )
-from src.application.match.queries import GetMatchesQuery, MatchDTO
-from src.domain.contest.contest import ContestModificationError
+from src.application.match.queries import (
+    BracketDTO,
+    GeneratedBracketDTO,
+    GetBracketQuery,
+    GetMatchesQuery,
+    GetPlayerPathQuery,
+    MatchDTO,
+    PlayerPathDTO,
+    StationAssignmentDTO,
+)
+from src.domain.contest.contest import Contest, ContestModificationError
 from src.domain.contest.repository import ContestRepository
 from src.domain.contest.value_objects import ContestFormat, ContestStatus
-from src.domain.match.bracket_generator import BracketGenerator
+from src.domain.match.bracket import Bracket
+from src.domain.match.bracket_diff import diff_bracket
+from src.domain.match.bracket_generator import TBD_PLAYER_ID, BracketGenerator
 from src.domain.match.match import Match
 from src.domain.match.repository import MatchRepository
+from src.domain.match.scheduler import StationScheduler
 from src.domain.match.value_objects import MatchStatus
+from src.domain.shared.id_provider import new_id
+from src.domain.standings.repository import StandingsRepository
+from src.domain.standings.standing import StandingDelta, deltas_for
+
+# ブラケット生成時に1度に保存する試合数
+GENERATE_CHUNK_SIZE = 1000
 
 
 class MatchNotFoundError(Exception):
@@ -29,25 +54,163 @@ class MatchCommandHandler:
         contest_repository: ContestRepository,
         match_repository: MatchRepository,
         bracket_generator: BracketGenerator,
+        standings_repository: StandingsRepository | None = None,
+        scheduler_cache: SchedulerCache | None = None,
     ) -> None:
         self._contest_repository = contest_repository
         self._match_repository = match_repository
         self._bracket_generator = bracket_generator
+        self._standings_repository = standings_repository
+        self._scheduler_cache = scheduler_cache
 
     async def handle_generate_bracket(
         self, command: GenerateBracketCommand
-    ) -> list[MatchDTO]:
+    ) -> GeneratedBracketDTO:
+        """試合を生成しながら GENERATE_CHUNK_SIZE 件ずつ保存する。
+        保持するのは保存中のチャンクと先頭ページのみで、人数によらずメモリ使用量は一定。
+        既に試合がある場合は保存済みの試合との差分だけを書き込む（何度呼んでも重複しない）。
+        """
         contest = await self._contest_repository.find_by_id(command.contest_id)
         if contest is None:
             raise ContestNotFoundError(command.contest_id)
+        stored = await self._match_repository.find_by_contest_id(contest.contest_id)
+        # 生成し直すのはスイス式の第1ラウンド・予選リーグのみのため、その後に
+        # 生成した試合があれば差分で削除されないよう断る
+        if contest.format == ContestFormat.SWISS and any(
+            (m.round or 0) > 1 for m in stored
+        ):
+            raise ContestModificationError(
+                "Cannot regenerate a Swiss contest after its second round"
+            )
+        if contest.format == ContestFormat.POOL_PLAY and any(
+            m.pool is None for m in stored
+        ):
+            raise ContestModificationError(
+                "Cannot regenerate pools after the top cut has been generated"
+            )
 
+        matches: Iterable[Match]
         if contest.format == ContestFormat.ROUND_ROBIN:
-            matches = self._bracket_generator.generate_round_robin(contest)
+            matches = self._bracket_generator.iter_round_robin(contest)
+        elif contest.format == ContestFormat.POOL_PLAY:
+            matches = self._bracket_generator.iter_pools(contest, command.pool_size)
+        elif contest.format == ContestFormat.SWISS:
+            matches = self._bracket_generator.generate_swiss_round(contest, [])
+        elif contest.format == ContestFormat.DOUBLE_ELIMINATION:
+            matches = self._bracket_generator.generate_double_elimination(
+                contest, grand_final_reset=command.grand_final_reset
+            )
         else:
             matches = self._bracket_generator.generate_single_elimination(contest)
 
-        await self._match_repository.save_all(matches)
-        return [self._to_dto(m) for m in matches]
+        if stored:
+            dto = await self._save_diff(contest, matches, stored, command.page_size)
+        else:
+            dto = await self._save_generated(
+                contest.contest_id, matches, command.page_size
+            )
+        # BYE 試合は完了状態で生成されるため、試合全体から集計し直す
+        if self._standings_repository is not None:
+            await self._standings_repository.rebuild(contest.contest_id)
+        return dto
+
+    async def handle_generate_next_round(
+        self, command: GenerateNextRoundCommand
+    ) -> GeneratedBracketDTO:
+        """スイス式の次のラウンドを、完了済みの試合の勝数から組み合わせる。
+        同時に呼ばれても同じラウンドを2度作らないよう、読み取りの前にコンテスト行を
+        ロックする（ロック後の最初の読み取りで、先に確定したラウンドが見える）。
+        """
+        await self._match_repository.lock_contest(command.contest_id)
+        contest = await self._contest_repository.find_by_id(command.contest_id)
+        if contest is None:
+            raise ContestNotFoundError(command.contest_id)
+        if contest.format != ContestFormat.SWISS:
+            raise ContestModificationError(
+                "Rounds can only be generated one at a time for Swiss contests"
+            )
+
+        previous = await self._match_repository.find_by_contest_id(contest.contest_id)
+        if any(m.status != MatchStatus.COMPLETED for m in previous):
+            raise ContestModificationError("The current round has unfinished matches")
+
+        matches = self._bracket_generator.generate_swiss_round(contest, previous)
+        dto = await self._save_generated(
+            contest.contest_id, matches, command.page_size
+        )
+        # 不戦勝の分だけ順位表に加算する
+        await self._apply_standings(
+            contest.contest_id, [d for m in matches for d in deltas_for(m)]
+        )
+        return dto
+
+    async def handle_generate_top_cut(
+        self, command: GenerateTopCutCommand
+    ) -> GeneratedBracketDTO:
+        """予選リーグの全試合の完了後、各プールの順位から決勝トーナメントを生成する"""
+        contest = await self._contest_repository.find_by_id(command.contest_id)
+        if contest is None:
+            raise ContestNotFoundError(command.contest_id)
+        if contest.format != ContestFormat.POOL_PLAY:
+            raise ContestModificationError(
+                "A top cut can only be generated for pool play contests"
+            )
+
+        previous = await self._match_repository.find_by_contest_id(contest.contest_id)
+        pool_matches = [m for m in previous if m.pool is not None]
+        if not pool_matches:
+            raise ContestModificationError("Pools have not been generated")
+        if len(pool_matches) < len(previous):
+            raise ContestModificationError("The top cut has already been generated")
+        if any(m.status != MatchStatus.COMPLETED for m in pool_matches):
+            raise ContestModificationError("Pool play has unfinished matches")
+
+        matches = self._bracket_generator.generate_top_cut(
+            contest, pool_matches, command.advance_per_pool
+        )
+        dto = await self._save_generated(
+            contest.contest_id, matches, command.page_size
+        )
+        if self._standings_repository is not None:
+            await self._standings_repository.rebuild(contest.contest_id)
+        return dto
+
+    async def _save_generated(
+        self, contest_id: UUID, matches: Iterable[Match], page_size: int
+    ) -> GeneratedBracketDTO:
+        total = 0
+        first_page: list[MatchDTO] = []
+        for chunk in batched(matches, GENERATE_CHUNK_SIZE):
+            await self._match_repository.save_all(list(chunk))
+            remaining = page_size - len(first_page)
+            first_page.extend(self._to_dto(m) for m in chunk[:remaining])
+            total += len(chunk)
+        # チャンクごとではなく生成1回につき1度だけ進める
+        if total:
+            await self._match_repository.bump_version(contest_id)
+        return GeneratedBracketDTO(total=total, matches=first_page, inserted=total)
+
+    async def _save_diff(
+        self,
+        contest: Contest,
+        matches: Iterable[Match],
+        stored: list[Match],
+        page_size: int,
+    ) -> GeneratedBracketDTO:
+        """生成し直した試合を保存済みの試合と突き合わせ、変わった行だけを書く。
+        完了済みの試合の結果は残す。
+        """
+        diff = diff_bracket(
+            matches, stored, {p.player_id for p in contest.players}
+        )
+        await self._match_repository.apply_diff(contest.contest_id, diff)
+        return GeneratedBracketDTO(
+            total=len(diff.matches),
+            matches=[self._to_dto(m) for m in diff.matches[:page_size]],
+            inserted=len(diff.inserts),
+            updated=len(diff.updates),
+            deleted=len(diff.deletes),
+        )
 
     async def handle_add_match(self, command: AddMatchCommand) -> MatchDTO:
         contest = await self._contest_repository.find_by_id(command.contest_id)
@@ -59,7 +222,7 @@ class MatchCommandHandler:
             )
 
         match = Match(
-            match_id=uuid4(),
+            match_id=new_id(),
             contest_id=command.contest_id,
             player1_id=command.player1_id,
             player2_id=command.player2_id,
@@ -78,25 +241,90 @@ class MatchCommandHandler:
     async def handle_record_result(
         self, command: RecordMatchResultCommand
     ) -> MatchDTO:
-        contest = await self._contest_repository.find_by_id(command.contest_id)
-        if contest is None:
+        found = await self._match_repository.find_for_result(
+            command.contest_id, command.match_id
+        )
+        if found is None:
             raise ContestNotFoundError(command.contest_id)
-
-        match = await self._match_repository.find_by_id(command.match_id)
+        best_of, match, players_entered = found
         if match is None:
             raise MatchNotFoundError(command.match_id)
+        # TBD（勝ち上がり待ち）や BYE の試合には結果を記録せず、進出先にも送らない
+        if not players_entered:
+            raise ContestModificationError(
+                "Both players must be decided before recording a result"
+            )
 
+        # 記録済みの結果を修正する場合は、旧結果の分を取り消してから加算する
+        reverted = [d.reversed() for d in deltas_for(match)]
+        previous_winner = match.winner_id
         match.record_result(
             p1_character=command.player1_character,
             p2_character=command.player2_character,
             p1_wins=command.player1_wins,
             p2_wins=command.player2_wins,
             comment=command.comment,
-            best_of=contest.best_of,
+            best_of=best_of,
+        )
+        await self._advance_players(match, previous_winner)
+        await self._match_repository.update_result(match)
+        await self._apply_standings(
+            command.contest_id, reverted + deltas_for(match)
         )
-        await self._match_repository.save(match)
         return self._to_dto(match)
 
+    async def handle_call_next_match(
+        self, command: CallNextMatchCommand
+    ) -> StationAssignmentDTO | None:
+        """空いている台に次の試合を割り当てる。呼べる試合がなければ None。
+        キューが古く（別のワーカーが割り当て済みで）書き込めなければ、
+        保存済みの試合から組み直して1度だけやり直す。
+        共有のキューへの反映はコミットの成功後に行い、ロールバックされた
+        割り当てはキューに残す（次の呼び出しで同じ試合をもう一度呼ぶ）。
+        """
+        for refresh in (False, True):
+            scheduler = await self._scheduler(
+                command.contest_id, command.stations, refresh
+            )
+            assignment = scheduler.peek()
+            if assignment is None:
+                return None
+            if await self._match_repository.assign_station(
+                command.contest_id, assignment.match.match_id, assignment.station
+            ):
+                # コミットできた割り当てだけを共有のキューに反映する
+                self._match_repository.after_commit(
+                    partial(scheduler.confirm, assignment)
+                )
+                return StationAssignmentDTO(
+                    station=assignment.station, match=self._to_dto(assignment.match)
+                )
+        raise ContestModificationError(
+            "Stations were assigned concurrently; please retry"
+        )
+
+    async def _scheduler(
+        self, contest_id: UUID, stations: int, refresh: bool
+    ) -> StationScheduler:
+        version = await self._match_repository.find_version(contest_id)
+        if version is None:
+            raise ContestNotFoundError(contest_id)
+        if self._scheduler_cache is not None and not refresh:
+            cached = self._scheduler_cache.get(contest_id, version, stations)
+            if cached is not None:
+                return cached
+
+        contest = await self._contest_repository.find_by_id(contest_id)
+        if contest is None:
+            raise ContestNotFoundError(contest_id)
+        matches = await self._match_repository.find_by_contest_id(contest_id)
+        scheduler = StationScheduler(
+            matches, stations, {p.player_id for p in contest.players}
+        )
+        if self._scheduler_cache is not None:
+            self._scheduler_cache.put(contest_id, version, stations, scheduler)
+        return scheduler
+
     async def handle_delete_match(self, command: DeleteMatchCommand) -> None:
         contest = await self._contest_repository.find_by_id(command.contest_id)
         if contest is None:
@@ -107,10 +335,70 @@ class MatchCommandHandler:
             )
 
         match = await self._match_repository.find_by_id(command.match_id)
-        if match is None:
+        # 別のコンテストの試合は消さない（順位表・版数もそのコンテストのものを使うため）
+        if match is None or match.contest_id != command.contest_id:
             raise MatchNotFoundError(command.match_id)
 
         await self._match_repository.delete(command.match_id)
+        await self._apply_standings(
+            command.contest_id, [d.reversed() for d in deltas_for(match)]
+        )
+
+    async def _advance_players(
+        self, match: Match, previous_winner: UUID | None
+    ) -> None:
+        """勝者・敗者を次の試合の枠に入れる。勝者が変わらない修正では何もしない"""
+        if match.winner_id is None or match.winner_id == previous_winner:
+            return
+        # 2人のダブルエリミネーションでは勝者側の第1ラウンドも勝者・敗者とも
+        # グランドファイナルへ進むため、round で区別する（グランドファイナルは 2k）
+        if (
+            match.next_match_id is not None
+            and match.next_match_id == match.loser_next_match_id
+            and match.round != 1
+        ):
+            await self._settle_reset(match)
+            return
+        for next_match_id, slot, player_id in (
+            (match.next_match_id, match.next_match_slot, match.winner_id),
+            (match.loser_next_match_id, match.loser_next_match_slot, match.loser_id),
+        ):
+            if next_match_id is None or slot is None or player_id is None:
+                continue
+            advanced = await self._match_repository.advance_player(
+                next_match_id, slot, player_id
+            )
+            if not advanced:
+                raise ContestModificationError(
+                    "Cannot change the winner after the next match has been played"
+                )
+
+    async def _settle_reset(self, match: Match) -> None:
+        """勝者も敗者も同じ試合に進むグランドファイナルの結果から、リセット戦を確定する。
+        リセット戦は敗者側の勝者（player2）が勝った場合のみ行う。勝者側の優勝者
+        （player1）が勝てば対戦者を TBD に戻し、実施しない試合として完了にする。
+        """
+        assert match.next_match_id is not None
+        if match.winner_id == match.player1_id:
+            players = (TBD_PLAYER_ID, new_id())
+            status = MatchStatus.COMPLETED
+        else:
+            players = (match.player2_id, match.player1_id)
+            if match.next_match_slot != 1:
+                players = players[::-1]
+            status = MatchStatus.PENDING
+        if not await self._match_repository.set_players(
+            match.next_match_id, *players, status
+        ):
+            raise ContestModificationError(
+                "Cannot change the winner after the next match has been played"
+            )
+
+    async def _apply_standings(
+        self, contest_id: UUID, deltas: list[StandingDelta]
+    ) -> None:
+        if self._standings_repository is not None and deltas:
+            await self._standings_repository.apply(contest_id, deltas)
 
     def _to_dto(self, match: Match) -> MatchDTO:
         return MatchDTO(
@@ -126,12 +414,25 @@ class MatchCommandHandler:
             status=match.status,
             round=match.round,
             match_order=match.match_order,
+            next_match_id=match.next_match_id,
+            next_match_slot=match.next_match_slot,
+            loser_next_match_id=match.loser_next_match_id,
+            loser_next_match_slot=match.loser_next_match_slot,
+            pool=match.pool,
+            station=match.station,
         )
 
 
 class MatchQueryHandler:
-    def __init__(self, match_repository: MatchRepository) -> None:
+    def __init__(
+        self,
+        contest_repository: ContestRepository,
+        match_repository: MatchRepository,
+        cache: BracketCache | None = None,
+    ) -> None:
+        self._contest_repository = contest_repository
         self._match_repository = match_repository
+        self._cache = cache
 
     async def handle_get_matches(self, query: GetMatchesQuery) -> list[MatchDTO]:
         matches = await self._match_repository.find_by_contest_id(query.contest_id)
@@ -149,6 +450,65 @@ class MatchQueryHandler:
                 status=m.status,
                 round=m.round,
                 match_order=m.match_order,
+                next_match_id=m.next_match_id,
+                next_match_slot=m.next_match_slot,
+                loser_next_match_id=m.loser_next_match_id,
+                loser_next_match_slot=m.loser_next_match_slot,
+                pool=m.pool,
+                station=m.station,
             )
             for m in matches
         ]
+
+    async def handle_get_bracket(self, query: GetBracketQuery) -> BracketDTO:
+        """トーナメント表を配列で返す"""
+        bracket = await self._bracket(query.contest_id)
+        return BracketDTO(
+            contest_id=query.contest_id,
+            size=bracket.size,
+            player_ids=list(bracket.player_ids),
+            slots=list(bracket.slots),
+            match_ids=list(bracket.match_ids),
+        )
+
+    async def handle_get_player_path(self, query: GetPlayerPathQuery) -> PlayerPathDTO:
+        """プレイヤーの次の試合と決勝までの経路を返す。試合を走査せず、
+        Bracket の添字計算のみで求める（ラウンド数に比例）。
+        """
+        bracket = await self._bracket(query.contest_id)
+        return PlayerPathDTO(
+            player_id=query.player_id,
+            current_match_id=bracket.current_match(query.player_id),
+            path=bracket.path(query.player_id),
+        )
+
+    async def _bracket(self, contest_id: UUID) -> Bracket:
+        """試合が書き込まれるまで（版数が同じ間）は組み立て済みの Bracket を使い回す"""
+        version = await self._match_repository.find_version(contest_id)
+        if version is None:
+            raise ContestNotFoundError(contest_id)
+
+        bracket = None
+        if self._cache is not None:
+            bracket = self._cache.get(contest_id, version)
+        if bracket is None:
+            bracket = await self._build_bracket(contest_id)
+            if self._cache is not None:
+                self._cache.put(contest_id, version, bracket)
+        return bracket
+
+    async def _build_bracket(self, contest_id: UUID) -> Bracket:
+        contest = await self._contest_repository.find_by_id(contest_id)
+        if contest is None:
+            raise ContestNotFoundError(contest_id)
+        matches = await self._match_repository.find_by_contest_id(contest_id)
+        # 予選リーグの試合は除き、決勝トーナメントのみを並べる
+        elimination = [m for m in matches if m.pool is None]
+        try:
+            return Bracket.from_matches(
+                elimination, [p.player_id for p in contest.players]
+            )
+        except ValueError as e:
+            raise ContestModificationError(
+                f"Contest has no single elimination bracket: {e}"
+            ) from e
@@ -10,6 +10,17 @@ class GetMatchesQuery:
     contest_id: UUID
 
 
+@dataclass(frozen=True)
+class GetBracketQuery:
+    contest_id: UUID
+
+
+@dataclass(frozen=True)
+class GetPlayerPathQuery:
+    contest_id: UUID
+    player_id: UUID
+
+
 @dataclass(frozen=True)
 class MatchDTO:
     match_id: UUID
@@ -24,3 +35,46 @@ class MatchDTO:
     status: MatchStatus
     round: int | None
     match_order: int
+    next_match_id: UUID | None = None
+    next_match_slot: int | None = None
+    loser_next_match_id: UUID | None = None
+    loser_next_match_slot: int | None = None
+    pool: int | None = None
+    station: int | None = None
+
+
+@dataclass(frozen=True)
+class GeneratedBracketDTO:
+    total: int
+    # 先頭 page_size 件のみ。全件は GetMatchesQuery で取得する
+    matches: list[MatchDTO]
+    # 再生成で書き込んだ行数。初回の生成では inserted = total
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+
+
+@dataclass(frozen=True)
+class BracketDTO:
+    """Bracket の配列をそのまま返す。プレイヤーは player_ids の添字（未定は -1）"""
+
+    contest_id: UUID
+    size: int
+    player_ids: list[UUID]
+    slots: list[int]
+    match_ids: list[UUID | None]
+
+
+@dataclass(frozen=True)
+class PlayerPathDTO:
+    player_id: UUID
+    # 次に戦う（戦っている）試合。敗退済み・優勝済みなら None
+    current_match_id: UUID | None
+    # 1回戦から決勝まで勝ち進む場合に戦う試合
+    path: list[UUID]
+
+
+@dataclass(frozen=True)
+class StationAssignmentDTO:
+    station: int
+    match: MatchDTO
@@ -0,0 +1,43 @@
+"""Standings キャッシュ"""
+from collections import OrderedDict
+from uuid import UUID
+
+from src.application.standings.queries import StandingsDTO
+from src.domain.standings.tiebreak import Tiebreaker
+
+_Key = tuple[UUID, int, tuple[Tiebreaker, ...]]
+
+
+class StandingsCache:
+    """(contest_id, version, タイブレーク) をキーにしたプロセス内 LRU キャッシュ。
+    書き込みで版数が進むと古いキーは参照されなくなり、やがて追い出される。
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[_Key, StandingsDTO] = OrderedDict()
+
+    def get(
+        self,
+        contest_id: UUID,
+        version: int,
+        tiebreakers: tuple[Tiebreaker, ...] = (),
+    ) -> StandingsDTO | None:
+        key = (contest_id, version, tiebreakers)
+        dto = self._entries.get(key)
+        if dto is not None:
+            self._entries.move_to_end(key)
+        return dto
+
+    def put(
+        self,
+        contest_id: UUID,
+        version: int,
+        dto: StandingsDTO,
+        tiebreakers: tuple[Tiebreaker, ...] = (),
+    ) -> None:
+        key = (contest_id, version, tiebreakers)
+        self._entries[key] = dto
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
@@ -1,19 +1,26 @@
 """Standings ハンドラ"""
-from uuid import UUID
-
 from src.application.contest.handlers import ContestNotFoundError
+from src.application.standings.cache import StandingsCache
 from src.application.standings.queries import (
     GetStandingsQuery,
     StandingsDTO,
     StandingsEntryDTO,
 )
-from src.domain.contest.contest import Contest
 from src.domain.contest.player import Player
 from src.domain.contest.repository import ContestRepository
 from src.domain.contest.value_objects import ContestFormat
 from src.domain.match.match import Match
 from src.domain.match.repository import MatchRepository
 from src.domain.match.value_objects import MatchStatus
+from src.domain.standings.engine import PythonStandingsEngine
+from src.domain.standings.repository import StandingsRepository
+from src.domain.standings.standing import Standing
+from src.domain.standings.tiebreak import (
+    MatchResults,
+    rank_standings,
+    tiebreakers_for,
+    tied_players,
+)
 
 
 class StandingsQueryHandler:
@@ -21,11 +28,38 @@ class StandingsQueryHandler:
         self,
         contest_repository: ContestRepository,
         match_repository: MatchRepository,
+        standings_repository: StandingsRepository | None = None,
+        cache: StandingsCache | None = None,
     ) -> None:
         self._contest_repository = contest_repository
         self._match_repository = match_repository
+        self._standings_repository = standings_repository
+        self._cache = cache
+
+    async def handle_get_version(self, query: GetStandingsQuery) -> int | None:
+        """順位表の版数を返す。版数を管理していない構成では None"""
+        if self._standings_repository is None:
+            return None
+        version = await self._standings_repository.find_version(query.contest_id)
+        if version is None:
+            raise ContestNotFoundError(query.contest_id)
+        return version
 
     async def handle_get_standings(self, query: GetStandingsQuery) -> StandingsDTO:
+        if self._standings_repository is not None:
+            version = query.version
+            if version is None:
+                version = await self.handle_get_version(query)
+            cache_key = query.tiebreakers or ()
+            if self._cache is not None and version is not None:
+                cached = self._cache.get(query.contest_id, version, cache_key)
+                if cached is not None:
+                    return cached
+            dto = await self._read_materialized(self._standings_repository, query)
+            if self._cache is not None and version is not None:
+                self._cache.put(query.contest_id, version, dto, cache_key)
+            return dto
+
         contest = await self._contest_repository.find_by_id(query.contest_id)
         if contest is None:
             raise ContestNotFoundError(query.contest_id)
@@ -33,128 +67,58 @@ class StandingsQueryHandler:
         matches = await self._match_repository.find_by_contest_id(query.contest_id)
         completed_matches = [m for m in matches if m.status == MatchStatus.COMPLETED]
 
-        if contest.format == ContestFormat.ROUND_ROBIN:
-            entries = self._calculate_round_robin_standings(
-                contest, completed_matches
-            )
-        else:
-            entries = self._calculate_elimination_standings(
-                contest, completed_matches
-            )
-
-        return StandingsDTO(contest_id=query.contest_id, entries=entries)
-
-    def _calculate_round_robin_standings(
-        self, contest: Contest, completed_matches: list[Match]
-    ) -> list[StandingsEntryDTO]:
-        player_map = {p.player_id: p for p in contest.players}
-        stats: dict[UUID, dict[str, int]] = {
-            p.player_id: {
-                "wins": 0,
-                "losses": 0,
-                "matches_played": 0,
-                "game_wins": 0,
-                "game_losses": 0,
-            }
-            for p in contest.players
-        }
-
-        for match in completed_matches:
-            p1_id = match.player1_id
-            p2_id = match.player2_id
-
-            if p1_id not in stats or p2_id not in stats:
-                continue  # BYE試合など
-
-            stats[p1_id]["game_wins"] += match.player1_wins
-            stats[p1_id]["game_losses"] += match.player2_wins
-            stats[p2_id]["game_wins"] += match.player2_wins
-            stats[p2_id]["game_losses"] += match.player1_wins
-            stats[p1_id]["matches_played"] += 1
-            stats[p2_id]["matches_played"] += 1
-
-            if match.player1_wins > match.player2_wins:
-                stats[p1_id]["wins"] += 1
-                stats[p2_id]["losses"] += 1
-            else:
-                stats[p2_id]["wins"] += 1
-                stats[p1_id]["losses"] += 1
-
-        entries = [
-            StandingsEntryDTO(
-                player_id=pid,
-                player_name=player_map[pid].name,
-                wins=s["wins"],
-                losses=s["losses"],
-                matches_played=s["matches_played"],
-                game_wins=s["game_wins"],
-                game_losses=s["game_losses"],
-            )
-            for pid, s in stats.items()
-            if pid in player_map
-        ]
+        # 実体化した順位表を使わない構成（ベンチマークなど）でのみ、試合から集計する
+        standings = PythonStandingsEngine().compute(contest, completed_matches)
+        return await self._rank(query, contest.format, standings, completed_matches)
+
+    async def _read_materialized(
+        self, repository: StandingsRepository, query: GetStandingsQuery
+    ) -> StandingsDTO:
+        """試合結果の記録時に更新済みの順位表をそのまま読む"""
+        contest_format = await repository.find_format(query.contest_id)
+        standings = await repository.find_by_contest_id(query.contest_id)
+        if contest_format is None or standings is None:
+            raise ContestNotFoundError(query.contest_id)
+        return await self._rank(query, contest_format, standings)
 
-        entries.sort(
-            key=lambda e: (-e.wins, -(e.game_wins - e.game_losses)),
+    async def _rank(
+        self,
+        query: GetStandingsQuery,
+        contest_format: ContestFormat,
+        standings: list[Standing],
+        completed_matches: list[Match] | None = None,
+    ) -> StandingsDTO:
+        """タイブレークを適用して順位を付ける。
+        試合一覧は、対戦結果を使うタイブレークで同率を解く必要があるときだけ読み、
+        同率のプレイヤーの試合だけを対戦結果にまとめる。
+        """
+        tiebreakers = tiebreakers_for(contest_format, query.tiebreakers)
+        results = None
+        tied = tied_players(standings, tiebreakers)
+        if tied:
+            if completed_matches is None:
+                matches = await self._match_repository.find_by_contest_id(
+                    query.contest_id
+                )
+                completed_matches = [
+                    m for m in matches if m.status == MatchStatus.COMPLETED
+                ]
+            results = MatchResults(tied, completed_matches)
+        ranked = rank_standings(standings, tiebreakers, results)
+        return StandingsDTO(
+            contest_id=query.contest_id,
+            entries=[
+                StandingsEntryDTO(
+                    player_id=r.standing.player_id,
+                    player_name=r.standing.player_name,
+                    wins=r.standing.wins,
+                    losses=r.standing.losses,
+                    matches_played=r.standing.matches_played,
+                    game_wins=r.standing.game_wins,
+                    game_losses=r.standing.game_losses,
+                    rank=r.rank,
+                    tiebreaks=r.tiebreaks,
+                )
+                for r in ranked
+            ],
         )
-        return entries
-
-    def _calculate_elimination_standings(
-        self, contest: Contest, completed_matches: list[Match]
-    ) -> list[StandingsEntryDTO]:
-        player_map = {p.player_id: p for p in contest.players}
-        stats: dict[UUID, dict[str, int]] = {
-            p.player_id: {
-                "wins": 0,
-                "losses": 0,
-                "matches_played": 0,
-                "game_wins": 0,
-                "game_losses": 0,
-            }
-            for p in contest.players
-        }
-
-        for match in completed_matches:
-            p1_id = match.player1_id
-            p2_id = match.player2_id
-
-            if p1_id not in stats and p2_id not in stats:
-                continue
-
-            if p1_id in stats:
-                stats[p1_id]["game_wins"] += match.player1_wins
-                stats[p1_id]["game_losses"] += match.player2_wins
-                stats[p1_id]["matches_played"] += 1
-
-            if p2_id in stats:
-                stats[p2_id]["game_wins"] += match.player2_wins
-                stats[p2_id]["game_losses"] += match.player1_wins
-                stats[p2_id]["matches_played"] += 1
-
-            if match.player1_wins > match.player2_wins:
-                if p1_id in stats:
-                    stats[p1_id]["wins"] += 1
-                if p2_id in stats:
-                    stats[p2_id]["losses"] += 1
-            else:
-                if p2_id in stats:
-                    stats[p2_id]["wins"] += 1
-                if p1_id in stats:
-                    stats[p1_id]["losses"] += 1
-
-        entries = [
-            StandingsEntryDTO(
-                player_id=pid,
-                player_name=player_map[pid].name,
-                wins=s["wins"],
-                losses=s["losses"],
-                matches_played=s["matches_played"],
-                game_wins=s["game_wins"],
-                game_losses=s["game_losses"],
-            )
-            for pid, s in stats.items()
-            if pid in player_map
-        ]
-
-        entries.sort(key=lambda e: (-e.wins, -e.matches_played))
-        return entries
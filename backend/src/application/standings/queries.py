@@ -1,11 +1,17 @@
 """Standings クエリ"""
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from uuid import UUID
 
+from src.domain.standings.tiebreak import Tiebreaker
+
 
 @dataclass(frozen=True)
 class GetStandingsQuery:
     contest_id: UUID
+    # handle_get_version で取得済みなら渡す（再取得しない）
+    version: int | None = None
+    # 総当たりのタイブレーク（None なら得失ゲーム差のみ）
+    tiebreakers: tuple[Tiebreaker, ...] | None = None
 
 
 @dataclass(frozen=True)
@@ -17,6 +23,8 @@ class StandingsEntryDTO:
     matches_played: int
     game_wins: int
     game_losses: int
+    rank: int = 0
+    tiebreaks: dict[str, float] = field(default_factory=dict)
 
 
 @dataclass(frozen=True)
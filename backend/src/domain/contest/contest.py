@@ -1,7 +1,7 @@
 """Contest Aggregate Root"""
 from dataclasses import dataclass, field
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from src.domain.contest.player import Player
 from src.domain.contest.value_objects import (
@@ -9,6 +9,7 @@ from src.domain.contest.value_objects import (
     ContestStatus,
     validate_status_transition,
 )
+from src.domain.shared.id_provider import new_id
 
 
 class ContestModificationError(Exception):
@@ -25,21 +26,51 @@ class Contest:
     status: ContestStatus
     created_at: datetime
     players: list[Player] = field(default_factory=list)
+    # 永続化されていないプレイヤーの増減（リポジトリが差分だけを書き込む）
+    _added_players: list[Player] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _removed_player_ids: set[UUID] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
+
+    @property
+    def added_players(self) -> list[Player]:
+        return list(self._added_players)
+
+    @property
+    def removed_player_ids(self) -> set[UUID]:
+        return set(self._removed_player_ids)
+
+    def clear_player_changes(self) -> None:
+        """保存後にリポジトリから呼ばれ、追跡中の差分を破棄する"""
+        self._added_players.clear()
+        self._removed_player_ids.clear()
 
     def add_player(self, name: str, seed: int | None) -> Player:
         self._validate_modifiable()
         player = Player(
-            player_id=uuid4(),
+            player_id=new_id(),
             contest_id=self.contest_id,
             name=name,
             seed=seed,
         )
         self.players.append(player)
+        self._added_players.append(player)
         return player
 
     def remove_player(self, player_id: UUID) -> None:
         self._validate_modifiable()
-        self.players = [p for p in self.players if p.player_id != player_id]
+        remaining = [p for p in self.players if p.player_id != player_id]
+        if len(remaining) == len(self.players):
+            return
+        self.players = remaining
+        added = [p for p in self._added_players if p.player_id != player_id]
+        if len(added) < len(self._added_players):
+            # 未保存のまま取り消された追加は書き込まない
+            self._added_players = added
+        else:
+            self._removed_player_ids.add(player_id)
 
     def transition_status(self, new_status: ContestStatus) -> None:
         validate_status_transition(self.status, new_status)
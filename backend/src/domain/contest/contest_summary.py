@@ -0,0 +1,18 @@
+"""Contest 一覧用の読み取りモデル"""
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from src.domain.contest.value_objects import ContestFormat, ContestStatus
+
+
+@dataclass(frozen=True)
+class ContestSummary:
+    contest_id: UUID
+    name: str
+    game_title_id: UUID
+    format: ContestFormat
+    best_of: int
+    status: ContestStatus
+    created_at: datetime
+    player_count: int
@@ -1,8 +1,11 @@
 """Contest リポジトリインターフェース"""
 from abc import ABC, abstractmethod
+from datetime import datetime
 from uuid import UUID
 
 from src.domain.contest.contest import Contest
+from src.domain.contest.contest_summary import ContestSummary
+from src.domain.contest.value_objects import ContestStatus
 
 
 class ContestRepository(ABC):
@@ -13,7 +16,17 @@ class ContestRepository(ABC):
     async def find_by_id(self, contest_id: UUID) -> Contest | None: ...
 
     @abstractmethod
-    async def find_all(self) -> list[Contest]: ...
+    async def find_summaries(
+        self,
+        limit: int,
+        after: tuple[datetime, UUID] | None = None,
+        status: ContestStatus | None = None,
+        game_title_id: UUID | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+    ) -> list[ContestSummary]:
+        """(created_at, contest_id) の降順で、after より後ろの limit 件を返す"""
+        ...
 
     @abstractmethod
     async def delete(self, contest_id: UUID) -> None: ...
@@ -5,6 +5,10 @@ from enum import Enum
 class ContestFormat(str, Enum):
     ROUND_ROBIN = "ROUND_ROBIN"
     SINGLE_ELIMINATION = "SINGLE_ELIMINATION"
+    DOUBLE_ELIMINATION = "DOUBLE_ELIMINATION"
+    SWISS = "SWISS"
+    # 予選リーグ（総当たりのプール）→ 各プール上位による決勝トーナメント
+    POOL_PLAY = "POOL_PLAY"
 
 
 class ContestStatus(str, Enum):
@@ -0,0 +1,123 @@
+"""配列で表したトーナメント表
+
+シングルエリミネーションの試合を、二分ヒープの並び（1 が決勝、節点 i の子は
+2i と 2i+1）の配列に置く。プレイヤーは UUID ではなく player_ids の添字で持つ。
+親・子の移動は添字の計算のみで定数時間、決勝までの経路はラウンド数（log n）の
+長さで求まる。試合の並びは勝者の進出先（next_match_id / next_match_slot）から復元する。
+"""
+from collections.abc import Sequence
+from uuid import UUID
+
+from src.domain.match.match import Match
+
+# 未定（TBD）・BYE・エントリー外のプレイヤー
+NO_PLAYER = -1
+
+
+class Bracket:
+    """size は1回戦の枠数（2のべき乗）。
+
+    - slots[1..size-1]: 節点 i の試合の勝者（未定は NO_PLAYER）
+    - slots[size..2*size-1]: 1回戦の枠に入るプレイヤー
+    - match_ids[1..size-1]: 節点 i の試合（match_ids[0] は未使用の None）
+    """
+
+    def __init__(
+        self,
+        player_ids: Sequence[UUID],
+        slots: Sequence[int],
+        match_ids: Sequence[UUID | None],
+    ) -> None:
+        self.player_ids = tuple(player_ids)
+        self.slots = tuple(slots)
+        self.match_ids = tuple(match_ids)
+        self.size = len(self.match_ids)
+        self._index = {pid: i for i, pid in enumerate(self.player_ids)}
+        self._entries = {
+            p: node
+            for node in range(self.size, 2 * self.size)
+            if (p := self.slots[node]) != NO_PLAYER
+        }
+
+    @classmethod
+    def from_matches(
+        cls, matches: Sequence[Match], player_ids: Sequence[UUID]
+    ) -> "Bracket":
+        """勝者の進出先で繋がった試合から作る。決勝を根とする完全二分木
+        （全ての1回戦の試合が揃ったブラケット）でなければ ValueError。
+        """
+        roots = [m for m in matches if m.next_match_id is None]
+        if len(roots) != 1:
+            raise ValueError(
+                f"expected a single final, found {len(roots)} unlinked matches"
+            )
+        size = 1
+        while size - 1 < len(matches):
+            size *= 2
+        if size - 1 != len(matches):
+            raise ValueError(f"{len(matches)} matches do not form a full bracket")
+
+        feeders: dict[tuple[UUID, int], Match] = {}
+        for match in matches:
+            if match.next_match_id is not None and match.next_match_slot is not None:
+                feeders[(match.next_match_id, match.next_match_slot)] = match
+
+        index = {pid: i for i, pid in enumerate(player_ids)}
+        slots = [NO_PLAYER] * (2 * size)
+        match_ids: list[UUID | None] = [None] * size
+        match_ids[1] = roots[0].match_id
+        by_node = {1: roots[0]}
+        for node in range(1, size):
+            node_match = by_node.get(node)
+            if node_match is None:
+                raise ValueError(f"bracket is missing the match at node {node}")
+            winner = node_match.winner_id
+            slots[node] = index.get(winner, NO_PLAYER) if winner else NO_PLAYER
+            for slot, player_id in (
+                (1, node_match.player1_id),
+                (2, node_match.player2_id),
+            ):
+                child = 2 * node + slot - 1
+                if child >= size:
+                    slots[child] = index.get(player_id, NO_PLAYER)
+                    continue
+                feeder = feeders.get((node_match.match_id, slot))
+                if feeder is not None:
+                    by_node[child] = feeder
+                    match_ids[child] = feeder.match_id
+        return cls(player_ids, slots, match_ids)
+
+    @property
+    def rounds(self) -> int:
+        return self.size.bit_length() - 1
+
+    @staticmethod
+    def parent(node: int) -> int:
+        """親の試合の節点。決勝（1）の親は 0"""
+        return node >> 1
+
+    def path(self, player_id: UUID) -> list[UUID]:
+        """プレイヤーが1回戦から決勝まで勝ち進む場合に戦う試合"""
+        node = self._entries.get(self._index.get(player_id, NO_PLAYER))
+        if node is None:
+            return []
+        path: list[UUID] = []
+        node = self.parent(node)
+        while node:
+            path.append(self.match_ids[node])  # type: ignore[arg-type]
+            node = self.parent(node)
+        return path
+
+    def current_match(self, player_id: UUID) -> UUID | None:
+        """プレイヤーが次に戦う（戦っている）試合。敗退済み・優勝済みなら None"""
+        player = self._index.get(player_id, NO_PLAYER)
+        node = self._entries.get(player)
+        if node is None:
+            return None
+        node = self.parent(node)
+        while node and self.slots[node] == player:
+            node = self.parent(node)
+        if not node or self.slots[node] != NO_PLAYER:
+            return None
+        return self.match_ids[node]
+
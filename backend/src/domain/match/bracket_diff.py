@@ -0,0 +1,166 @@
+"""ブラケット再生成の差分
+
+生成し直した試合を保存済みの試合と突き合わせ、挿入・更新・削除だけを求める。
+試合は (プール, 対戦する2人) で対応付け、エントリー外の ID（TBD・BYE）は区別しない。
+TBD を含む試合は同じ組が複数あるため、ラウンドと勝者側・敗者側の別も合わせ、
+対応付いた進出元の保存済みのリンク先を優先して割り当てる（無ければ保存順）。
+ダブルエリミネーションでは両側の試合が同じラウンドに並ぶ。
+
+完了済みの試合は結果を引き継ぎ、勝者・敗者を生成し直した進出先に入れてから
+後続の試合を対応付ける。進行中のトーナメントでも記録済みの勝ち上がりが残る。
+対応する試合のない完了済みの試合は削除せず、無くなった試合へのリンクのみ外す。
+"""
+from collections import Counter, deque
+from collections.abc import Iterable, Set
+from dataclasses import dataclass, replace
+from uuid import UUID
+
+from src.domain.match.bracket_generator import TBD_PLAYER_ID
+from src.domain.match.match import Match
+from src.domain.match.value_objects import MatchStatus
+
+_Key = tuple[int | None, frozenset[UUID], tuple[int | None, bool] | None]
+
+
+@dataclass(frozen=True)
+class BracketDiff:
+    # 再生成後のブラケットの全試合（生成順、ID は保存済みのものを引き継ぐ）
+    matches: list[Match]
+    inserts: list[Match]
+    updates: list[Match]
+    deletes: list[UUID]
+
+
+def diff_bracket(
+    generated: Iterable[Match], stored: Iterable[Match], entrants: Set[UUID]
+) -> BracketDiff:
+    matches = list(generated)
+    by_id = {m.match_id: m for m in matches}
+
+    # キーごとに保存順に並べる（dict は挿入順を保ち、ID 指定でも取り出せる）
+    candidates: dict[_Key, dict[UUID, Match]] = {}
+    for match in sorted(stored, key=lambda m: (m.round or 0, m.match_order)):
+        candidates.setdefault(_key(match, entrants), {})[match.match_id] = match
+
+    # 進出元がすべて対応付いた試合から順に処理する（勝ち上がりで組が決まるため）
+    feeders: Counter[UUID] = Counter(
+        target
+        for m in matches
+        for target in (m.next_match_id, m.loser_next_match_id)
+        if target in by_id
+    )
+    ready = deque(m for m in matches if not feeders[m.match_id])
+    ids: dict[UUID, UUID] = {}
+    originals: dict[UUID, Match] = {}
+    # 生成した試合 → 対応付いた進出元の保存済みのリンク先
+    hints: dict[UUID, list[UUID]] = {}
+    while ready:
+        match = ready.popleft()
+        found = candidates.get(_key(match, entrants))
+        original: Match | None = None
+        if found:
+            hinted = (h for h in hints.get(match.match_id, ()) if h in found)
+            original = found.pop(next(hinted, next(iter(found))))
+            _carry_result(match, original, entrants)
+            ids[match.match_id] = original.match_id
+            originals[original.match_id] = original
+        for target, slot, player_id, stored_target in (
+            (
+                match.next_match_id,
+                match.next_match_slot,
+                match.winner_id,
+                original.next_match_id if original else None,
+            ),
+            (
+                match.loser_next_match_id,
+                match.loser_next_match_slot,
+                match.loser_id,
+                original.loser_next_match_id if original else None,
+            ),
+        ):
+            if target not in by_id:
+                continue
+            if player_id is not None:
+                _place(by_id[target], slot, player_id)
+            if stored_target is not None:
+                hints.setdefault(target, []).append(stored_target)
+            feeders[target] -= 1
+            if not feeders[target]:
+                ready.append(by_id[target])
+
+    inserts: list[Match] = []
+    updates: list[Match] = []
+    for match in matches:
+        match.match_id = ids.get(match.match_id, match.match_id)
+        if match.next_match_id is not None:
+            match.next_match_id = ids.get(match.next_match_id, match.next_match_id)
+        if match.loser_next_match_id is not None:
+            match.loser_next_match_id = ids.get(
+                match.loser_next_match_id, match.loser_next_match_id
+            )
+        stored_match = originals.get(match.match_id)
+        if stored_match is None:
+            inserts.append(match)
+        elif match != stored_match:
+            updates.append(match)
+
+    kept = {m.match_id for m in matches}
+    deletes: list[UUID] = []
+    for leftover in (m for found in candidates.values() for m in found.values()):
+        if leftover.status != MatchStatus.COMPLETED:
+            deletes.append(leftover.match_id)
+            continue
+        unlinked = leftover
+        if leftover.next_match_id not in kept:
+            unlinked = replace(unlinked, next_match_id=None, next_match_slot=None)
+        if leftover.loser_next_match_id not in kept:
+            unlinked = replace(
+                unlinked, loser_next_match_id=None, loser_next_match_slot=None
+            )
+        if unlinked != leftover:
+            updates.append(unlinked)
+
+    return BracketDiff(
+        matches=matches, inserts=inserts, updates=updates, deletes=deletes
+    )
+
+
+def _key(match: Match, entrants: Set[UUID]) -> _Key:
+    players = frozenset(
+        _normalize(p, entrants) for p in (match.player1_id, match.player2_id)
+    )
+    if TBD_PLAYER_ID not in players:
+        return match.pool, players, None
+    # 敗者の落ちる先があるのは勝者側の試合
+    return match.pool, players, (match.round, match.loser_next_match_id is not None)
+
+
+def _carry_result(match: Match, original: Match, entrants: Set[UUID]) -> None:
+    """保存済みの試合の結果を、生成し直した試合の向き（player1/player2）で写す"""
+    first = (original.player1_id, original.player1_character, original.player1_wins)
+    second = (original.player2_id, original.player2_character, original.player2_wins)
+    if _normalize(match.player1_id, entrants) != _normalize(
+        original.player1_id, entrants
+    ):
+        first, second = second, first
+    player1_id, match.player1_character, match.player1_wins = first
+    player2_id, match.player2_character, match.player2_wins = second
+    # BYE の相手など、エントリー外の ID は保存済みのものを使う
+    if match.player1_id not in entrants:
+        match.player1_id = player1_id
+    if match.player2_id not in entrants:
+        match.player2_id = player2_id
+    match.comment = original.comment
+    match.status = original.status
+    match.station = original.station
+
+
+def _normalize(player_id: UUID, entrants: Set[UUID]) -> UUID:
+    return player_id if player_id in entrants else TBD_PLAYER_ID
+
+
+def _place(match: Match, slot: int | None, player_id: UUID) -> None:
+    if slot == 1:
+        match.player1_id = player_id
+    else:
+        match.player2_id = player_id
@@ -1,39 +1,110 @@
 """ブラケット生成ドメインサービス"""
-from itertools import combinations
-from uuid import UUID, uuid4
+from collections.abc import Iterator
+from dataclasses import replace
+from uuid import UUID
 
 from src.domain.contest.contest import Contest
 from src.domain.contest.player import Player
+from src.domain.contest.value_objects import ContestFormat
 from src.domain.match.match import Match
+from src.domain.match.pools import (
+    pool_contest,
+    pool_placings,
+    seed_top_cut,
+    split_into_pools,
+)
+from src.domain.match.seeding import seed_slots
+from src.domain.match.swiss import SwissHistory, pair_round
 from src.domain.match.value_objects import MatchStatus
+from src.domain.shared.id_provider import new_id
 
 # TBD（試合結果待ち）プレイヤーのセンチネルUUID
 TBD_PLAYER_ID = UUID("00000000-0000-0000-0000-000000000000")
 
+# ダブルエリミネーションの枠の入力元。
+# 確定済みプレイヤー / (配列上の番号, 勝者なら True) / 空き（BYE）
+_Source = UUID | tuple[int, bool] | None
+
 
 class BracketGenerator:
     def generate_round_robin(self, contest: Contest) -> list[Match]:
         """全プレイヤー総当たりの試合を生成する"""
-        players = contest.players
-        matches: list[Match] = []
+        return list(self.iter_round_robin(contest))
 
-        for order, (p1, p2) in enumerate(combinations(players, 2), start=1):
-            match = Match(
-                match_id=uuid4(),
-                contest_id=contest.contest_id,
-                player1_id=p1.player_id,
-                player2_id=p2.player_id,
-                player1_character=None,
-                player2_character=None,
-                player1_wins=0,
-                player2_wins=0,
-                comment=None,
-                status=MatchStatus.PENDING,
-                round=None,
-                match_order=order,
-            )
-            matches.append(match)
+    def iter_round_robin(self, contest: Contest) -> Iterator[Match]:
+        """総当たりの試合をラウンド順に1件ずつ生成する。
+        サークル方式（Berger 表）で各ラウンドに割り当てるため、
+        同じラウンド内で同じプレイヤーが2試合に入ることはない。
+        人数が奇数の場合は各ラウンドで1人が不戦（試合を作らない）となる。
+        N 人で N(N-1)/2 試合になるため、呼び出し側で分割して保存すれば
+        全試合をメモリに載せずに済む。
+        """
+        slots: list[Player | None] = list(contest.players)
+        if len(slots) % 2 == 1:
+            slots.append(None)
+        n = len(slots)
+        if n < 2:
+            return
 
+        fixed, rotating = slots[0], slots[1:]
+        order = 1
+        for round_num in range(1, n):
+            arrangement = [fixed, *rotating]
+            for i in range(n // 2):
+                p1, p2 = arrangement[i], arrangement[n - 1 - i]
+                # 固定位置のプレイヤーが毎ラウンド同じ側にならないよう入れ替える
+                if i == 0 and round_num % 2 == 0:
+                    p1, p2 = p2, p1
+                if p1 is None or p2 is None:
+                    continue
+                yield Match(
+                    match_id=new_id(),
+                    contest_id=contest.contest_id,
+                    player1_id=p1.player_id,
+                    player2_id=p2.player_id,
+                    player1_character=None,
+                    player2_character=None,
+                    player1_wins=0,
+                    player2_wins=0,
+                    comment=None,
+                    status=MatchStatus.PENDING,
+                    round=round_num,
+                    match_order=order,
+                )
+                order += 1
+            rotating = [rotating[-1], *rotating[:-1]]
+
+    def iter_pools(self, contest: Contest, pool_size: int) -> Iterator[Match]:
+        """予選リーグの全プールの総当たりを1件ずつ生成する。
+        各プールにサークル方式でラウンドを割り当てるため、(round, match_order) 順に
+        並べると同じラウンドの試合が全プールで並行に実施できる。
+        """
+        order = 0
+        for index, players in enumerate(split_into_pools(contest.players, pool_size)):
+            for match in self.iter_round_robin(pool_contest(contest, players)):
+                order += 1
+                match.pool = index
+                match.match_order = order
+                yield match
+
+    def generate_top_cut(
+        self, contest: Contest, pool_matches: list[Match], advance_per_pool: int
+    ) -> list[Match]:
+        """各プールの上位 advance_per_pool 人でシングルエリミネーションを生成する。
+        ラウンド・試合順は予選リーグの続きから振る。
+        """
+        placings = pool_placings(contest, pool_matches)
+        seeded = seed_top_cut(contest, placings, advance_per_pool)
+        bracket = replace(
+            contest, format=ContestFormat.SINGLE_ELIMINATION, players=seeded
+        )
+        matches = self.generate_single_elimination(bracket)
+
+        round_offset = max((m.round or 0 for m in pool_matches), default=0)
+        order_offset = max((m.match_order for m in pool_matches), default=0)
+        for match in matches:
+            match.round = (match.round or 0) + round_offset
+            match.match_order += order_offset
         return matches
 
     def generate_single_elimination(self, contest: Contest) -> list[Match]:
@@ -50,6 +121,8 @@ class BracketGenerator:
 
         # 第1ラウンド: スロットからペアを生成
         round1_winners: list[UUID | None] = []
+        # 勝者スロットごとの試合（次ラウンドの試合から進出先を張る）
+        round1_matches: list[Match | None] = []
 
         for i in range(0, size, 2):
             p1 = slots[i]
@@ -57,13 +130,14 @@ class BracketGenerator:
 
             if p1 is None and p2 is None:
                 round1_winners.append(None)
+                round1_matches.append(None)
                 continue
 
             if p1 is None or p2 is None:
                 # BYE試合
                 real_player = p1 if p1 is not None else p2
                 real_id = real_player.player_id  # type: ignore[union-attr]
-                bye_id = uuid4()
+                bye_id = new_id()
 
                 p1_id = real_id if p1 is not None else bye_id
                 p2_id = bye_id if p1 is not None else real_id
@@ -71,7 +145,7 @@ class BracketGenerator:
                 p2_wins = 0 if p1 is not None else 1
 
                 match = Match(
-                    match_id=uuid4(),
+                    match_id=new_id(),
                     contest_id=contest.contest_id,
                     player1_id=p1_id,
                     player2_id=p2_id,
@@ -86,9 +160,10 @@ class BracketGenerator:
                 )
                 all_matches.append(match)
                 round1_winners.append(real_id)
+                round1_matches.append(match)
             else:
                 match = Match(
-                    match_id=uuid4(),
+                    match_id=new_id(),
                     contest_id=contest.contest_id,
                     player1_id=p1.player_id,
                     player2_id=p2.player_id,
@@ -103,15 +178,18 @@ class BracketGenerator:
                 )
                 all_matches.append(match)
                 round1_winners.append(None)  # 勝者未定
+                round1_matches.append(match)
 
             match_order += 1
 
         # 以降のラウンド: 全てTBD_PLAYER_IDまたは既知勝者でプレースホルダーを生成
         current_winner_slots = round1_winners
+        current_matches = round1_matches
         round_num += 1
 
         while len(current_winner_slots) > 1:
             next_winner_slots: list[UUID | None] = []
+            next_matches: list[Match | None] = []
 
             for i in range(0, len(current_winner_slots), 2):
                 w1 = current_winner_slots[i]
@@ -122,10 +200,10 @@ class BracketGenerator:
 
                 # p1_idとp2_idが同じ場合（どちらもTBD）は別のTBD UUIDを割り当て
                 if p1_id == p2_id:
-                    p2_id = uuid4()
+                    p2_id = new_id()
 
                 match = Match(
-                    match_id=uuid4(),
+                    match_id=new_id(),
                     contest_id=contest.contest_id,
                     player1_id=p1_id,
                     player2_id=p2_id,
@@ -140,13 +218,205 @@ class BracketGenerator:
                 )
                 all_matches.append(match)
                 next_winner_slots.append(None)
+                next_matches.append(match)
                 match_order += 1
 
+                # 前ラウンドの2試合の勝者がこの試合の player1 / player2 に入る
+                for slot, feeder in enumerate(current_matches[i : i + 2], start=1):
+                    if feeder is not None:
+                        feeder.next_match_id = match.match_id
+                        feeder.next_match_slot = slot
+
             current_winner_slots = next_winner_slots
+            current_matches = next_matches
             round_num += 1
 
         return all_matches
 
+    def generate_double_elimination(
+        self, contest: Contest, grand_final_reset: bool = True
+    ) -> list[Match]:
+        """ダブルエリミネーションのブラケットを生成する。
+        round は試合を行える順で、(round, match_order) 順に並べれば進行順になる。
+        勝者側の第 r ラウンドは r、敗者側の第 j ラウンドは j+1（勝者側の同時期の
+        ラウンドと同じ番号）、グランドファイナルは 2k、リセット戦は 2k+1。
+        各試合の勝者・敗者の進出先は生成時に張るため、結果の反映は試合ごとに定数時間。
+        BYE は試合を作らず、相手をそのまま次の枠へ送る。
+        リセット戦は、グランドファイナルで敗者側の勝者が勝った場合のみ実施する。
+        """
+        size = max(self._next_power_of_two(len(contest.players)), 2)
+        slots = self._arrange_seeds(contest.players, size)
+        depth = size.bit_length() - 1
+
+        # 試合の候補を配列に積む。入力元は配列上の番号で参照する
+        sources: list[tuple[_Source, _Source]] = []
+        rounds: list[int] = []
+
+        def add(round_num: int, a: _Source, b: _Source) -> int:
+            sources.append((a, b))
+            rounds.append(round_num)
+            return len(sources) - 1
+
+        seeded: list[_Source] = [p.player_id if p is not None else None for p in slots]
+        winners = [[add(1, seeded[i], seeded[i + 1]) for i in range(0, size, 2)]]
+        for round_num in range(2, depth + 1):
+            prev = winners[-1]
+            winners.append(
+                [
+                    add(round_num, (prev[i], True), (prev[i + 1], True))
+                    for i in range(0, len(prev), 2)
+                ]
+            )
+
+        losers: list[int] = []
+        if depth >= 2:
+            first = winners[0]
+            losers_round = 2
+            losers = [
+                add(losers_round, (first[i], False), (first[i + 1], False))
+                for i in range(0, len(first), 2)
+            ]
+            for round_num in range(2, depth + 1):
+                # 勝者側で当たった相手と早々に再戦しないよう、1つおきに落ちる順を反転
+                dropped = winners[round_num - 1]
+                if round_num % 2 == 0:
+                    dropped = dropped[::-1]
+                losers_round += 1
+                losers = [
+                    add(losers_round, (losers[i], True), (dropped[i], False))
+                    for i in range(len(losers))
+                ]
+                if len(losers) > 1:
+                    losers_round += 1
+                    losers = [
+                        add(losers_round, (losers[i], True), (losers[i + 1], True))
+                        for i in range(0, len(losers), 2)
+                    ]
+
+        champion = winners[-1][0]
+        grand_final = add(
+            2 * depth,
+            (champion, True),
+            (losers[0], True) if losers else (champion, False),
+        )
+        if grand_final_reset:
+            add(2 * depth + 1, (grand_final, True), (grand_final, False))
+
+        return self._build_linked_matches(contest, sources, rounds)
+
+    def generate_swiss_round(
+        self, contest: Contest, previous_matches: list[Match]
+    ) -> list[Match]:
+        """スイス式の次のラウンドを生成する（previous_matches が空なら第1ラウンド）。
+        不戦勝はシングルエリミネーションの BYE と同じく完了済みの試合として作る。
+        """
+        seeded = sorted(contest.players, key=lambda p: (p.seed is None, p.seed or 0))
+        history = SwissHistory.from_matches(
+            (p.player_id for p in seeded),
+            (m for m in previous_matches if m.status == MatchStatus.COMPLETED),
+        )
+        pairing = pair_round([p.player_id for p in seeded], history)
+        round_num = max((m.round or 0 for m in previous_matches), default=0) + 1
+        order = max((m.match_order for m in previous_matches), default=0)
+
+        matches: list[Match] = []
+        for p1_id, p2_id in pairing.pairs:
+            order += 1
+            matches.append(
+                Match(
+                    match_id=new_id(),
+                    contest_id=contest.contest_id,
+                    player1_id=p1_id,
+                    player2_id=p2_id,
+                    player1_character=None,
+                    player2_character=None,
+                    player1_wins=0,
+                    player2_wins=0,
+                    comment=None,
+                    status=MatchStatus.PENDING,
+                    round=round_num,
+                    match_order=order,
+                )
+            )
+        if pairing.bye is not None:
+            matches.append(
+                Match(
+                    match_id=new_id(),
+                    contest_id=contest.contest_id,
+                    player1_id=pairing.bye,
+                    player2_id=new_id(),
+                    player1_character=None,
+                    player2_character=None,
+                    player1_wins=1,
+                    player2_wins=0,
+                    comment="BYE",
+                    status=MatchStatus.COMPLETED,
+                    round=round_num,
+                    match_order=order + 1,
+                )
+            )
+        return matches
+
+    def _build_linked_matches(
+        self,
+        contest: Contest,
+        sources: list[tuple[_Source, _Source]],
+        rounds: list[int],
+    ) -> list[Match]:
+        """候補を先頭から解決して試合を作り、進出先を張る。
+        片側が空きの候補は試合を作らず、もう片側をそのまま出力とする。
+        """
+        matches: list[Match] = []
+        # 候補ごとの勝者・敗者の出力（作成した試合は matches 上の番号で表す）
+        winner_out: list[_Source] = []
+        loser_out: list[_Source] = []
+
+        def resolve(source: _Source) -> _Source:
+            if isinstance(source, tuple):
+                index, winner = source
+                return winner_out[index] if winner else loser_out[index]
+            return source
+
+        for (a, b), round_num in zip(sources, rounds):
+            a, b = resolve(a), resolve(b)
+            if a is None or b is None:
+                winner_out.append(a if b is None else b)
+                loser_out.append(None)
+                continue
+
+            p1_id = a if isinstance(a, UUID) else TBD_PLAYER_ID
+            p2_id = b if isinstance(b, UUID) else TBD_PLAYER_ID
+            if p1_id == p2_id:
+                p2_id = new_id()
+            match = Match(
+                match_id=new_id(),
+                contest_id=contest.contest_id,
+                player1_id=p1_id,
+                player2_id=p2_id,
+                player1_character=None,
+                player2_character=None,
+                player1_wins=0,
+                player2_wins=0,
+                comment=None,
+                status=MatchStatus.PENDING,
+                round=round_num,
+                match_order=len(matches) + 1,
+            )
+            for slot, source in enumerate((a, b), start=1):
+                if isinstance(source, tuple):
+                    feeder = matches[source[0]]
+                    if source[1]:
+                        feeder.next_match_id = match.match_id
+                        feeder.next_match_slot = slot
+                    else:
+                        feeder.loser_next_match_id = match.match_id
+                        feeder.loser_next_match_slot = slot
+            winner_out.append((len(matches), True))
+            loser_out.append((len(matches), False))
+            matches.append(match)
+
+        return matches
+
     def _next_power_of_two(self, n: int) -> int:
         power = 1
         while power < n:
@@ -158,34 +428,17 @@ class BracketGenerator:
     ) -> list[Player | None]:
         """シード順に従ってブラケットスロットを配置する。
         BYEはNoneで表現する。
-        シード1と2を反対側のブラケットに配置する。
+        配置は標準シード表（1v16, 8v9, …）に従い、枠数ごとに共有の表を引く。
         """
         seeded = sorted(
             players, key=lambda p: (p.seed is None, p.seed or 0)
         )
 
         slots: list[Player | None] = [None] * size
-        bracket_positions = self._get_bracket_positions(size)
+        bracket_positions = seed_slots(size)
 
         for i, player in enumerate(seeded):
             if i < len(bracket_positions):
                 slots[bracket_positions[i]] = player
 
         return slots
-
-    def _get_bracket_positions(self, size: int) -> list[int]:
-        """標準的なシードブラケット配置のポジションリストを返す"""
-        if size == 1:
-            return [0]
-
-        positions = [0, size - 1]
-        step = size // 2
-        while step > 1:
-            new_positions = []
-            for pos in positions:
-                new_positions.append(pos)
-                new_positions.append(pos + step if pos + step < size else pos - step)
-            positions = new_positions[:size]
-            step //= 2
-
-        return positions
@@ -19,11 +19,37 @@ class Match:
     status: MatchStatus
     round: int | None
     match_order: int
+    # 勝者が進む試合と枠（1: player1, 2: player2）。トーナメントのみ
+    next_match_id: UUID | None = None
+    next_match_slot: int | None = None
+    # 敗者が落ちる試合と枠。ダブルエリミネーションの勝者側のみ
+    loser_next_match_id: UUID | None = None
+    loser_next_match_slot: int | None = None
+    # 予選リーグのプール番号（0 始まり）。決勝トーナメントの試合は None
+    pool: int | None = None
+    # 対戦中の台の番号（1 始まり）。呼び出し前と完了後は None
+    station: int | None = None
 
     def __post_init__(self) -> None:
         if self.player1_id == self.player2_id:
             raise ValueError("player1_id and player2_id must be different")
 
+    @property
+    def winner_id(self) -> UUID | None:
+        if self.status != MatchStatus.COMPLETED:
+            return None
+        if self.player1_wins > self.player2_wins:
+            return self.player1_id
+        return self.player2_id
+
+    @property
+    def loser_id(self) -> UUID | None:
+        if self.status != MatchStatus.COMPLETED:
+            return None
+        if self.player1_wins > self.player2_wins:
+            return self.player2_id
+        return self.player1_id
+
     def record_result(
         self,
         p1_character: str | None,
@@ -47,3 +73,5 @@ class Match:
         self.player2_wins = p2_wins
         self.comment = comment
         self.status = MatchStatus.COMPLETED
+        # 結果が出たら台は空く
+        self.station = None
@@ -0,0 +1,85 @@
+"""予選リーグ（プール）から決勝トーナメントへの振り分け
+
+プールどうしは独立しているため、組み合わせの生成も順位付けもプールごとに
+別々に計算し、結果を1回の一括書き込み・1回の決勝トーナメント生成にまとめる。
+"""
+from dataclasses import replace
+from uuid import UUID
+
+from src.domain.contest.contest import Contest
+from src.domain.contest.player import Player
+from src.domain.contest.value_objects import ContestFormat
+from src.domain.match.match import Match
+from src.domain.match.value_objects import MatchStatus
+from src.domain.standings.engine import PythonStandingsEngine
+from src.domain.standings.tiebreak import (
+    MatchResults,
+    Tiebreaker,
+    rank_standings,
+    tied_players,
+)
+
+# プール内の順位付け（勝数 → 直接対決 → 得失ゲーム差）
+POOL_TIEBREAKERS = (Tiebreaker.HEAD_TO_HEAD, Tiebreaker.GAME_DIFFERENCE)
+
+
+def split_into_pools(players: list[Player], pool_size: int) -> list[list[Player]]:
+    """シード順に蛇行（1→N, N→1）で割り振り、各プールの強さを揃える。
+    各プールは2人以上になるよう、プール数を人数の半分までに抑える。
+    """
+    if pool_size < 2:
+        raise ValueError(f"pool_size must be at least 2, got {pool_size}")
+    seeded = sorted(players, key=lambda p: (p.seed is None, p.seed or 0))
+    count = max(1, min(-(-len(seeded) // pool_size), len(seeded) // 2))
+    pools: list[list[Player]] = [[] for _ in range(count)]
+    for i, player in enumerate(seeded):
+        row, col = divmod(i, count)
+        pools[col if row % 2 == 0 else count - 1 - col].append(player)
+    return pools
+
+
+def pool_contest(contest: Contest, players: list[Player]) -> Contest:
+    """1つのプールを総当たりのコンテストとして扱うための写し"""
+    return replace(contest, format=ContestFormat.ROUND_ROBIN, players=players)
+
+
+def pool_placings(contest: Contest, matches: list[Match]) -> list[list[UUID]]:
+    """プールごとの順位（プール番号順）。プールの顔ぶれは試合の pool 列から復元する"""
+    members: dict[int, dict[UUID, None]] = {}
+    for match in matches:
+        if match.pool is not None:
+            pool = members.setdefault(match.pool, {})
+            pool.setdefault(match.player1_id)
+            pool.setdefault(match.player2_id)
+    players = {p.player_id: p for p in contest.players}
+
+    placings: list[list[UUID]] = []
+    engine = PythonStandingsEngine()
+    for pool_index in sorted(members):
+        pool_players = [players[pid] for pid in members[pool_index] if pid in players]
+        completed = [
+            m
+            for m in matches
+            if m.pool == pool_index and m.status == MatchStatus.COMPLETED
+        ]
+        standings = engine.compute(pool_contest(contest, pool_players), completed)
+        results = MatchResults(tied_players(standings, POOL_TIEBREAKERS), completed)
+        ranked = rank_standings(standings, POOL_TIEBREAKERS, results)
+        placings.append([r.standing.player_id for r in ranked])
+    return placings
+
+
+def seed_top_cut(
+    contest: Contest, placings: list[list[UUID]], advance_per_pool: int
+) -> list[Player]:
+    """各プールの上位 advance_per_pool 人に、プール1位 → 2位 … の順でシードを振る。
+    同じ順位の中ではプール番号順（プール自体がシード順に強さを揃えてある）。
+    """
+    players = {p.player_id: p for p in contest.players}
+    seeded: list[Player] = []
+    for place in range(advance_per_pool):
+        for placing in placings:
+            if place < len(placing):
+                player = players[placing[place]]
+                seeded.append(replace(player, seed=len(seeded) + 1))
+    return seeded
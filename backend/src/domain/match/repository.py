@@ -1,8 +1,11 @@
 """Match リポジトリインターフェース"""
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from uuid import UUID
 
+from src.domain.match.bracket_diff import BracketDiff
 from src.domain.match.match import Match
+from src.domain.match.value_objects import MatchStatus
 
 
 class MatchRepository(ABC):
@@ -10,13 +13,97 @@ class MatchRepository(ABC):
     async def save(self, match: Match) -> None: ...
 
     @abstractmethod
-    async def save_all(self, matches: list[Match]) -> None: ...
+    async def save_all(self, matches: list[Match]) -> None:
+        """一括保存する。分割して呼べるよう版数は進めず、
+        呼び出し側が書き込みの最後に bump_version を1回呼ぶ
+        """
+        ...
+
+    @abstractmethod
+    async def bump_version(self, contest_id: UUID) -> None:
+        """コンテストの版数を1つ進める"""
+        ...
+
+    @abstractmethod
+    async def lock_contest(self, contest_id: UUID) -> None:
+        """コンテスト行をトランザクションの終わりまでロックし、
+        同じコンテストへの書き込みを直列にする
+        """
+        ...
+
+    @abstractmethod
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """トランザクションのコミットが成功したときに1度だけ callback を呼ぶ。
+        ロールバックされた場合は呼ばない
+        """
+        ...
+
+    @abstractmethod
+    async def apply_diff(self, contest_id: UUID, diff: BracketDiff) -> None:
+        """再生成の差分（削除・更新・挿入）を書き込み、版数を1回だけ進める"""
+        ...
 
     @abstractmethod
     async def find_by_id(self, match_id: UUID) -> Match | None: ...
 
+    @abstractmethod
+    async def find_for_result(
+        self, contest_id: UUID, match_id: UUID
+    ) -> tuple[int, Match | None, bool] | None:
+        """結果記録に必要なコンテストの best_of・試合・試合の2人がともにコンテストの
+        プレイヤーか（TBD・BYE でないか）を1回の問い合わせで返す。
+        コンテストがなければ None、試合が存在しないか別コンテストのものなら
+        試合を None として返す。
+        """
+        ...
+
+    @abstractmethod
+    async def update_result(self, match: Match) -> None:
+        """Match.record_result で変化する列のみを更新する"""
+        ...
+
+    @abstractmethod
+    async def advance_player(
+        self, next_match_id: UUID, slot: int, player_id: UUID
+    ) -> bool:
+        """勝者（または敗者）を次の試合の枠に入れる。
+        次の試合が完了済みなら更新せず False を返す。
+        """
+        ...
+
+    @abstractmethod
+    async def set_players(
+        self,
+        match_id: UUID,
+        player1_id: UUID,
+        player2_id: UUID,
+        status: MatchStatus,
+    ) -> bool:
+        """結果が記録されていない（両者0勝の）試合の2人と状態を置き換え、台を外す。
+        実施しない試合を完了扱いにする・完了扱いから戻すのに使う。
+        結果が記録済みなら更新せず False を返す。
+        """
+        ...
+
+    @abstractmethod
+    async def assign_station(
+        self, contest_id: UUID, match_id: UUID, station: int
+    ) -> bool:
+        """未完了で台のない試合に台を割り当てる。試合が完了済み・割り当て済み、
+        台が使用中、またはどちらかのプレイヤーが別の台で対戦中なら更新せず False を返す。
+        同じコンテストの割り当ては直列に行い、別のワーカーの割り当てとも重ならない。
+        """
+        ...
+
+    @abstractmethod
+    async def find_version(self, contest_id: UUID) -> int | None:
+        """試合の書き込みごとに進むコンテストの版数。コンテストがなければ None"""
+        ...
+
     @abstractmethod
     async def find_by_contest_id(self, contest_id: UUID) -> list[Match]: ...
 
     @abstractmethod
-    async def delete(self, match_id: UUID) -> None: ...
+    async def delete(self, match_id: UUID) -> None:
+        """試合を削除し、この試合を進出先とするリンクを同じトランザクションで外す"""
+        ...
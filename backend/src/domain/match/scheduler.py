@@ -0,0 +1,117 @@
+"""試合の台（ステーション）への割り当て
+
+呼び出せる試合（2人とも確定し、どちらも他の台で対戦中でない未完了の試合）を
+優先度付きキューに積み、空いている台へ1試合ずつ割り当てる。
+後に続く試合の連なり（クリティカルパス）が長い試合ほど後のラウンドを待たせるため、
+先に呼ぶ。連なりの長さは次の大きい方とし、同じ長さなら match_order 順。
+
+- 進出先のリンクを辿った、最後の試合までの未完了の試合数
+- 各プレイヤーに残っている未完了の試合数（同じプレイヤーの試合は同時に進められない）
+
+キューは試合結果が記録されるまで（版数が変わるまで）使い回し、
+1回の割り当ては取り出し1回分の O(log n) で済む。キューを共有する呼び出し元は
+peek で候補を得て、台の書き込みが成功してから confirm でキューに反映する。
+"""
+import heapq
+from collections import Counter
+from collections.abc import Iterable, Set
+from dataclasses import dataclass, replace
+from uuid import UUID
+
+from src.domain.match.match import Match
+from src.domain.match.value_objects import MatchStatus
+
+
+@dataclass(frozen=True)
+class StationAssignment:
+    # station を割り当てた後の試合
+    match: Match
+    station: int
+
+
+class StationScheduler:
+    def __init__(
+        self, matches: Iterable[Match], stations: int, entrants: Set[UUID]
+    ) -> None:
+        if stations < 1:
+            raise ValueError(f"stations must be at least 1, got {stations}")
+        pending = {
+            m.match_id: m for m in matches if m.status != MatchStatus.COMPLETED
+        }
+        remaining = Counter(
+            p for m in pending.values() for p in (m.player1_id, m.player2_id)
+        )
+        playing = [m for m in pending.values() if m.station is not None]
+        self._busy = {p for m in playing for p in (m.player1_id, m.player2_id)}
+        occupied = {m.station for m in playing}
+        # 昇順のリストはそのままヒープとして使える
+        self._free = [s for s in range(1, stations + 1) if s not in occupied]
+
+        chains: dict[UUID, int] = {}
+        self._queue = [
+            (
+                -max(
+                    _chain(m, pending, chains),
+                    remaining[m.player1_id],
+                    remaining[m.player2_id],
+                ),
+                m.match_order,
+                m.match_id.bytes,
+                m,
+            )
+            for m in pending.values()
+            if m.station is None
+            and m.player1_id in entrants
+            and m.player2_id in entrants
+        ]
+        heapq.heapify(self._queue)
+
+    def peek(self) -> StationAssignment | None:
+        """次に呼ぶ試合と台。空いている台か呼べる試合がなければ None。
+        confirm するまで同じ割り当てを返す。
+        """
+        if not self._free:
+            return None
+        while self._queue:
+            match = self._queue[0][-1]
+            if match.player1_id in self._busy or match.player2_id in self._busy:
+                # 対戦中のプレイヤーの試合は、結果の記録後に組み直したキューで呼ぶ
+                heapq.heappop(self._queue)
+                continue
+            station = self._free[0]
+            return StationAssignment(replace(match, station=station), station)
+        return None
+
+    def confirm(self, assignment: StationAssignment) -> None:
+        """割り当てを反映する。2人を対戦中にするため、試合は次の peek で取り除かれる"""
+        match = assignment.match
+        self._busy.update((match.player1_id, match.player2_id))
+        if self._free and self._free[0] == assignment.station:
+            heapq.heappop(self._free)
+        elif assignment.station in self._free:
+            self._free.remove(assignment.station)
+            heapq.heapify(self._free)
+
+    def next_assignment(self) -> StationAssignment | None:
+        """peek した割り当てをそのまま反映して返す（書き込みを伴わない呼び出し元向け）"""
+        assignment = self.peek()
+        if assignment is not None:
+            self.confirm(assignment)
+        return assignment
+
+
+def _chain(match: Match, pending: dict[UUID, Match], chains: dict[UUID, int]) -> int:
+    """match から進出先を辿った未完了の試合数（match 自身を含む）"""
+    cached = chains.get(match.match_id)
+    if cached is not None:
+        return cached
+    length = 1 + max(
+        (
+            _chain(pending[target], pending, chains)
+            for target in (match.next_match_id, match.loser_next_match_id)
+            if target in pending
+        ),
+        default=0,
+    )
+    chains[match.match_id] = length
+    return length
@@ -0,0 +1,36 @@
+"""標準シード配置表
+
+2のべき乗の枠数ごとに、各枠に入るシード（1v16, 8v9, …）と、
+シードから枠への逆引きを1度だけ計算してプロセス内で共有する。
+"""
+from functools import cache
+
+MAX_BRACKET_SIZE = 2**16
+
+
+@cache
+def seed_order(size: int) -> tuple[int, ...]:
+    """枠番号 → シード（1 始まり）。隣り合う2枠が1回戦の組になる"""
+    _validate(size)
+    order = [1]
+    while len(order) < size:
+        # 各シードを、次の段で当たる相手（合計が 2n+1 になるシード）と並べる
+        total = 2 * len(order) + 1
+        order = [s for seed in order for s in (seed, total - seed)]
+    return tuple(order)
+
+
+@cache
+def seed_slots(size: int) -> tuple[int, ...]:
+    """シード（0 始まりの添字）→ 枠番号。seed_order の逆引き"""
+    slots = [0] * size
+    for slot, seed in enumerate(seed_order(size)):
+        slots[seed - 1] = slot
+    return tuple(slots)
+
+
+def _validate(size: int) -> None:
+    if size < 1 or size > MAX_BRACKET_SIZE or size & (size - 1):
+        raise ValueError(
+            f"bracket size must be a power of two up to {MAX_BRACKET_SIZE}, got {size}"
+        )
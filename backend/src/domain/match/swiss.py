@@ -0,0 +1,134 @@
+"""スイス式の組み合わせ
+
+勝数の並び（同勝数グループ）ごとに上位半分と下位半分を当てる（ダッチ方式）。
+再戦になる場合は下位半分の次の候補に回し、組めなかったプレイヤーは
+次のグループへ繰り下げる。最後に残った組が再戦なら、既に組んだ組と相手を
+入れ替えて解消する。ほぼ全員が1回の走査で組まれるため、2,000人規模でも
+全組み合わせを比較する最大マッチングを使わずに済む。
+"""
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from src.domain.match.match import Match
+
+
+@dataclass(frozen=True)
+class SwissPairing:
+    pairs: list[tuple[UUID, UUID]]
+    # 人数が奇数のときに不戦勝となるプレイヤー
+    bye: UUID | None = None
+
+
+@dataclass
+class SwissHistory:
+    """これまでのラウンドの勝数・対戦済みの組・不戦勝"""
+
+    wins: dict[UUID, int] = field(default_factory=dict)
+    played: set[frozenset[UUID]] = field(default_factory=set)
+    byes: set[UUID] = field(default_factory=set)
+
+    @classmethod
+    def from_matches(
+        cls, player_ids: Iterable[UUID], matches: Iterable[Match]
+    ) -> "SwissHistory":
+        """完了済みの試合から作る。相手がエントリー外の試合は不戦勝とみなす"""
+        entrants = set(player_ids)
+        history = cls()
+        for match in matches:
+            winner = match.winner_id
+            if winner is None:
+                continue
+            history.wins[winner] = history.wins.get(winner, 0) + 1
+            if match.player1_id in entrants and match.player2_id in entrants:
+                history.played.add(frozenset((match.player1_id, match.player2_id)))
+            else:
+                history.byes.add(winner)
+        return history
+
+    def has_played(self, a: UUID, b: UUID) -> bool:
+        return frozenset((a, b)) in self.played
+
+
+def pair_round(ranked: Sequence[UUID], history: SwissHistory) -> SwissPairing:
+    """ranked（シード順）のプレイヤーを、勝数の多い順に組み合わせる"""
+    order = {pid: i for i, pid in enumerate(ranked)}
+    players = sorted(ranked, key=lambda pid: (-history.wins.get(pid, 0), order[pid]))
+
+    bye = None
+    if len(players) % 2 == 1:
+        # 不戦勝は、まだ受けていない中で最下位のプレイヤー
+        bye = next(
+            (pid for pid in reversed(players) if pid not in history.byes),
+            players[-1],
+        )
+        players.remove(bye)
+
+    pairs: list[tuple[UUID, UUID]] = []
+    floaters: list[UUID] = []
+    start = 0
+    while start < len(players):
+        score = history.wins.get(players[start], 0)
+        end = start
+        while end < len(players) and history.wins.get(players[end], 0) == score:
+            end += 1
+        floaters = _pair_group(floaters + players[start:end], history, pairs)
+        start = end
+
+    _pair_remaining(floaters, history, pairs)
+    return SwissPairing(pairs=pairs, bye=bye)
+
+
+def _pair_group(
+    group: list[UUID], history: SwissHistory, pairs: list[tuple[UUID, UUID]]
+) -> list[UUID]:
+    """上位半分と下位半分を当て、組めなかったプレイヤーを返す"""
+    half = len(group) // 2
+    top, bottom = group[:half], group[half:]
+    unpaired: list[UUID] = []
+    for player in top:
+        opponent = next(
+            (b for b in bottom if not history.has_played(player, b)), None
+        )
+        if opponent is None:
+            unpaired.append(player)
+            continue
+        bottom.remove(opponent)
+        pairs.append((player, opponent))
+    return unpaired + bottom
+
+
+def _pair_remaining(
+    players: list[UUID], history: SwissHistory, pairs: list[tuple[UUID, UUID]]
+) -> None:
+    """最後に残ったプレイヤーを組む。再戦は既存の組との入れ替えで避け、
+    それでも避けられない場合（少人数で終盤のラウンド）のみ再戦を許す。
+    """
+    remaining = list(players)
+    while remaining:
+        player = remaining.pop(0)
+        opponent = next(
+            (p for p in remaining if not history.has_played(player, p)), None
+        )
+        if opponent is not None:
+            remaining.remove(opponent)
+            pairs.append((player, opponent))
+            continue
+
+        opponent = remaining.pop(0)
+        for i in range(len(pairs) - 1, -1, -1):
+            a, b = pairs[i]
+            if not history.has_played(player, a) and not history.has_played(
+                opponent, b
+            ):
+                pairs[i] = (a, player)
+                pairs.append((b, opponent))
+                break
+            if not history.has_played(player, b) and not history.has_played(
+                opponent, a
+            ):
+                pairs[i] = (a, opponent)
+                pairs.append((player, b))
+                break
+        else:
+            pairs.append((player, opponent))
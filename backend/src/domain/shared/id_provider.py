@@ -0,0 +1,45 @@
+"""ID プロバイダ
+
+集約の ID は全てここで発行する。時刻順に並ぶ UUIDv7（RFC 9562）を使うことで、
+InnoDB のクラスタ化インデックスへの挿入が末尾に集まり、ページ分割を抑えられる。
+"""
+import secrets
+import threading
+import time
+from uuid import UUID
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+# rand_a（12bit）をミリ秒内カウンタとして使う。初期値は上位を空けておく
+_COUNTER_BITS = 12
+_COUNTER_SEED_BITS = 10
+
+
+def new_id() -> UUID:
+    """UUIDv7 を発行する。同一プロセス内では単調増加する"""
+    global _last_ms, _counter
+
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            _counter = secrets.randbits(_COUNTER_SEED_BITS)
+        else:
+            _counter += 1
+            if _counter >= 1 << _COUNTER_BITS:
+                # カウンタが溢れたら次のミリ秒を先取りする
+                _last_ms += 1
+                _counter = 0
+        timestamp_ms = _last_ms
+        counter = _counter
+
+    value = (
+        (timestamp_ms & ((1 << 48) - 1)) << 80
+        | 0x7 << 76
+        | counter << 64
+        | 0b10 << 62
+        | secrets.randbits(62)
+    )
+    return UUID(int=value)
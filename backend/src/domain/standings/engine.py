@@ -0,0 +1,71 @@
+"""完了試合から順位表を計算するドメインサービス
+
+API の順位表は実体化した standings テーブルを読むため、試合からの集計は
+予選リーグのプール内順位と、standings リポジトリを使わない構成（ベンチマークなど）
+でのみ行う。
+"""
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from src.domain.contest.contest import Contest
+from src.domain.contest.value_objects import ContestFormat
+from src.domain.match.match import Match
+from src.domain.standings.standing import Standing
+
+
+class StandingsEngine(ABC):
+    @abstractmethod
+    def compute(
+        self, contest: Contest, completed_matches: list[Match]
+    ) -> list[Standing]:
+        """順位順に返す。総当たりは勝数 → 得失ゲーム差、
+        トーナメントは勝数 → 試合数の順で、同順位はプレイヤーの登録順を保つ。
+        """
+        ...
+
+
+class PythonStandingsEngine(StandingsEngine):
+    def compute(
+        self, contest: Contest, completed_matches: list[Match]
+    ) -> list[Standing]:
+        stats: dict[UUID, dict[str, int]] = {
+            p.player_id: {
+                "wins": 0,
+                "losses": 0,
+                "matches_played": 0,
+                "game_wins": 0,
+                "game_losses": 0,
+            }
+            for p in contest.players
+        }
+        round_robin = contest.format == ContestFormat.ROUND_ROBIN
+
+        for match in completed_matches:
+            p1_id = match.player1_id
+            p2_id = match.player2_id
+
+            if round_robin and (p1_id not in stats or p2_id not in stats):
+                continue  # BYE試合など
+            p1_won = match.player1_wins > match.player2_wins
+
+            if p1_id in stats:
+                stats[p1_id]["game_wins"] += match.player1_wins
+                stats[p1_id]["game_losses"] += match.player2_wins
+                stats[p1_id]["matches_played"] += 1
+                stats[p1_id]["wins" if p1_won else "losses"] += 1
+
+            if p2_id in stats:
+                stats[p2_id]["game_wins"] += match.player2_wins
+                stats[p2_id]["game_losses"] += match.player1_wins
+                stats[p2_id]["matches_played"] += 1
+                stats[p2_id]["losses" if p1_won else "wins"] += 1
+
+        standings = [
+            Standing(player_id=p.player_id, player_name=p.name, **stats[p.player_id])
+            for p in contest.players
+        ]
+        if round_robin:
+            standings.sort(key=lambda s: (-s.wins, -(s.game_wins - s.game_losses)))
+        else:
+            standings.sort(key=lambda s: (-s.wins, -s.matches_played))
+        return standings
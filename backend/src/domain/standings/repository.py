@@ -0,0 +1,33 @@
+"""Standings リポジトリインターフェース"""
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from src.domain.contest.value_objects import ContestFormat
+from src.domain.standings.standing import Standing, StandingDelta
+
+
+class StandingsRepository(ABC):
+    @abstractmethod
+    async def apply(self, contest_id: UUID, deltas: list[StandingDelta]) -> None:
+        """増分を加算する。コンテストのプレイヤーでない ID（BYE・TBD）は無視し、
+        総当たりでは相手がプレイヤーでない試合の増分も加算しない（rebuild と同じ集計）
+        """
+        ...
+
+    @abstractmethod
+    async def find_version(self, contest_id: UUID) -> int | None:
+        """試合・プレイヤーの書き込みごとに増える版数。コンテストがなければ None"""
+        ...
+
+    @abstractmethod
+    async def find_format(self, contest_id: UUID) -> ContestFormat | None: ...
+
+    @abstractmethod
+    async def find_by_contest_id(self, contest_id: UUID) -> list[Standing] | None:
+        """順位順に返す。コンテストがなければ None"""
+        ...
+
+    @abstractmethod
+    async def rebuild(self, contest_id: UUID) -> None:
+        """完了試合から集計し直した値で順位表を置き換える"""
+        ...
@@ -0,0 +1,69 @@
+"""順位表の読み取りモデル"""
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.domain.match.match import Match
+from src.domain.match.value_objects import MatchStatus
+
+
+@dataclass(frozen=True)
+class Standing:
+    player_id: UUID
+    player_name: str
+    wins: int
+    losses: int
+    matches_played: int
+    game_wins: int
+    game_losses: int
+
+
+@dataclass(frozen=True)
+class StandingDelta:
+    """1試合がプレイヤー1人の成績に与える増分"""
+
+    player_id: UUID
+    # 対戦相手。総当たりでは相手がプレイヤーでない試合（BYE など）を数えない
+    opponent_id: UUID
+    wins: int
+    losses: int
+    matches_played: int
+    game_wins: int
+    game_losses: int
+
+    def reversed(self) -> "StandingDelta":
+        return StandingDelta(
+            player_id=self.player_id,
+            opponent_id=self.opponent_id,
+            wins=-self.wins,
+            losses=-self.losses,
+            matches_played=-self.matches_played,
+            game_wins=-self.game_wins,
+            game_losses=-self.game_losses,
+        )
+
+
+def deltas_for(match: Match) -> list[StandingDelta]:
+    """完了した試合の両プレイヤー分の増分を返す。未完了なら空"""
+    if match.status != MatchStatus.COMPLETED:
+        return []
+    p1_won = match.player1_wins > match.player2_wins
+    return [
+        StandingDelta(
+            player_id=match.player1_id,
+            opponent_id=match.player2_id,
+            wins=int(p1_won),
+            losses=int(not p1_won),
+            matches_played=1,
+            game_wins=match.player1_wins,
+            game_losses=match.player2_wins,
+        ),
+        StandingDelta(
+            player_id=match.player2_id,
+            opponent_id=match.player1_id,
+            wins=int(not p1_won),
+            losses=int(p1_won),
+            matches_played=1,
+            game_wins=match.player2_wins,
+            game_losses=match.player1_wins,
+        ),
+    ]
@@ -0,0 +1,197 @@
+"""順位表のタイブレーク
+
+勝数が並んだグループに対し、タイブレークの連鎖を先頭から順に適用する。
+直接対決・対戦相手の勝数（SOS）は、計算ごとに1度だけ作る対戦結果（MatchResults）から
+求めるため、試合一覧を走査し直さない。対戦結果は同率のプレイヤーの分だけを
+プレイヤーごとの対戦相手の一覧で持ち、n×n の行列は作らない。
+"""
+from collections.abc import Collection, Mapping, Sequence
+from dataclasses import dataclass, field
+from enum import Enum
+from uuid import UUID
+
+from src.domain.contest.value_objects import ContestFormat
+from src.domain.match.match import Match
+from src.domain.standings.standing import Standing
+
+
+class Tiebreaker(str, Enum):
+    HEAD_TO_HEAD = "HEAD_TO_HEAD"  # 同率グループ内での勝数
+    GAME_DIFFERENCE = "GAME_DIFFERENCE"  # 得失ゲーム差
+    STRENGTH_OF_SCHEDULE = "STRENGTH_OF_SCHEDULE"  # 対戦相手の勝数の合計（Buchholz）
+    GAME_RATIO = "GAME_RATIO"  # 取得ゲーム率
+    MATCHES_PLAYED = "MATCHES_PLAYED"  # 試合数（トーナメントで勝ち残った深さ）
+
+
+DEFAULT_ROUND_ROBIN_TIEBREAKERS: tuple[Tiebreaker, ...] = (Tiebreaker.GAME_DIFFERENCE,)
+# スイス式は対戦相手の強さ（Buchholz）で並べるのが一般的
+DEFAULT_SWISS_TIEBREAKERS: tuple[Tiebreaker, ...] = (
+    Tiebreaker.STRENGTH_OF_SCHEDULE,
+    Tiebreaker.GAME_DIFFERENCE,
+)
+ELIMINATION_TIEBREAKERS: tuple[Tiebreaker, ...] = (Tiebreaker.MATCHES_PLAYED,)
+
+# 対戦結果が必要なタイブレーク
+_RESULTS_TIEBREAKERS = {Tiebreaker.HEAD_TO_HEAD, Tiebreaker.STRENGTH_OF_SCHEDULE}
+
+
+@dataclass(frozen=True)
+class RankedStanding:
+    standing: Standing
+    rank: int
+    # 同率の解消に使った値（タイブレーク名 → 値）
+    tiebreaks: dict[str, float] = field(default_factory=dict)
+
+
+class MatchResults:
+    """プレイヤーごとの対戦相手と勝った相手の一覧（試合数分のメモリで済む）"""
+
+    def __init__(
+        self, player_ids: Collection[UUID], completed_matches: list[Match]
+    ) -> None:
+        # player_ids（同率のプレイヤー）の試合だけを持つ
+        self._opponents: dict[UUID, list[UUID]] = {pid: [] for pid in player_ids}
+        self._beaten: dict[UUID, list[UUID]] = {pid: [] for pid in player_ids}
+        for match in completed_matches:
+            p1, p2 = match.player1_id, match.player2_id
+            winner, loser = (
+                (p1, p2) if match.player1_wins > match.player2_wins else (p2, p1)
+            )
+            if p1 in self._opponents:
+                self._opponents[p1].append(p2)
+            if p2 in self._opponents:
+                self._opponents[p2].append(p1)
+            if winner in self._beaten:
+                self._beaten[winner].append(loser)
+
+    def head_to_head(self, group: Sequence[UUID]) -> dict[UUID, int]:
+        """同率グループ内で勝った試合数"""
+        members = set(group)
+        return {
+            pid: sum(1 for loser in self._beaten[pid] if loser in members)
+            for pid in group
+        }
+
+    def strength_of_schedule(
+        self, player_id: UUID, total_wins: Mapping[UUID, int]
+    ) -> int:
+        """対戦した相手の勝数を、対戦回数分だけ合計する。プレイヤーでない相手は0勝"""
+        return sum(total_wins.get(o, 0) for o in self._opponents[player_id])
+
+
+def tiebreakers_for(
+    contest_format: ContestFormat, requested: Sequence[Tiebreaker] | None = None
+) -> tuple[Tiebreaker, ...]:
+    if contest_format == ContestFormat.SWISS:
+        return tuple(requested) if requested else DEFAULT_SWISS_TIEBREAKERS
+    if contest_format != ContestFormat.ROUND_ROBIN:
+        return ELIMINATION_TIEBREAKERS
+    return tuple(requested) if requested else DEFAULT_ROUND_ROBIN_TIEBREAKERS
+
+
+def tied_players(
+    standings: Sequence[Standing], tiebreakers: Sequence[Tiebreaker]
+) -> set[UUID]:
+    """対戦結果を使うタイブレークで同率を解く必要のあるプレイヤー（勝数が並んだ全員）。
+    不要なら空
+    """
+    if not _RESULTS_TIEBREAKERS.intersection(tiebreakers):
+        return set()
+    by_wins: dict[int, list[UUID]] = {}
+    for s in standings:
+        by_wins.setdefault(s.wins, []).append(s.player_id)
+    return {pid for group in by_wins.values() if len(group) > 1 for pid in group}
+
+
+def needs_match_results(
+    standings: Sequence[Standing], tiebreakers: Sequence[Tiebreaker]
+) -> bool:
+    """勝数の同率があり、かつ対戦結果を使うタイブレークが含まれるか"""
+    return bool(tied_players(standings, tiebreakers))
+
+
+def rank_standings(
+    standings: Sequence[Standing],
+    tiebreakers: Sequence[Tiebreaker],
+    results: MatchResults | None = None,
+) -> list[RankedStanding]:
+    """勝数の降順に並べ、同率グループをタイブレークの連鎖で分ける。
+    全てのタイブレークで並んだプレイヤーは同順位になり、入力順を保つ。
+    results は tied_players() のプレイヤーの分があればよい。
+    """
+    if results is None and needs_match_results(standings, tiebreakers):
+        raise ValueError("match results are required for the given tiebreakers")
+
+    by_wins: dict[int, list[Standing]] = {}
+    for s in standings:
+        by_wins.setdefault(s.wins, []).append(s)
+
+    total_wins = {s.player_id: s.wins for s in standings}
+
+    ranked: list[RankedStanding] = []
+    for wins in sorted(by_wins, reverse=True):
+        for cluster in _resolve(by_wins[wins], list(tiebreakers), results, total_wins):
+            rank = len(ranked) + 1
+            ranked.extend(
+                RankedStanding(standing=s, rank=rank, tiebreaks=values)
+                for s, values in cluster
+            )
+    return ranked
+
+
+def _resolve(
+    group: list[Standing],
+    tiebreakers: list[Tiebreaker],
+    results: MatchResults | None,
+    total_wins: Mapping[UUID, int],
+    values: dict[UUID, dict[str, float]] | None = None,
+) -> list[list[tuple[Standing, dict[str, float]]]]:
+    """同率グループを、順位順に並んだ同率クラスタの列に分ける"""
+    values = values if values is not None else {s.player_id: {} for s in group}
+    if len(group) == 1 or not tiebreakers:
+        return [[(s, values[s.player_id]) for s in group]]
+
+    tiebreaker, rest = tiebreakers[0], tiebreakers[1:]
+    keys = _evaluate(tiebreaker, group, results, total_wins)
+    for s in group:
+        values[s.player_id][tiebreaker.value] = keys[s.player_id]
+
+    ordered = sorted(group, key=lambda s: -keys[s.player_id])
+    clusters: list[list[tuple[Standing, dict[str, float]]]] = []
+    start = 0
+    for end in range(1, len(ordered) + 1):
+        if end == len(ordered) or (
+            keys[ordered[end].player_id] != keys[ordered[start].player_id]
+        ):
+            clusters.extend(
+                _resolve(ordered[start:end], rest, results, total_wins, values)
+            )
+            start = end
+    return clusters
+
+
+def _evaluate(
+    tiebreaker: Tiebreaker,
+    group: list[Standing],
+    results: MatchResults | None,
+    total_wins: Mapping[UUID, int],
+) -> dict[UUID, float]:
+    if tiebreaker == Tiebreaker.GAME_DIFFERENCE:
+        return {s.player_id: s.game_wins - s.game_losses for s in group}
+    if tiebreaker == Tiebreaker.GAME_RATIO:
+        return {
+            s.player_id: s.game_wins / (s.game_wins + s.game_losses)
+            if s.game_wins + s.game_losses
+            else 0.0
+            for s in group
+        }
+    if tiebreaker == Tiebreaker.MATCHES_PLAYED:
+        return {s.player_id: s.matches_played for s in group}
+
+    assert results is not None
+    if tiebreaker == Tiebreaker.HEAD_TO_HEAD:
+        return dict(results.head_to_head([s.player_id for s in group]))
+    return {
+        s.player_id: results.strength_of_schedule(s.player_id, total_wins)
+        for s in group
+    }
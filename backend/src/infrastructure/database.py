@@ -1,13 +1,20 @@
-"""データベース接続・セッション管理"""
+"""データベース接続・セッション管理
+
+書き込み（コマンド）はプライマリ、読み取り（クエリ）はリードレプリカを使う。
+レプリカ未設定時は読み取りもプライマリに向く。
+"""
+import time
 from collections.abc import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
 from sqlalchemy.orm import DeclarativeBase
 
+from src.infrastructure.pool_metrics import InstrumentedQueuePool
 from src.infrastructure.settings import Settings
 
 
@@ -16,8 +23,29 @@ class Base(DeclarativeBase):
 
 
 _settings = Settings()
-_engine = create_async_engine(_settings.database_url, echo=False)
+
+
+def _create_engine(url: str) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        echo=False,
+        poolclass=InstrumentedQueuePool,
+        pool_size=_settings.db_pool_size,
+        max_overflow=_settings.db_max_overflow,
+        pool_recycle=_settings.db_pool_recycle,
+        pool_pre_ping=_settings.db_pool_pre_ping,
+        pool_timeout=_settings.db_pool_timeout,
+    )
+
+
+_engine = _create_engine(_settings.database_url)
+_read_engine = (
+    _create_engine(_settings.database_replica_url)
+    if _settings.database_replica_url
+    else _engine
+)
 AsyncSessionLocal = async_sessionmaker(_engine, expire_on_commit=False)
+AsyncReadSessionLocal = async_sessionmaker(_read_engine, expire_on_commit=False)
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
@@ -28,3 +56,36 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
         except Exception:
             await session.rollback()
             raise
+
+
+def read_sessionmaker(
+    last_write_at: float | None, now: float | None = None
+) -> async_sessionmaker[AsyncSession]:
+    """読み取りに使うセッションファクトリを選ぶ。
+    同じクライアントの直近の書き込みから replica_max_lag_seconds 以内なら、
+    レプリカの反映遅延で書き込みが見えない恐れがあるためプライマリを使う。
+    """
+    if last_write_at is not None:
+        elapsed = (now if now is not None else time.time()) - last_write_at
+        if elapsed < _settings.replica_max_lag_seconds:
+            return AsyncSessionLocal
+    return AsyncReadSessionLocal
+
+
+async def get_read_db_session(
+    last_write_at: float | None = None,
+) -> AsyncGenerator[AsyncSession, None]:
+    async with read_sessionmaker(last_write_at)() as session:
+        try:
+            yield session
+        finally:
+            # 読み取り専用のためコミットしない
+            await session.rollback()
+
+
+def get_pools() -> dict[str, InstrumentedQueuePool]:
+    """役割（primary / replica）ごとの接続プール。レプリカ未設定時は primary のみ"""
+    pools = {"primary": _engine.pool}
+    if _read_engine is not _engine:
+        pools["replica"] = _read_engine.pool
+    return pools  # type: ignore[return-value]
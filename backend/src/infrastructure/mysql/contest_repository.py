@@ -1,16 +1,22 @@
 """Contest MySQL リポジトリ実装"""
 import uuid
 from datetime import datetime
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import and_, delete, func, or_, select
+from sqlalchemy.dialects.mysql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from src.domain.contest.contest import Contest
+from src.domain.contest.contest_summary import ContestSummary
 from src.domain.contest.player import Player
 from src.domain.contest.repository import ContestRepository
-from src.domain.contest.value_objects import ContestFormat, ContestStatus
-from src.infrastructure.mysql.models import ContestModel, PlayerModel
+from src.domain.contest.value_objects import ContestStatus
+from src.infrastructure.mysql.models import ContestModel, PlayerModel, StandingModel
+
+# 既存行と衝突した場合に上書きする列（作成後に変わりうる列）
+_MUTABLE_COLUMNS = ("name", "status", "best_of")
 
 
 class MySQLContestRepository(ContestRepository):
@@ -18,53 +24,56 @@ class MySQLContestRepository(ContestRepository):
         self._session = session
 
     async def save(self, contest: Contest) -> None:
-        model = await self._session.get(
-            ContestModel,
-            str(contest.contest_id),
-            options=[selectinload(ContestModel.players)],
+        """コンテスト行は upsert し、プレイヤーは追加・削除の差分だけを書き込む。
+        既存のプレイヤー一覧は読み込まない。
+        """
+        stmt = insert(ContestModel).values(
+            contest_id=contest.contest_id,
+            name=contest.name,
+            game_title_id=contest.game_title_id,
+            format=contest.format,
+            best_of=contest.best_of,
+            status=contest.status,
+            created_at=contest.created_at,
         )
-        if model is None:
-            model = ContestModel(
-                contest_id=str(contest.contest_id),
-                name=contest.name,
-                game_title_id=str(contest.game_title_id),
-                format=contest.format.value,
-                best_of=contest.best_of,
-                status=contest.status.value,
-                created_at=contest.created_at.isoformat(),
-            )
-            model.players = []  # レイジーロードを防ぐため空リストで初期化
-            self._session.add(model)
-            await self._session.flush()
-
-        model.name = contest.name
-        model.status = contest.status.value
-        model.best_of = contest.best_of
-
-        # プレイヤーの同期
-        existing_ids = {p.player_id for p in model.players}
-        domain_ids = {str(p.player_id) for p in contest.players}
+        removed_ids = contest.removed_player_ids
+        added = contest.added_players
+        updates: dict[str, Any] = {col: stmt.inserted[col] for col in _MUTABLE_COLUMNS}
+        if removed_ids or added:
+            # プレイヤーの増減は順位表に影響するため版数を進める
+            updates["version"] = ContestModel.version + 1
+        await self._session.execute(stmt.on_duplicate_key_update(updates))
 
-        # 削除
-        model.players = [p for p in model.players if p.player_id in domain_ids]
-
-        # 追加
-        for player in contest.players:
-            if str(player.player_id) not in existing_ids:
-                player_model = PlayerModel(
-                    player_id=str(player.player_id),
-                    contest_id=str(player.contest_id),
-                    name=player.name,
-                    seed=player.seed,
+        if removed_ids:
+            await self._session.execute(
+                delete(PlayerModel).where(PlayerModel.player_id.in_(removed_ids))
+            )
+        if added:
+            await self._session.execute(
+                insert(PlayerModel).values(
+                    [
+                        {
+                            "player_id": p.player_id,
+                            "contest_id": p.contest_id,
+                            "name": p.name,
+                            "seed": p.seed,
+                        }
+                        for p in added
+                    ]
                 )
-                model.players.append(player_model)
-
-        await self._session.flush()
+            )
+            # 順位表の行はプレイヤーと同時に作り、削除は外部キーの CASCADE に任せる
+            await self._session.execute(
+                insert(StandingModel).values(
+                    [{"contest_id": p.contest_id, "player_id": p.player_id} for p in added]
+                )
+            )
+        contest.clear_player_changes()
 
     async def find_by_id(self, contest_id: uuid.UUID) -> Contest | None:
         result = await self._session.execute(
             select(ContestModel)
-            .where(ContestModel.contest_id == str(contest_id))
+            .where(ContestModel.contest_id == contest_id)
             .options(selectinload(ContestModel.players))
         )
         model = result.scalar_one_or_none()
@@ -72,17 +81,63 @@ class MySQLContestRepository(ContestRepository):
             return None
         return self._to_domain(model)
 
-    async def find_all(self) -> list[Contest]:
-        result = await self._session.execute(
-            select(ContestModel).options(selectinload(ContestModel.players))
+    async def find_summaries(
+        self,
+        limit: int,
+        after: tuple[datetime, uuid.UUID] | None = None,
+        status: ContestStatus | None = None,
+        game_title_id: uuid.UUID | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+    ) -> list[ContestSummary]:
+        player_count = (
+            select(func.count())
+            .where(PlayerModel.contest_id == ContestModel.contest_id)
+            .correlate(ContestModel)
+            .scalar_subquery()
         )
-        models = result.scalars().all()
-        return [self._to_domain(m) for m in models]
+        stmt = (
+            select(
+                ContestModel.contest_id,
+                ContestModel.name,
+                ContestModel.game_title_id,
+                ContestModel.format,
+                ContestModel.best_of,
+                ContestModel.status,
+                ContestModel.created_at,
+                player_count.label("player_count"),
+            )
+            .order_by(ContestModel.created_at.desc(), ContestModel.contest_id.desc())
+            .limit(limit)
+        )
+        if after is not None:
+            # 行値比較は範囲スキャンにならないことがあるため展開して書く
+            after_created_at, after_contest_id = after
+            stmt = stmt.where(
+                or_(
+                    ContestModel.created_at < after_created_at,
+                    and_(
+                        ContestModel.created_at == after_created_at,
+                        ContestModel.contest_id < after_contest_id,
+                    ),
+                )
+            )
+        if status is not None:
+            stmt = stmt.where(ContestModel.status == status)
+        if game_title_id is not None:
+            stmt = stmt.where(ContestModel.game_title_id == game_title_id)
+        if created_from is not None:
+            stmt = stmt.where(ContestModel.created_at >= created_from)
+        if created_to is not None:
+            stmt = stmt.where(ContestModel.created_at < created_to)
+
+        result = await self._session.execute(stmt)
+        return [ContestSummary(**row._mapping) for row in result]
 
     async def delete(self, contest_id: uuid.UUID) -> None:
         model = await self._session.get(
             ContestModel,
-            str(contest_id),
+            contest_id,
             options=[
                 selectinload(ContestModel.players),
                 selectinload(ContestModel.matches),
@@ -95,20 +150,20 @@ class MySQLContestRepository(ContestRepository):
     def _to_domain(self, model: ContestModel) -> Contest:
         players = [
             Player(
-                player_id=uuid.UUID(p.player_id),
-                contest_id=uuid.UUID(p.contest_id),
+                player_id=p.player_id,
+                contest_id=p.contest_id,
                 name=p.name,
                 seed=p.seed,
             )
             for p in model.players
         ]
         return Contest(
-            contest_id=uuid.UUID(model.contest_id),
+            contest_id=model.contest_id,
             name=model.name,
-            game_title_id=uuid.UUID(model.game_title_id),
-            format=ContestFormat(model.format),
+            game_title_id=model.game_title_id,
+            format=model.format,
             best_of=model.best_of,
-            status=ContestStatus(model.status),
-            created_at=datetime.fromisoformat(model.created_at),
+            status=model.status,
+            created_at=model.created_at,
             players=players,
         )
@@ -0,0 +1,21 @@
+"""コンテストの版数更新"""
+import uuid
+from collections.abc import Iterable
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.mysql.models import ContestModel
+
+
+async def bump_version(session: AsyncSession, contest_ids: Iterable[uuid.UUID]) -> None:
+    """順位表に影響する書き込みと同じトランザクションで版数を1つ進める"""
+    ids = set(contest_ids)
+    if not ids:
+        return
+    await session.execute(
+        update(ContestModel)
+        .where(ContestModel.contest_id.in_(ids))
+        .values(version=ContestModel.version + 1)
+        .execution_options(synchronize_session=False)
+    )
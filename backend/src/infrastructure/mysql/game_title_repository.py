@@ -14,7 +14,7 @@ class MySQLGameTitleRepository(GameTitleRepository):
         self._session = session
 
     async def save(self, game_title: GameTitle) -> None:
-        model = await self._session.get(GameTitleModel, str(game_title.game_title_id))
+        model = await self._session.get(GameTitleModel, game_title.game_title_id)
         if model is None:
             model = self._to_model(game_title)
             self._session.add(model)
@@ -23,7 +23,7 @@ class MySQLGameTitleRepository(GameTitleRepository):
         await self._session.flush()
 
     async def find_by_id(self, game_title_id: uuid.UUID) -> GameTitle | None:
-        model = await self._session.get(GameTitleModel, str(game_title_id))
+        model = await self._session.get(GameTitleModel, game_title_id)
         if model is None:
             return None
         return self._to_domain(model)
@@ -35,12 +35,12 @@ class MySQLGameTitleRepository(GameTitleRepository):
 
     def _to_domain(self, model: GameTitleModel) -> GameTitle:
         return GameTitle(
-            game_title_id=uuid.UUID(model.game_title_id),
+            game_title_id=model.game_title_id,
             name=model.name,
         )
 
     def _to_model(self, game_title: GameTitle) -> GameTitleModel:
         return GameTitleModel(
-            game_title_id=str(game_title.game_title_id),
+            game_title_id=game_title.game_title_id,
             name=game_title.name,
         )
@@ -1,13 +1,33 @@
 """Match MySQL リポジトリ実装"""
 import uuid
+from collections.abc import Callable
 
-from sqlalchemy import select
+from sqlalchemy import Exists, and_, delete, event, exists, or_, select, update
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, Session
 
+from src.domain.match.bracket_diff import BracketDiff
 from src.domain.match.match import Match
 from src.domain.match.repository import MatchRepository
 from src.domain.match.value_objects import MatchStatus
-from src.infrastructure.mysql.models import MatchModel
+from src.infrastructure.mysql.contest_version import bump_version
+from src.infrastructure.mysql.models import ContestModel, MatchModel, PlayerModel
+
+# 1文あたりの行数上限（max_allowed_packet に収まるよう分割する）
+BULK_INSERT_CHUNK_SIZE = 1000
+
+# 既存行と衝突した場合に上書きする列（Match.record_result で変化する列）
+_MUTABLE_COLUMNS = (
+    "player1_character",
+    "player2_character",
+    "player1_wins",
+    "player2_wins",
+    "comment",
+    "status",
+    "station",
+)
 
 
 class MySQLMatchRepository(MatchRepository):
@@ -15,75 +35,326 @@ class MySQLMatchRepository(MatchRepository):
         self._session = session
 
     async def save(self, match: Match) -> None:
-        model = await self._session.get(MatchModel, str(match.match_id))
+        model = await self._session.get(MatchModel, match.match_id)
         if model is None:
             model = self._to_model(match)
             self._session.add(model)
         else:
             self._update_model(model, match)
         await self._session.flush()
+        await bump_version(self._session, [match.contest_id])
 
     async def save_all(self, matches: list[Match]) -> None:
-        for match in matches:
-            await self.save(match)
+        """複数行 INSERT で一括保存する。
+        既存の match_id は ON DUPLICATE KEY UPDATE で結果列のみ更新する。
+        コンテスト行のロックを書き込みの間保持しないよう、版数は bump_version で進める。
+        """
+        if not matches:
+            return
+
+        # 未反映の ORM 変更を先に書き出しておく（flush はこの1回のみ）
+        await self._session.flush()
+
+        for start in range(0, len(matches), BULK_INSERT_CHUNK_SIZE):
+            chunk = matches[start : start + BULK_INSERT_CHUNK_SIZE]
+            stmt = insert(MatchModel).values([self._to_row(m) for m in chunk])
+            stmt = stmt.on_duplicate_key_update(
+                {col: stmt.inserted[col] for col in _MUTABLE_COLUMNS}
+            )
+            await self._session.execute(stmt)
+
+    async def bump_version(self, contest_id: uuid.UUID) -> None:
+        await bump_version(self._session, [contest_id])
+
+    async def lock_contest(self, contest_id: uuid.UUID) -> None:
+        await self._session.execute(
+            select(ContestModel.contest_id)
+            .where(ContestModel.contest_id == contest_id)
+            .with_for_update()
+        )
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        # SAVEPOINT の解放・巻き戻しでも発火するため、最も外側のトランザクションの
+        # 終わりだけを見る。発火中のリスナーは外せないので、1度きりの旗で止める
+        pending = True
+
+        def on_end(session: Session, committed: bool) -> None:
+            nonlocal pending
+            if pending and session.get_nested_transaction() is None:
+                pending = False
+                if committed:
+                    callback()
+
+        sync_session = self._session.sync_session
+        event.listen(sync_session, "after_commit", lambda s: on_end(s, True))
+        event.listen(sync_session, "after_rollback", lambda s: on_end(s, False))
+
+    async def apply_diff(self, contest_id: uuid.UUID, diff: BracketDiff) -> None:
+        """削除は IN 指定、更新は主キー指定の executemany、挿入は複数行 INSERT で書く。
+        同じセッション（1トランザクション）で実行し、途中で失敗すれば全て戻る。
+        """
+        await self._session.flush()
+
+        for start in range(0, len(diff.deletes), BULK_INSERT_CHUNK_SIZE):
+            match_ids = diff.deletes[start : start + BULK_INSERT_CHUNK_SIZE]
+            await self._session.execute(
+                delete(MatchModel)
+                .where(MatchModel.match_id.in_(match_ids))
+                .execution_options(synchronize_session=False)
+            )
+        if diff.updates:
+            await self._session.execute(
+                update(MatchModel), [self._to_row(m) for m in diff.updates]
+            )
+        for start in range(0, len(diff.inserts), BULK_INSERT_CHUNK_SIZE):
+            inserts = diff.inserts[start : start + BULK_INSERT_CHUNK_SIZE]
+            await self._session.execute(
+                insert(MatchModel).values([self._to_row(m) for m in inserts])
+            )
+        if diff.deletes or diff.updates or diff.inserts:
+            await bump_version(self._session, [contest_id])
 
     async def find_by_id(self, match_id: uuid.UUID) -> Match | None:
-        model = await self._session.get(MatchModel, str(match_id))
+        model = await self._session.get(MatchModel, match_id)
         if model is None:
             return None
         return self._to_domain(model)
 
+    async def find_for_result(
+        self, contest_id: uuid.UUID, match_id: uuid.UUID
+    ) -> tuple[int, Match | None, bool] | None:
+        # 試合側を外部結合し、コンテストの有無と所属・2人の登録の確認を1クエリで行う
+        def entered(player_id: InstrumentedAttribute[uuid.UUID]) -> Exists:
+            return exists().where(
+                PlayerModel.contest_id == MatchModel.contest_id,
+                PlayerModel.player_id == player_id,
+            )
+
+        result = await self._session.execute(
+            select(
+                ContestModel.best_of,
+                MatchModel,
+                and_(
+                    entered(MatchModel.player1_id), entered(MatchModel.player2_id)
+                ).label("players_entered"),
+            )
+            .select_from(ContestModel)
+            .outerjoin(
+                MatchModel,
+                and_(
+                    MatchModel.contest_id == ContestModel.contest_id,
+                    MatchModel.match_id == match_id,
+                ),
+            )
+            .where(ContestModel.contest_id == contest_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+        best_of, model, players_entered = row
+        if model is None:
+            return best_of, None, False
+        return best_of, self._to_domain(model), bool(players_entered)
+
+    async def update_result(self, match: Match) -> None:
+        await self._session.execute(
+            update(MatchModel)
+            .where(MatchModel.match_id == match.match_id)
+            .values({col: getattr(match, col) for col in _MUTABLE_COLUMNS})
+        )
+        await bump_version(self._session, [match.contest_id])
+
+    async def advance_player(
+        self, next_match_id: uuid.UUID, slot: int, player_id: uuid.UUID
+    ) -> bool:
+        # 主キー指定の UPDATE 1文。ブラケットを走査しない
+        column = MatchModel.player1_id if slot == 1 else MatchModel.player2_id
+        result = await self._session.execute(
+            update(MatchModel)
+            .where(
+                MatchModel.match_id == next_match_id,
+                MatchModel.status != MatchStatus.COMPLETED,
+            )
+            .values({column: player_id})
+        )
+        return bool(result.rowcount)  # type: ignore[attr-defined]
+
+    async def set_players(
+        self,
+        match_id: uuid.UUID,
+        player1_id: uuid.UUID,
+        player2_id: uuid.UUID,
+        status: MatchStatus,
+    ) -> bool:
+        result = await self._session.execute(
+            update(MatchModel)
+            .where(
+                MatchModel.match_id == match_id,
+                MatchModel.player1_wins == 0,
+                MatchModel.player2_wins == 0,
+            )
+            .values(
+                player1_id=player1_id,
+                player2_id=player2_id,
+                status=status,
+                station=None,
+            )
+        )
+        return bool(result.rowcount)  # type: ignore[attr-defined]
+
+    async def assign_station(
+        self, contest_id: uuid.UUID, match_id: uuid.UUID, station: int
+    ) -> bool:
+        # 台の割り当ては順位表・トーナメント表に影響しないため版数を進めない。
+        # 代わりにコンテスト行をロックして割り当てを直列にし、対戦中のプレイヤーを
+        # ロック付きの読み取り（スナップショットでなく最新の行）で確かめる
+        await self.lock_contest(contest_id)
+        players = (
+            await self._session.execute(
+                select(MatchModel.player1_id, MatchModel.player2_id).where(
+                    MatchModel.contest_id == contest_id,
+                    MatchModel.match_id == match_id,
+                )
+            )
+        ).one_or_none()
+        if players is None:
+            return False
+        playing = await self._session.scalar(
+            select(MatchModel.match_id)
+            .where(
+                MatchModel.contest_id == contest_id,
+                MatchModel.station.is_not(None),
+                MatchModel.status != MatchStatus.COMPLETED,
+                or_(
+                    MatchModel.player1_id.in_(tuple(players)),
+                    MatchModel.player2_id.in_(tuple(players)),
+                ),
+            )
+            .limit(1)
+            .with_for_update(read=True)
+        )
+        if playing is not None:
+            return False
+        try:
+            async with self._session.begin_nested():
+                result = await self._session.execute(
+                    update(MatchModel)
+                    .where(
+                        MatchModel.match_id == match_id,
+                        MatchModel.station.is_(None),
+                        MatchModel.status != MatchStatus.COMPLETED,
+                    )
+                    .values(station=station)
+                )
+        except IntegrityError:
+            # 同じ台が別の試合に割り当て済み（uq_matches_contest_station）
+            return False
+        return bool(result.rowcount)  # type: ignore[attr-defined]
+
+    async def find_version(self, contest_id: uuid.UUID) -> int | None:
+        version: int | None = await self._session.scalar(
+            select(ContestModel.version).where(ContestModel.contest_id == contest_id)
+        )
+        return version
+
     async def find_by_contest_id(self, contest_id: uuid.UUID) -> list[Match]:
         result = await self._session.execute(
             select(MatchModel)
-            .where(MatchModel.contest_id == str(contest_id))
+            .where(MatchModel.contest_id == contest_id)
             .order_by(MatchModel.round, MatchModel.match_order)
         )
         models = result.scalars().all()
         return [self._to_domain(m) for m in models]
 
     async def delete(self, match_id: uuid.UUID) -> None:
-        model = await self._session.get(MatchModel, str(match_id))
+        model = await self._session.get(MatchModel, match_id)
         if model is not None:
             await self._session.delete(model)
             await self._session.flush()
+            # 進出元の試合が存在しない試合を指したままにならないよう、リンクを外す
+            for link, slot in (
+                (MatchModel.next_match_id, MatchModel.next_match_slot),
+                (MatchModel.loser_next_match_id, MatchModel.loser_next_match_slot),
+            ):
+                await self._session.execute(
+                    update(MatchModel)
+                    .where(MatchModel.contest_id == model.contest_id, link == match_id)
+                    .values({link: None, slot: None})
+                    .execution_options(synchronize_session=False)
+                )
+            await bump_version(self._session, [model.contest_id])
 
     def _to_domain(self, model: MatchModel) -> Match:
         return Match(
-            match_id=uuid.UUID(model.match_id),
-            contest_id=uuid.UUID(model.contest_id),
-            player1_id=uuid.UUID(model.player1_id),
-            player2_id=uuid.UUID(model.player2_id),
+            match_id=model.match_id,
+            contest_id=model.contest_id,
+            player1_id=model.player1_id,
+            player2_id=model.player2_id,
             player1_character=model.player1_character,
             player2_character=model.player2_character,
             player1_wins=model.player1_wins,
             player2_wins=model.player2_wins,
             comment=model.comment,
-            status=MatchStatus(model.status),
+            status=model.status,
             round=model.round,
             match_order=model.match_order,
+            next_match_id=model.next_match_id,
+            next_match_slot=model.next_match_slot,
+            loser_next_match_id=model.loser_next_match_id,
+            loser_next_match_slot=model.loser_next_match_slot,
+            pool=model.pool,
+            station=model.station,
         )
 
     def _to_model(self, match: Match) -> MatchModel:
         return MatchModel(
-            match_id=str(match.match_id),
-            contest_id=str(match.contest_id),
-            player1_id=str(match.player1_id),
-            player2_id=str(match.player2_id),
+            match_id=match.match_id,
+            contest_id=match.contest_id,
+            player1_id=match.player1_id,
+            player2_id=match.player2_id,
             player1_character=match.player1_character,
             player2_character=match.player2_character,
             player1_wins=match.player1_wins,
             player2_wins=match.player2_wins,
             comment=match.comment,
-            status=match.status.value,
+            status=match.status,
             round=match.round,
             match_order=match.match_order,
+            next_match_id=match.next_match_id,
+            next_match_slot=match.next_match_slot,
+            loser_next_match_id=match.loser_next_match_id,
+            loser_next_match_slot=match.loser_next_match_slot,
+            pool=match.pool,
+            station=match.station,
         )
 
+    def _to_row(self, match: Match) -> dict[str, object]:
+        return {
+            "match_id": match.match_id,
+            "contest_id": match.contest_id,
+            "player1_id": match.player1_id,
+            "player2_id": match.player2_id,
+            "player1_character": match.player1_character,
+            "player2_character": match.player2_character,
+            "player1_wins": match.player1_wins,
+            "player2_wins": match.player2_wins,
+            "comment": match.comment,
+            "status": match.status,
+            "round": match.round,
+            "match_order": match.match_order,
+            "next_match_id": match.next_match_id,
+            "next_match_slot": match.next_match_slot,
+            "loser_next_match_id": match.loser_next_match_id,
+            "loser_next_match_slot": match.loser_next_match_slot,
+            "pool": match.pool,
+            "station": match.station,
+        }
+
     def _update_model(self, model: MatchModel, match: Match) -> None:
         model.player1_character = match.player1_character
         model.player2_character = match.player2_character
         model.player1_wins = match.player1_wins
         model.player2_wins = match.player2_wins
         model.comment = match.comment
-        model.status = match.status.value
+        model.status = match.status
+        model.station = match.station
@@ -1,22 +1,43 @@
 """SQLAlchemy ORM モデル"""
+import enum
 import uuid
-
-from sqlalchemy import ForeignKey, Integer, String, Text
-from sqlalchemy.dialects.mysql import CHAR
+from datetime import datetime
+
+from sqlalchemy import (
+    BigInteger,
+    Computed,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    Text,
+)
+from sqlalchemy.dialects.mysql import DATETIME
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from src.domain.contest.value_objects import ContestFormat, ContestStatus
+from src.domain.match.value_objects import MatchStatus
+from src.domain.shared.id_provider import new_id
 from src.infrastructure.database import Base
+from src.infrastructure.mysql.types import BinaryUUID
 
 
-def uuid_str() -> str:
-    return str(uuid.uuid4())
+def enum_column(enum_class: type[enum.Enum]) -> Enum:
+    """値（.value）をそのまま MySQL の ENUM として保存する"""
+    return Enum(
+        enum_class,
+        values_callable=lambda members: [m.value for m in members],
+        validate_strings=True,
+    )
 
 
 class GameTitleModel(Base):
     __tablename__ = "game_titles"
 
-    game_title_id: Mapped[str] = mapped_column(
-        CHAR(36), primary_key=True, default=uuid_str
+    game_title_id: Mapped[uuid.UUID] = mapped_column(
+        BinaryUUID, primary_key=True, default=new_id
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
 
@@ -27,18 +48,36 @@ class GameTitleModel(Base):
 
 class ContestModel(Base):
     __tablename__ = "contests"
+    __table_args__ = (
+        Index(
+            "ix_contests_game_title_status_created",
+            "game_title_id",
+            "status",
+            "created_at",
+        ),
+        Index("ix_contests_created_at", "created_at"),
+        Index("ix_contests_status_created", "status", "created_at"),
+    )
 
-    contest_id: Mapped[str] = mapped_column(
-        CHAR(36), primary_key=True, default=uuid_str
+    contest_id: Mapped[uuid.UUID] = mapped_column(
+        BinaryUUID, primary_key=True, default=new_id
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
-    game_title_id: Mapped[str] = mapped_column(
-        CHAR(36), ForeignKey("game_titles.game_title_id"), nullable=False
+    game_title_id: Mapped[uuid.UUID] = mapped_column(
+        BinaryUUID, ForeignKey("game_titles.game_title_id"), nullable=False
+    )
+    format: Mapped[ContestFormat] = mapped_column(
+        enum_column(ContestFormat), nullable=False
     )
-    format: Mapped[str] = mapped_column(String(50), nullable=False)
     best_of: Mapped[int] = mapped_column(Integer, nullable=False)
-    status: Mapped[str] = mapped_column(String(50), nullable=False)
-    created_at: Mapped[str] = mapped_column(String(50), nullable=False)
+    status: Mapped[ContestStatus] = mapped_column(
+        enum_column(ContestStatus), nullable=False
+    )
+    created_at: Mapped[datetime] = mapped_column(DATETIME(fsp=6), nullable=False)
+    # 試合・プレイヤーの書き込みごとに増える版数（順位表キャッシュの鍵・ETag）
+    version: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0, server_default="0"
+    )
 
     game_title: Mapped["GameTitleModel"] = relationship(
         "GameTitleModel", back_populates="contests"
@@ -53,12 +92,13 @@ class ContestModel(Base):
 
 class PlayerModel(Base):
     __tablename__ = "players"
+    __table_args__ = (Index("ix_players_contest_seed", "contest_id", "seed"),)
 
-    player_id: Mapped[str] = mapped_column(
-        CHAR(36), primary_key=True, default=uuid_str
+    player_id: Mapped[uuid.UUID] = mapped_column(
+        BinaryUUID, primary_key=True, default=new_id
     )
-    contest_id: Mapped[str] = mapped_column(
-        CHAR(36), ForeignKey("contests.contest_id"), nullable=False
+    contest_id: Mapped[uuid.UUID] = mapped_column(
+        BinaryUUID, ForeignKey("contests.contest_id"), nullable=False
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     seed: Mapped[int | None] = mapped_column(Integer, nullable=True)
@@ -70,24 +110,75 @@ class PlayerModel(Base):
 
 class MatchModel(Base):
     __tablename__ = "matches"
+    __table_args__ = (
+        Index("ix_matches_contest_round_order", "contest_id", "round", "match_order"),
+        Index("ix_matches_contest_status", "contest_id", "status"),
+        # 1つの台で同時に進む試合は1つ（NULL は重複可）
+        Index("uq_matches_contest_station", "contest_id", "station", unique=True),
+    )
 
-    match_id: Mapped[str] = mapped_column(
-        CHAR(36), primary_key=True, default=uuid_str
+    match_id: Mapped[uuid.UUID] = mapped_column(
+        BinaryUUID, primary_key=True, default=new_id
     )
-    contest_id: Mapped[str] = mapped_column(
-        CHAR(36), ForeignKey("contests.contest_id"), nullable=False
+    contest_id: Mapped[uuid.UUID] = mapped_column(
+        BinaryUUID, ForeignKey("contests.contest_id"), nullable=False
     )
-    player1_id: Mapped[str] = mapped_column(CHAR(36), nullable=False)
-    player2_id: Mapped[str] = mapped_column(CHAR(36), nullable=False)
+    player1_id: Mapped[uuid.UUID] = mapped_column(BinaryUUID, nullable=False)
+    player2_id: Mapped[uuid.UUID] = mapped_column(BinaryUUID, nullable=False)
     player1_character: Mapped[str | None] = mapped_column(String(100), nullable=True)
     player2_character: Mapped[str | None] = mapped_column(String(100), nullable=True)
     player1_wins: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     player2_wins: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     comment: Mapped[str | None] = mapped_column(Text, nullable=True)
-    status: Mapped[str] = mapped_column(String(50), nullable=False)
+    status: Mapped[MatchStatus] = mapped_column(
+        enum_column(MatchStatus), nullable=False
+    )
     round: Mapped[int | None] = mapped_column(Integer, nullable=True)
     match_order: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    # 勝者の進出先（トーナメントのみ）。結果記録時に主キーで1行だけ更新する
+    next_match_id: Mapped[uuid.UUID | None] = mapped_column(BinaryUUID, nullable=True)
+    next_match_slot: Mapped[int | None] = mapped_column(SmallInteger, nullable=True)
+    # 敗者の落ち先（ダブルエリミネーションのみ）
+    loser_next_match_id: Mapped[uuid.UUID | None] = mapped_column(
+        BinaryUUID, nullable=True
+    )
+    loser_next_match_slot: Mapped[int | None] = mapped_column(
+        SmallInteger, nullable=True
+    )
+    # 予選リーグのプール番号
+    pool: Mapped[int | None] = mapped_column(SmallInteger, nullable=True)
+    station: Mapped[int | None] = mapped_column(SmallInteger, nullable=True)
 
     contest: Mapped["ContestModel"] = relationship(
         "ContestModel", back_populates="matches"
     )
+
+
+class StandingModel(Base):
+    """順位表の読み取りモデル。試合結果の記録時に増分で更新する"""
+
+    __tablename__ = "standings"
+    __table_args__ = (
+        # 総当たり: 勝数 → 得失ゲーム差、トーナメント: 勝数 → 試合数
+        Index("ix_standings_contest_wins_diff", "contest_id", "wins", "game_difference"),
+        Index("ix_standings_contest_wins_played", "contest_id", "wins", "matches_played"),
+    )
+
+    contest_id: Mapped[uuid.UUID] = mapped_column(
+        BinaryUUID,
+        ForeignKey("contests.contest_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    player_id: Mapped[uuid.UUID] = mapped_column(
+        BinaryUUID,
+        ForeignKey("players.player_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    wins: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    losses: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    matches_played: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    game_wins: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    game_losses: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    game_difference: Mapped[int] = mapped_column(
+        Integer, Computed("game_wins - game_losses", persisted=True)
+    )
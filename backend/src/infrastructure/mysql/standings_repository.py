@@ -0,0 +1,220 @@
+"""Standings MySQL リポジトリ実装"""
+import uuid
+from collections import defaultdict
+
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    Select,
+    and_,
+    bindparam,
+    case,
+    cast,
+    exists,
+    func,
+    or_,
+    select,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.contest.value_objects import ContestFormat
+from src.domain.match.value_objects import MatchStatus
+from src.domain.standings.repository import StandingsRepository
+from src.domain.standings.standing import Standing, StandingDelta
+from src.infrastructure.mysql.models import (
+    ContestModel,
+    MatchModel,
+    PlayerModel,
+    StandingModel,
+)
+
+_COUNTERS = ("wins", "losses", "matches_played", "game_wins", "game_losses")
+
+
+class MySQLStandingsRepository(StandingsRepository):
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def apply(self, contest_id: uuid.UUID, deltas: list[StandingDelta]) -> None:
+        """プレイヤーでない側（BYE・TBD）は行がないため更新されない。
+        総当たりでは相手がプレイヤーでない試合の分も加算せず、rebuild() の集計と揃える。
+        """
+        # 同じ対戦の増分（結果の修正時の取り消し＋再加算）はまとめる
+        merged: dict[tuple[uuid.UUID, uuid.UUID], dict[str, int]] = defaultdict(
+            lambda: dict.fromkeys(_COUNTERS, 0)
+        )
+        for delta in deltas:
+            for col in _COUNTERS:
+                merged[delta.player_id, delta.opponent_id][col] += getattr(delta, col)
+        params = [
+            {
+                "b_contest_id": contest_id,
+                "b_player_id": player_id,
+                "b_opponent_id": opponent_id,
+                **{f"d_{col}": value for col, value in counters.items()},
+            }
+            for (player_id, opponent_id), counters in merged.items()
+            if any(counters.values())
+        ]
+        if not params:
+            return
+
+        opponent_entered = exists().where(
+            PlayerModel.contest_id == bindparam("b_contest_id"),
+            PlayerModel.player_id == bindparam("b_opponent_id"),
+        )
+        not_round_robin = exists().where(
+            ContestModel.contest_id == bindparam("b_contest_id"),
+            ContestModel.format != ContestFormat.ROUND_ROBIN,
+        )
+        stmt = (
+            update(StandingModel)
+            .where(
+                StandingModel.contest_id == bindparam("b_contest_id"),
+                StandingModel.player_id == bindparam("b_player_id"),
+                or_(opponent_entered, not_round_robin),
+            )
+            .values(
+                {
+                    col: getattr(StandingModel, col) + bindparam(f"d_{col}")
+                    for col in _COUNTERS
+                }
+            )
+            # 主キー指定の一括 UPDATE ではなく、この文を executemany で実行する
+            .execution_options(dml_strategy="core_only")
+        )
+        await self._session.execute(stmt, params)
+
+    async def find_version(self, contest_id: uuid.UUID) -> int | None:
+        version: int | None = await self._session.scalar(
+            select(ContestModel.version).where(ContestModel.contest_id == contest_id)
+        )
+        return version
+
+    async def find_by_contest_id(self, contest_id: uuid.UUID) -> list[Standing] | None:
+        contest_format = await self.find_format(contest_id)
+        if contest_format is None:
+            return None
+
+        tiebreak = (
+            StandingModel.game_difference
+            if contest_format == ContestFormat.ROUND_ROBIN
+            else StandingModel.matches_played
+        )
+        result = await self._session.execute(
+            select(
+                StandingModel.player_id,
+                PlayerModel.name.label("player_name"),
+                *(StandingModel.__table__.c[col] for col in _COUNTERS),
+            )
+            .join(PlayerModel, PlayerModel.player_id == StandingModel.player_id)
+            .where(StandingModel.contest_id == contest_id)
+            .order_by(
+                StandingModel.wins.desc(),
+                tiebreak.desc(),
+                StandingModel.player_id.desc(),
+            )
+        )
+        return [Standing(**row._mapping) for row in result]
+
+    async def compute(self, contest_id: uuid.UUID) -> list[Standing] | None:
+        """rebuild() と同じ集計を書き込まずに順位順で返す。
+        API は実体化した順位表を読むため、集計の検証とベンチマークでのみ使う。
+        """
+        contest_format = await self.find_format(contest_id)
+        if contest_format is None:
+            return None
+
+        stmt = self._aggregate(contest_id, contest_format)
+        c = stmt.selected_columns
+        tiebreak = (
+            c.game_wins - c.game_losses
+            if contest_format == ContestFormat.ROUND_ROBIN
+            else c.matches_played
+        )
+        result = await self._session.execute(
+            stmt.add_columns(PlayerModel.name.label("player_name")).order_by(
+                c.wins.desc(), tiebreak.desc(), c.player_id.desc()
+            )
+        )
+        return [
+            Standing(
+                player_id=row.player_id,
+                player_name=row.player_name,
+                **{col: row._mapping[col] for col in _COUNTERS},
+            )
+            for row in result
+        ]
+
+    async def rebuild(self, contest_id: uuid.UUID) -> None:
+        contest_format = await self.find_format(contest_id)
+        if contest_format is None:
+            return
+        columns = ["contest_id", "player_id", *_COUNTERS]
+        stmt = insert(StandingModel).from_select(
+            columns, self._aggregate(contest_id, contest_format)
+        )
+        stmt = stmt.on_duplicate_key_update(
+            {col: stmt.inserted[col] for col in _COUNTERS}
+        )
+        await self._session.execute(stmt)
+
+    async def find_format(self, contest_id: uuid.UUID) -> ContestFormat | None:
+        contest_format: ContestFormat | None = await self._session.scalar(
+            select(ContestModel.format).where(ContestModel.contest_id == contest_id)
+        )
+        return contest_format
+
+    def _aggregate(
+        self, contest_id: uuid.UUID, contest_format: ContestFormat
+    ) -> Select[tuple[uuid.UUID, uuid.UUID, int, int, int, int, int]]:
+        """完了試合を player1 側・player2 側の2行に展開し、プレイヤーごとに集計する。
+        試合数が N^2/2 でも、結果はプレイヤー数 N 行しか返らない。
+        """
+        m = MatchModel
+        completed = and_(m.contest_id == contest_id, m.status == MatchStatus.COMPLETED)
+        if contest_format == ContestFormat.ROUND_ROBIN:
+            # 総当たりでは、どちらかがプレイヤーでない試合（BYE など）は数えない
+            entrants = select(PlayerModel.player_id).where(
+                PlayerModel.contest_id == contest_id
+            )
+            completed = and_(
+                completed, m.player1_id.in_(entrants), m.player2_id.in_(entrants)
+            )
+
+        sides = union_all(
+            select(
+                m.player1_id.label("player_id"),
+                case((m.player1_wins > m.player2_wins, 1), else_=0).label("won"),
+                m.player1_wins.label("game_wins"),
+                m.player2_wins.label("game_losses"),
+            ).where(completed),
+            select(
+                m.player2_id,
+                case((m.player2_wins > m.player1_wins, 1), else_=0),
+                m.player2_wins,
+                m.player1_wins,
+            ).where(completed),
+        ).subquery("sides")
+
+        def total(expr: ColumnElement[int]) -> ColumnElement[int]:
+            return cast(func.coalesce(func.sum(expr), 0), Integer)
+
+        return (
+            select(
+                PlayerModel.contest_id,
+                PlayerModel.player_id,
+                total(sides.c.won).label("wins"),
+                total(1 - sides.c.won).label("losses"),
+                func.count(sides.c.won).label("matches_played"),
+                total(sides.c.game_wins).label("game_wins"),
+                total(sides.c.game_losses).label("game_losses"),
+            )
+            .select_from(PlayerModel)
+            .outerjoin(sides, sides.c.player_id == PlayerModel.player_id)
+            .where(PlayerModel.contest_id == contest_id)
+            .group_by(PlayerModel.player_id)
+        )
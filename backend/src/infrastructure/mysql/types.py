@@ -0,0 +1,29 @@
+"""SQLAlchemy カスタム型"""
+import uuid
+
+from sqlalchemy.dialects.mysql import BINARY
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator
+
+
+class BinaryUUID(TypeDecorator[uuid.UUID]):
+    """UUID を BINARY(16) で保存し、uuid.UUID として読み出す"""
+
+    impl = BINARY(16)
+    cache_ok = True
+
+    def process_bind_param(
+        self, value: uuid.UUID | str | None, dialect: Dialect
+    ) -> bytes | None:
+        if value is None:
+            return None
+        if isinstance(value, str):
+            value = uuid.UUID(value)
+        return value.bytes
+
+    def process_result_value(
+        self, value: bytes | None, dialect: Dialect
+    ) -> uuid.UUID | None:
+        if value is None:
+            return None
+        return uuid.UUID(bytes=value)
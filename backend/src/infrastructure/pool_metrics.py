@@ -0,0 +1,97 @@
+"""接続プールの計測
+
+InstrumentedQueuePool を create_async_engine の poolclass に指定すると、
+接続取得にかかった時間をヒストグラムに記録する。
+snapshot() でチェックアウト中・アイドル・オーバーフロー接続数と合わせて取得できる。
+"""
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+# 取得待ち時間ヒストグラムのバケット上限（ミリ秒）。最後のバケットは上限なし
+WAIT_BUCKETS_MS: tuple[float, ...] = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+@dataclass(frozen=True)
+class WaitHistogram:
+    buckets_ms: tuple[float, ...]
+    counts: tuple[int, ...]  # 各バケットの件数（累積ではない）。末尾は上限超過分
+    count: int
+    sum_ms: float
+
+
+@dataclass(frozen=True)
+class PoolSnapshot:
+    pool_size: int
+    checked_out: int
+    idle: int
+    overflow: int
+    timeouts: int
+    acquire_wait: WaitHistogram
+
+
+class AcquireWaitRecorder:
+    def __init__(self, buckets_ms: tuple[float, ...] = WAIT_BUCKETS_MS) -> None:
+        self._buckets_ms = buckets_ms
+        self._counts = [0] * (len(buckets_ms) + 1)
+        self._sum_ms = 0.0
+        self._timeouts = 0
+        self._lock = threading.Lock()
+
+    def observe(self, wait_ms: float) -> None:
+        index = next(
+            (i for i, upper in enumerate(self._buckets_ms) if wait_ms <= upper),
+            len(self._buckets_ms),
+        )
+        with self._lock:
+            self._counts[index] += 1
+            self._sum_ms += wait_ms
+
+    def observe_timeout(self) -> None:
+        with self._lock:
+            self._timeouts += 1
+
+    @property
+    def timeouts(self) -> int:
+        return self._timeouts
+
+    def histogram(self) -> WaitHistogram:
+        with self._lock:
+            return WaitHistogram(
+                buckets_ms=self._buckets_ms,
+                counts=tuple(self._counts),
+                count=sum(self._counts),
+                sum_ms=self._sum_ms,
+            )
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.acquire_wait = AcquireWaitRecorder()
+
+    def connect(self) -> PoolProxiedConnection:
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.acquire_wait.observe_timeout()
+            raise
+        finally:
+            self.acquire_wait.observe((time.perf_counter() - start) * 1000)
+
+
+def snapshot(pool: InstrumentedQueuePool) -> PoolSnapshot:
+    return PoolSnapshot(
+        pool_size=pool.size(),
+        checked_out=pool.checkedout(),
+        idle=pool.checkedin(),
+        # overflow() は pool_size 未満のとき負の値を返す
+        overflow=max(pool.overflow(), 0),
+        timeouts=pool.acquire_wait.timeouts,
+        acquire_wait=pool.acquire_wait.histogram(),
+    )
@@ -1,8 +1,9 @@
 """Contest ルーター"""
+from datetime import datetime
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 
 from src.application.contest.commands import (
     AddPlayerCommand,
@@ -12,10 +13,13 @@ from src.application.contest.commands import (
 )
 from src.application.contest.handlers import ContestCommandHandler, ContestQueryHandler
 from src.application.contest.queries import GetContestQuery, ListContestsQuery
+from src.domain.contest.value_objects import ContestStatus
 from src.presentation.api.schemas.contest import (
     ContestCreate,
+    ContestPageResponse,
     ContestResponse,
     ContestStatusUpdate,
+    ContestSummaryResponse,
     PlayerCreate,
     PlayerResponse,
 )
@@ -48,12 +52,42 @@ def _build_response(dto) -> ContestResponse:  # type: ignore[no-untyped-def]
     )
 
 
-@router.get("", response_model=list[ContestResponse])
+@router.get("", response_model=ContestPageResponse)
 async def list_contests(
     handler: Annotated[ContestQueryHandler, Depends(get_contest_query_handler)],
-) -> list[ContestResponse]:
-    dtos = await handler.handle_list(ListContestsQuery())
-    return [_build_response(dto) for dto in dtos]
+    limit: Annotated[int, Query(ge=1, le=200)] = 50,
+    cursor: str | None = None,
+    status_filter: Annotated[ContestStatus | None, Query(alias="status")] = None,
+    game_title_id: UUID | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+) -> ContestPageResponse:
+    page = await handler.handle_list(
+        ListContestsQuery(
+            limit=limit,
+            cursor=cursor,
+            status=status_filter,
+            game_title_id=game_title_id,
+            created_from=created_from,
+            created_to=created_to,
+        )
+    )
+    return ContestPageResponse(
+        items=[
+            ContestSummaryResponse(
+                contest_id=s.contest_id,
+                name=s.name,
+                game_title_id=s.game_title_id,
+                format=s.format,
+                best_of=s.best_of,
+                status=s.status,
+                created_at=s.created_at,
+                player_count=s.player_count,
+            )
+            for s in page.items
+        ],
+        next_cursor=page.next_cursor,
+    )
 
 
 @router.post("", response_model=ContestResponse, status_code=status.HTTP_201_CREATED)
@@ -2,20 +2,32 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Response, status
 
 from src.application.match.commands import (
     AddMatchCommand,
+    CallNextMatchCommand,
     DeleteMatchCommand,
     GenerateBracketCommand,
+    GenerateNextRoundCommand,
+    GenerateTopCutCommand,
     RecordMatchResultCommand,
 )
 from src.application.match.handlers import MatchCommandHandler, MatchQueryHandler
-from src.application.match.queries import GetMatchesQuery
+from src.application.match.queries import (
+    GeneratedBracketDTO,
+    GetBracketQuery,
+    GetMatchesQuery,
+    GetPlayerPathQuery,
+)
 from src.presentation.api.schemas.match import (
+    BracketGenerationResponse,
+    BracketResponse,
     MatchCreate,
     MatchResponse,
     MatchResultUpdate,
+    PlayerPathResponse,
+    StationAssignmentResponse,
 )
 from src.presentation.dependencies import (
     get_match_command_handler,
@@ -39,6 +51,22 @@ def _build_response(dto) -> MatchResponse:  # type: ignore[no-untyped-def]
         status=dto.status,
         round=dto.round,
         match_order=dto.match_order,
+        next_match_id=dto.next_match_id,
+        next_match_slot=dto.next_match_slot,
+        loser_next_match_id=dto.loser_next_match_id,
+        loser_next_match_slot=dto.loser_next_match_slot,
+        pool=dto.pool,
+        station=dto.station,
+    )
+
+
+def _build_generation_response(dto: GeneratedBracketDTO) -> BracketGenerationResponse:
+    return BracketGenerationResponse(
+        total=dto.total,
+        matches=[_build_response(m) for m in dto.matches],
+        inserted=dto.inserted,
+        updated=dto.updated,
+        deleted=dto.deleted,
     )
 
 
@@ -51,19 +79,123 @@ async def list_matches(
     return [_build_response(dto) for dto in dtos]
 
 
+@router.get("/bracket", response_model=BracketResponse)
+async def get_bracket(
+    contest_id: UUID,
+    handler: Annotated[MatchQueryHandler, Depends(get_match_query_handler)],
+) -> BracketResponse:
+    """シングルエリミネーション（決勝トーナメント）の表を配列で返す"""
+    dto = await handler.handle_get_bracket(GetBracketQuery(contest_id=contest_id))
+    return BracketResponse(
+        contest_id=dto.contest_id,
+        size=dto.size,
+        player_ids=dto.player_ids,
+        slots=dto.slots,
+        match_ids=dto.match_ids,
+    )
+
+
+@router.get("/bracket/players/{player_id}", response_model=PlayerPathResponse)
+async def get_player_path(
+    contest_id: UUID,
+    player_id: UUID,
+    handler: Annotated[MatchQueryHandler, Depends(get_match_query_handler)],
+) -> PlayerPathResponse:
+    """決勝トーナメントでプレイヤーが次に戦う試合と、決勝までの経路を返す"""
+    dto = await handler.handle_get_player_path(
+        GetPlayerPathQuery(contest_id=contest_id, player_id=player_id)
+    )
+    return PlayerPathResponse(
+        player_id=dto.player_id,
+        current_match_id=dto.current_match_id,
+        path=dto.path,
+    )
+
+
 @router.post(
     "/generate",
-    response_model=list[MatchResponse],
+    response_model=BracketGenerationResponse,
     status_code=status.HTTP_201_CREATED,
 )
 async def generate_bracket(
     contest_id: UUID,
     handler: Annotated[MatchCommandHandler, Depends(get_match_command_handler)],
-) -> list[MatchResponse]:
-    dtos = await handler.handle_generate_bracket(
-        GenerateBracketCommand(contest_id=contest_id)
+    page_size: Annotated[int, Query(ge=0, le=500)] = 50,
+    grand_final_reset: bool = True,
+    pool_size: Annotated[int, Query(ge=2)] = 8,
+) -> BracketGenerationResponse:
+    """生成した試合数と先頭 page_size 件を返す。全件は GET で取得する。
+    既に試合があれば保存済みの試合との差分のみを書き込む。
+    """
+    dto = await handler.handle_generate_bracket(
+        GenerateBracketCommand(
+            contest_id=contest_id,
+            page_size=page_size,
+            grand_final_reset=grand_final_reset,
+            pool_size=pool_size,
+        )
+    )
+    return _build_generation_response(dto)
+
+
+@router.post(
+    "/next-round",
+    response_model=BracketGenerationResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def generate_next_round(
+    contest_id: UUID,
+    handler: Annotated[MatchCommandHandler, Depends(get_match_command_handler)],
+    page_size: Annotated[int, Query(ge=0, le=500)] = 50,
+) -> BracketGenerationResponse:
+    """スイス式の次のラウンドを生成する"""
+    dto = await handler.handle_generate_next_round(
+        GenerateNextRoundCommand(contest_id=contest_id, page_size=page_size)
+    )
+    return _build_generation_response(dto)
+
+
+@router.post(
+    "/top-cut",
+    response_model=BracketGenerationResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def generate_top_cut(
+    contest_id: UUID,
+    handler: Annotated[MatchCommandHandler, Depends(get_match_command_handler)],
+    advance_per_pool: Annotated[int, Query(ge=1)] = 2,
+    page_size: Annotated[int, Query(ge=0, le=500)] = 50,
+) -> BracketGenerationResponse:
+    """予選リーグの各プール上位で決勝トーナメントを生成する"""
+    dto = await handler.handle_generate_top_cut(
+        GenerateTopCutCommand(
+            contest_id=contest_id,
+            advance_per_pool=advance_per_pool,
+            page_size=page_size,
+        )
+    )
+    return _build_generation_response(dto)
+
+
+@router.post(
+    "/call",
+    response_model=StationAssignmentResponse,
+    responses={204: {"description": "No free station or no match can be called"}},
+)
+async def call_next_match(
+    contest_id: UUID,
+    stations: Annotated[int, Query(ge=1, le=1000)],
+    handler: Annotated[MatchCommandHandler, Depends(get_match_command_handler)],
+) -> StationAssignmentResponse | Response:
+    """空いている台に、後のラウンドを最も待たせている試合を割り当てる"""
+    dto = await handler.handle_call_next_match(
+        CallNextMatchCommand(contest_id=contest_id, stations=stations)
+    )
+    if dto is None:
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+    return StationAssignmentResponse(
+        station=dto.station, match=_build_response(dto.match)
     )
-    return [_build_response(dto) for dto in dtos]
 
 
 @router.post("", response_model=MatchResponse, status_code=status.HTTP_201_CREATED)
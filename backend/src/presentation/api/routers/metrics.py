@@ -0,0 +1,39 @@
+"""Metrics ルーター"""
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+
+from src.infrastructure.pool_metrics import PoolSnapshot
+from src.presentation.api.schemas.metrics import (
+    PoolMetricsResponse,
+    WaitHistogramResponse,
+)
+from src.presentation.dependencies import get_pool_snapshots
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("/pool", response_model=list[PoolMetricsResponse])
+async def get_pool_metrics(
+    snapshots: Annotated[dict[str, PoolSnapshot], Depends(get_pool_snapshots)],
+) -> list[PoolMetricsResponse]:
+    """接続プールごとの状態。レプリカを設定していれば読み取り側のプールも返す"""
+    return [_build_response(role, s) for role, s in snapshots.items()]
+
+
+def _build_response(role: str, snapshot: PoolSnapshot) -> PoolMetricsResponse:
+    wait = snapshot.acquire_wait
+    return PoolMetricsResponse(
+        role=role,
+        pool_size=snapshot.pool_size,
+        checked_out=snapshot.checked_out,
+        idle=snapshot.idle,
+        overflow=snapshot.overflow,
+        timeouts=snapshot.timeouts,
+        acquire_wait=WaitHistogramResponse(
+            buckets_ms=list(wait.buckets_ms),
+            counts=list(wait.counts),
+            count=wait.count,
+            sum_ms=wait.sum_ms,
+        ),
+    )
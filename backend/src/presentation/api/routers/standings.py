@@ -2,22 +2,54 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query, Response
 
 from src.application.standings.handlers import StandingsQueryHandler
 from src.application.standings.queries import GetStandingsQuery
-from src.presentation.api.schemas.standings import StandingsEntryResponse, StandingsResponse
+from src.domain.standings.tiebreak import Tiebreaker
+from src.presentation.api.schemas.standings import (
+    StandingsEntryResponse,
+    StandingsResponse,
+)
 from src.presentation.dependencies import get_standings_query_handler
 
 router = APIRouter(prefix="/contests/{contest_id}/standings", tags=["standings"])
 
 
-@router.get("", response_model=StandingsResponse)
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match（弱い比較）に etag が含まれるか"""
+    candidates = [c.strip().removeprefix("W/") for c in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+@router.get(
+    "",
+    response_model=StandingsResponse,
+    responses={304: {"description": "Not Modified"}},
+)
 async def get_standings(
     contest_id: UUID,
+    response: Response,
     handler: Annotated[StandingsQueryHandler, Depends(get_standings_query_handler)],
-) -> StandingsResponse:
-    dto = await handler.handle_get_standings(GetStandingsQuery(contest_id=contest_id))
+    if_none_match: Annotated[str | None, Header()] = None,
+    tiebreakers: Annotated[list[Tiebreaker] | None, Query()] = None,
+) -> StandingsResponse | Response:
+    version = await handler.handle_get_version(GetStandingsQuery(contest_id=contest_id))
+    if version is not None:
+        # 版数が変わらない限り順位表も変わらない
+        etag = f'"{version}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if if_none_match is not None and _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+        response.headers.update(headers)
+
+    dto = await handler.handle_get_standings(
+        GetStandingsQuery(
+            contest_id=contest_id,
+            version=version,
+            tiebreakers=tuple(tiebreakers) if tiebreakers else None,
+        )
+    )
     return StandingsResponse(
         contest_id=dto.contest_id,
         entries=[
@@ -29,6 +61,8 @@ async def get_standings(
                 matches_played=e.matches_played,
                 game_wins=e.game_wins,
                 game_losses=e.game_losses,
+                rank=e.rank,
+                tiebreaks=e.tiebreaks,
             )
             for e in dto.entries
         ],
@@ -39,3 +39,19 @@ class ContestResponse(BaseModel):
     status: ContestStatus
     created_at: datetime
     players: list[PlayerResponse]
+
+
+class ContestSummaryResponse(BaseModel):
+    contest_id: UUID
+    name: str
+    game_title_id: UUID
+    format: ContestFormat
+    best_of: int
+    status: ContestStatus
+    created_at: datetime
+    player_count: int
+
+
+class ContestPageResponse(BaseModel):
+    items: list[ContestSummaryResponse]
+    next_cursor: str | None
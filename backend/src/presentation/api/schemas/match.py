@@ -34,3 +34,46 @@ class MatchResponse(BaseModel):
     status: MatchStatus
     round: int | None
     match_order: int
+    # 勝者の進出先（トーナメントのみ）
+    next_match_id: UUID | None = None
+    next_match_slot: int | None = None
+    # 敗者の落ち先（ダブルエリミネーションのみ）
+    loser_next_match_id: UUID | None = None
+    loser_next_match_slot: int | None = None
+    # 予選リーグのプール番号（決勝トーナメントは null）
+    pool: int | None = None
+    station: int | None = None
+
+
+class BracketGenerationResponse(BaseModel):
+    total: int
+    # 先頭 page_size 件の試合
+    matches: list[MatchResponse]
+    # 書き込んだ行数（再生成では保存済みの試合との差分のみ）
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+
+
+class BracketResponse(BaseModel):
+    """二分ヒープの並びのトーナメント表。節点 i の子は 2i と 2i+1、決勝が 1。
+    slots[1..size-1] は各試合の勝者、slots[size..] は1回戦の枠で、
+    値は player_ids の添字（未定・BYE は -1）。
+    """
+
+    contest_id: UUID
+    size: int
+    player_ids: list[UUID]
+    slots: list[int]
+    match_ids: list[UUID | None]
+
+
+class PlayerPathResponse(BaseModel):
+    player_id: UUID
+    current_match_id: UUID | None
+    path: list[UUID]
+
+
+class StationAssignmentResponse(BaseModel):
+    station: int
+    match: MatchResponse
@@ -0,0 +1,20 @@
+"""Metrics Pydantic スキーマ"""
+from pydantic import BaseModel
+
+
+class WaitHistogramResponse(BaseModel):
+    buckets_ms: list[float]
+    counts: list[int]
+    count: int
+    sum_ms: float
+
+
+class PoolMetricsResponse(BaseModel):
+    # primary（書き込み）または replica（読み取り）
+    role: str
+    pool_size: int
+    checked_out: int
+    idle: int
+    overflow: int
+    timeouts: int
+    acquire_wait: WaitHistogramResponse
@@ -12,6 +12,9 @@ class StandingsEntryResponse(BaseModel):
     matches_played: int
     game_wins: int
     game_losses: int
+    rank: int
+    # 同率の解消に使ったタイブレークの値
+    tiebreaks: dict[str, float]
 
 
 class StandingsResponse(BaseModel):
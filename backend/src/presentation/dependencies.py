@@ -1,8 +1,11 @@
-"""FastAPI 依存性注入設定"""
+"""FastAPI 依存性注入設定
+
+コマンドハンドラはプライマリ、クエリハンドラは読み取り用セッションを使う。
+"""
 from collections.abc import AsyncGenerator
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Cookie, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.contest.handlers import ContestCommandHandler, ContestQueryHandler
@@ -10,15 +13,42 @@ from src.application.game_title.handlers import (
     GameTitleCommandHandler,
     GameTitleQueryHandler,
 )
+from src.application.match.cache import BracketCache, SchedulerCache
 from src.application.match.handlers import MatchCommandHandler, MatchQueryHandler
+from src.application.standings.cache import StandingsCache
 from src.application.standings.handlers import StandingsQueryHandler
 from src.domain.match.bracket_generator import BracketGenerator
-from src.infrastructure.database import get_db_session
+from src.infrastructure.database import (
+    get_db_session,
+    get_pools,
+    get_read_db_session,
+)
 from src.infrastructure.mysql.contest_repository import MySQLContestRepository
 from src.infrastructure.mysql.game_title_repository import MySQLGameTitleRepository
 from src.infrastructure.mysql.match_repository import MySQLMatchRepository
+from src.infrastructure.mysql.standings_repository import MySQLStandingsRepository
+from src.infrastructure.pool_metrics import PoolSnapshot, snapshot
+from src.infrastructure.settings import Settings
+
+_settings = Settings()
+# ワーカープロセス内で共有する順位表キャッシュ
+_standings_cache = StandingsCache(maxsize=_settings.standings_cache_size)
+_bracket_cache = BracketCache(maxsize=_settings.bracket_cache_size)
+_scheduler_cache = SchedulerCache(maxsize=_settings.scheduler_cache_size)
+
+# 書き込み成功時に main のミドルウェアが設定する Cookie（UNIX 秒）
+LAST_WRITE_COOKIE = "last_write_at"
+
+
+async def get_read_session(
+    last_write_at: Annotated[float | None, Cookie()] = None,
+) -> AsyncGenerator[AsyncSession, None]:
+    async for session in get_read_db_session(last_write_at):
+        yield session
+
 
 DbSession = Annotated[AsyncSession, Depends(get_db_session)]
+ReadDbSession = Annotated[AsyncSession, Depends(get_read_session)]
 
 
 async def get_game_title_repo(
@@ -39,6 +69,36 @@ async def get_match_repo(
     return MySQLMatchRepository(session)
 
 
+async def get_standings_repo(
+    session: DbSession,
+) -> MySQLStandingsRepository:
+    return MySQLStandingsRepository(session)
+
+
+async def get_read_game_title_repo(
+    session: ReadDbSession,
+) -> MySQLGameTitleRepository:
+    return MySQLGameTitleRepository(session)
+
+
+async def get_read_contest_repo(
+    session: ReadDbSession,
+) -> MySQLContestRepository:
+    return MySQLContestRepository(session)
+
+
+async def get_read_match_repo(
+    session: ReadDbSession,
+) -> MySQLMatchRepository:
+    return MySQLMatchRepository(session)
+
+
+async def get_read_standings_repo(
+    session: ReadDbSession,
+) -> MySQLStandingsRepository:
+    return MySQLStandingsRepository(session)
+
+
 async def get_game_title_command_handler(
     repo: Annotated[MySQLGameTitleRepository, Depends(get_game_title_repo)],
 ) -> GameTitleCommandHandler:
@@ -46,7 +106,7 @@ async def get_game_title_command_handler(
 
 
 async def get_game_title_query_handler(
-    repo: Annotated[MySQLGameTitleRepository, Depends(get_game_title_repo)],
+    repo: Annotated[MySQLGameTitleRepository, Depends(get_read_game_title_repo)],
 ) -> GameTitleQueryHandler:
     return GameTitleQueryHandler(repo)
 
@@ -58,7 +118,7 @@ async def get_contest_command_handler(
 
 
 async def get_contest_query_handler(
-    repo: Annotated[MySQLContestRepository, Depends(get_contest_repo)],
+    repo: Annotated[MySQLContestRepository, Depends(get_read_contest_repo)],
 ) -> ContestQueryHandler:
     return ContestQueryHandler(repo)
 
@@ -66,18 +126,38 @@ async def get_contest_query_handler(
 async def get_match_command_handler(
     contest_repo: Annotated[MySQLContestRepository, Depends(get_contest_repo)],
     match_repo: Annotated[MySQLMatchRepository, Depends(get_match_repo)],
+    standings_repo: Annotated[MySQLStandingsRepository, Depends(get_standings_repo)],
 ) -> MatchCommandHandler:
-    return MatchCommandHandler(contest_repo, match_repo, BracketGenerator())
+    return MatchCommandHandler(
+        contest_repo,
+        match_repo,
+        BracketGenerator(),
+        standings_repo,
+        _scheduler_cache,
+    )
 
 
 async def get_match_query_handler(
-    match_repo: Annotated[MySQLMatchRepository, Depends(get_match_repo)],
+    contest_repo: Annotated[MySQLContestRepository, Depends(get_read_contest_repo)],
+    match_repo: Annotated[MySQLMatchRepository, Depends(get_read_match_repo)],
 ) -> MatchQueryHandler:
-    return MatchQueryHandler(match_repo)
+    return MatchQueryHandler(contest_repo, match_repo, _bracket_cache)
 
 
 async def get_standings_query_handler(
-    contest_repo: Annotated[MySQLContestRepository, Depends(get_contest_repo)],
-    match_repo: Annotated[MySQLMatchRepository, Depends(get_match_repo)],
+    contest_repo: Annotated[MySQLContestRepository, Depends(get_read_contest_repo)],
+    match_repo: Annotated[MySQLMatchRepository, Depends(get_read_match_repo)],
+    standings_repo: Annotated[
+        MySQLStandingsRepository, Depends(get_read_standings_repo)
+    ],
 ) -> StandingsQueryHandler:
-    return StandingsQueryHandler(contest_repo, match_repo)
+    return StandingsQueryHandler(
+        contest_repo,
+        match_repo,
+        standings_repo,
+        _standings_cache,
+    )
+
+
+async def get_pool_snapshots() -> dict[str, PoolSnapshot]:
+    return {role: snapshot(pool) for role, pool in get_pools().items()}
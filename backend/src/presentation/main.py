@@ -1,12 +1,25 @@
 """FastAPI アプリケーション起動点"""
-from fastapi import FastAPI, Request
+import time
+from collections.abc import Awaitable, Callable
+
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
-from src.application.contest.handlers import ContestNotFoundError
+from src.application.contest.handlers import ContestNotFoundError, InvalidCursorError
 from src.domain.contest.contest import ContestModificationError
 from src.domain.contest.value_objects import InvalidStatusTransitionError
-from src.presentation.api.routers import contests, game_titles, matches, standings
+from src.infrastructure.settings import Settings
+from src.presentation.api.routers import (
+    contests,
+    game_titles,
+    matches,
+    metrics,
+    standings,
+)
+from src.presentation.dependencies import LAST_WRITE_COOKIE
+
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
 
 app = FastAPI(title="Contest Manager API", version="0.1.0")
 
@@ -18,10 +31,31 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+_settings = Settings()
+
+
+@app.middleware("http")
+async def mark_last_write(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """書き込みに成功したクライアントへ時刻を返し、直後の読み取りをプライマリに向ける"""
+    response = await call_next(request)
+    if request.method in WRITE_METHODS and response.status_code < 400:
+        response.set_cookie(
+            LAST_WRITE_COOKIE,
+            str(time.time()),
+            max_age=max(1, int(_settings.replica_max_lag_seconds) + 1),
+            httponly=True,
+            samesite="lax",
+        )
+    return response
+
+
 app.include_router(game_titles.router, prefix="/api/v1")
 app.include_router(contests.router, prefix="/api/v1")
 app.include_router(matches.router, prefix="/api/v1")
 app.include_router(standings.router, prefix="/api/v1")
+app.include_router(metrics.router)
 
 
 @app.exception_handler(ContestNotFoundError)
@@ -45,6 +79,13 @@ async def modification_error_handler(
     return JSONResponse(status_code=409, content={"detail": str(exc)})
 
 
+@app.exception_handler(InvalidCursorError)
+async def invalid_cursor_handler(
+    request: Request, exc: InvalidCursorError
+) -> JSONResponse:
+    return JSONResponse(status_code=400, content={"detail": str(exc)})
+
+
 @app.get("/health")
 async def health_check() -> dict[str, str]:
     return {"status": "ok"}
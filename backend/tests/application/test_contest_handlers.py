@@ -15,9 +15,11 @@ from src.application.contest.handlers import (
     ContestCommandHandler,
     ContestNotFoundError,
     ContestQueryHandler,
+    InvalidCursorError,
 )
 from src.application.contest.queries import ListContestsQuery
 from src.domain.contest.contest import Contest, ContestModificationError
+from src.domain.contest.contest_summary import ContestSummary
 from src.domain.contest.value_objects import ContestFormat, ContestStatus, InvalidStatusTransitionError
 
 
@@ -42,6 +44,19 @@ def make_contest(
     return contest
 
 
+def make_summary() -> ContestSummary:
+    return ContestSummary(
+        contest_id=uuid.uuid4(),
+        name="Test Contest",
+        game_title_id=uuid.uuid4(),
+        format=ContestFormat.ROUND_ROBIN,
+        best_of=3,
+        status=ContestStatus.PRE_REGISTRATION,
+        created_at=datetime.now(),
+        player_count=4,
+    )
+
+
 class TestContestCommandHandler:
     def setup_method(self) -> None:
         self.mock_repo = AsyncMock()
@@ -129,13 +144,57 @@ class TestContestQueryHandler:
         self.handler = ContestQueryHandler(self.mock_repo)
 
     async def test_コンテスト一覧を取得できる(self) -> None:
-        contests = [make_contest(), make_contest()]
-        self.mock_repo.find_all.return_value = contests
+        summaries = [make_summary(), make_summary()]
+        self.mock_repo.find_summaries.return_value = summaries
 
         from src.application.contest.queries import ListContestsQuery
         result = await self.handler.handle_list(ListContestsQuery())
 
-        assert len(result) == 2
+        assert len(result.items) == 2
+        assert result.items[0].player_count == 4
+        assert result.next_cursor is None
+
+    async def test_次のページがあるときカーソルを返す(self) -> None:
+        summaries = [make_summary(), make_summary(), make_summary()]
+        self.mock_repo.find_summaries.return_value = summaries
+
+        first = await self.handler.handle_list(ListContestsQuery(limit=2))
+
+        assert len(first.items) == 2
+        assert first.next_cursor is not None
+        self.mock_repo.find_summaries.return_value = []
+        await self.handler.handle_list(
+            ListContestsQuery(limit=2, cursor=first.next_cursor)
+        )
+        after = self.mock_repo.find_summaries.call_args.kwargs["after"]
+        assert after == (summaries[1].created_at, summaries[1].contest_id)
+
+    async def test_不正なカーソルは例外(self) -> None:
+        with pytest.raises(InvalidCursorError):
+            await self.handler.handle_list(ListContestsQuery(cursor="not-a-cursor"))
+
+    async def test_状態とゲームタイトルで絞り込める(self) -> None:
+        self.mock_repo.find_summaries.return_value = []
+        game_title_id = uuid.uuid4()
+        created_from = datetime(2026, 10, 12)
+
+        await self.handler.handle_list(
+            ListContestsQuery(
+                limit=10,
+                status=ContestStatus.IN_PROGRESS,
+                game_title_id=game_title_id,
+                created_from=created_from,
+            )
+        )
+
+        self.mock_repo.find_summaries.assert_called_once_with(
+            limit=11,
+            after=None,
+            status=ContestStatus.IN_PROGRESS,
+            game_title_id=game_title_id,
+            created_from=created_from,
+            created_to=None,
+        )
 
     async def test_コンテストが見つからない場合例外が発生する(self) -> None:
         self.mock_repo.find_by_id.return_value = None
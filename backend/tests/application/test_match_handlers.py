@@ -1,13 +1,17 @@
 """Match ハンドラのテスト"""
 import uuid
 from datetime import datetime
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from src.application.match.cache import BracketCache, SchedulerCache
 from src.application.match.commands import (
+    CallNextMatchCommand,
     DeleteMatchCommand,
     GenerateBracketCommand,
+    GenerateNextRoundCommand,
+    GenerateTopCutCommand,
     RecordMatchResultCommand,
 )
 from src.application.match.handlers import (
@@ -15,10 +19,15 @@ from src.application.match.handlers import (
     MatchNotFoundError,
     MatchQueryHandler,
 )
-from src.application.match.queries import GetMatchesQuery, MatchDTO
+from src.application.match.queries import (
+    GetBracketQuery,
+    GetMatchesQuery,
+    GetPlayerPathQuery,
+    MatchDTO,
+)
 from src.domain.contest.contest import Contest, ContestModificationError
 from src.domain.contest.value_objects import ContestFormat, ContestStatus
-from src.domain.match.bracket_generator import BracketGenerator
+from src.domain.match.bracket_generator import TBD_PLAYER_ID, BracketGenerator
 from src.domain.match.match import Match
 from src.domain.match.value_objects import MatchStatus
 
@@ -65,6 +74,8 @@ class TestMatchCommandHandler:
     def setup_method(self) -> None:
         self.mock_contest_repo = AsyncMock()
         self.mock_match_repo = AsyncMock()
+        # 試合未生成のコンテスト
+        self.mock_match_repo.find_by_contest_id.return_value = []
         self.bracket_generator = BracketGenerator()
         self.handler = MatchCommandHandler(
             self.mock_contest_repo,
@@ -79,10 +90,162 @@ class TestMatchCommandHandler:
         command = GenerateBracketCommand(contest_id=contest.contest_id)
         result = await self.handler.handle_generate_bracket(command)
 
-        assert len(result) == 1  # 2人なので1試合
-        assert all(isinstance(dto, MatchDTO) for dto in result)
+        assert result.total == 1  # 2人なので1試合
+        assert all(isinstance(dto, MatchDTO) for dto in result.matches)
         self.mock_match_repo.save_all.assert_called_once()
 
+    async def test_総当たりはチャンクごとに保存し先頭ページだけ返す(self) -> None:
+        from src.application.match.handlers import GENERATE_CHUNK_SIZE
+
+        contest = make_contest()
+        for i in range(44):
+            contest.add_player(name=f"Player{i}", seed=i + 3)
+        self.mock_contest_repo.find_by_id.return_value = contest
+
+        result = await self.handler.handle_generate_bracket(
+            GenerateBracketCommand(contest_id=contest.contest_id, page_size=10)
+        )
+
+        # 46人 → 1035試合
+        assert result.total == 1035
+        assert [m.match_order for m in result.matches] == list(range(1, 11))
+        saved = [call.args[0] for call in self.mock_match_repo.save_all.call_args_list]
+        assert [len(chunk) for chunk in saved] == [GENERATE_CHUNK_SIZE, 35]
+        # 版数はチャンクごとではなく1回だけ進める
+        self.mock_match_repo.bump_version.assert_awaited_once_with(contest.contest_id)
+
+    async def test_再生成は保存済みの試合との差分だけを書き込む(self) -> None:
+        contest = make_contest()
+        contest.add_player(name="Charlie", seed=3)
+        self.mock_contest_repo.find_by_id.return_value = contest
+        stored = self.bracket_generator.generate_round_robin(contest)
+        stored[0].record_result(None, None, 2, 0, None, best_of=3)
+        self.mock_match_repo.find_by_contest_id.return_value = stored
+
+        result = await self.handler.handle_generate_bracket(
+            GenerateBracketCommand(contest_id=contest.contest_id)
+        )
+
+        assert result.total == 3
+        assert (result.inserted, result.updated, result.deleted) == (0, 0, 0)
+        assert {m.match_id for m in result.matches} == {m.match_id for m in stored}
+        self.mock_match_repo.save_all.assert_not_called()
+        self.mock_match_repo.apply_diff.assert_called_once()
+
+    async def test_スイス式は第2ラウンドの生成後に再生成できない(self) -> None:
+        contest = make_contest(format=ContestFormat.SWISS)
+        self.mock_contest_repo.find_by_id.return_value = contest
+        second = make_match(contest.contest_id)
+        second.round = 2
+        self.mock_match_repo.find_by_contest_id.return_value = [
+            *self.bracket_generator.generate_swiss_round(contest, []),
+            second,
+        ]
+
+        with pytest.raises(ContestModificationError):
+            await self.handler.handle_generate_bracket(
+                GenerateBracketCommand(contest_id=contest.contest_id)
+            )
+        self.mock_match_repo.apply_diff.assert_not_called()
+
+    async def test_決勝トーナメントの生成後は予選リーグを再生成できない(self) -> None:
+        contest = make_contest(format=ContestFormat.POOL_PLAY)
+        self.mock_contest_repo.find_by_id.return_value = contest
+        top_cut = make_match(contest.contest_id)
+        self.mock_match_repo.find_by_contest_id.return_value = [
+            *self.bracket_generator.iter_pools(contest, 2),
+            top_cut,
+        ]
+
+        with pytest.raises(ContestModificationError):
+            await self.handler.handle_generate_bracket(
+                GenerateBracketCommand(contest_id=contest.contest_id)
+            )
+        self.mock_match_repo.apply_diff.assert_not_called()
+
+    async def test_ブラケットを生成できる_DOUBLE_ELIMINATION(self) -> None:
+        contest = make_contest(format=ContestFormat.DOUBLE_ELIMINATION)
+        self.mock_contest_repo.find_by_id.return_value = contest
+
+        result = await self.handler.handle_generate_bracket(
+            GenerateBracketCommand(
+                contest_id=contest.contest_id, grand_final_reset=False
+            )
+        )
+
+        # 2人: 勝者側決勝 + グランドファイナル
+        assert result.total == 2
+        first = result.matches[0]
+        assert first.next_match_id == result.matches[1].match_id
+        assert first.loser_next_match_id == result.matches[1].match_id
+
+    async def test_スイス式の次のラウンドを生成できる(self) -> None:
+        contest = make_contest(format=ContestFormat.SWISS)
+        contest.add_player(name="Charlie", seed=3)
+        self.mock_contest_repo.find_by_id.return_value = contest
+        first = self.bracket_generator.generate_swiss_round(contest, [])
+        for m in first:
+            if m.status == MatchStatus.PENDING:
+                m.record_result(None, None, 2, 1, None, best_of=3)
+        self.mock_match_repo.find_by_contest_id.return_value = first
+
+        result = await self.handler.handle_generate_next_round(
+            GenerateNextRoundCommand(contest_id=contest.contest_id)
+        )
+
+        assert result.total == 2  # 1試合 + 不戦勝
+        assert {m.round for m in result.matches} == {2}
+        self.mock_match_repo.save_all.assert_called_once()
+        # 前のラウンドを読む前にコンテストをロックする
+        calls = [c[0] for c in self.mock_match_repo.mock_calls]
+        assert calls.index("lock_contest") < calls.index("find_by_contest_id")
+        self.mock_match_repo.lock_contest.assert_awaited_once_with(contest.contest_id)
+
+    async def test_ラウンドが終わっていなければ次を生成できない(self) -> None:
+        contest = make_contest(format=ContestFormat.SWISS)
+        self.mock_contest_repo.find_by_id.return_value = contest
+        self.mock_match_repo.find_by_contest_id.return_value = [
+            make_match(contest.contest_id)
+        ]
+
+        with pytest.raises(ContestModificationError):
+            await self.handler.handle_generate_next_round(
+                GenerateNextRoundCommand(contest_id=contest.contest_id)
+            )
+        self.mock_match_repo.save_all.assert_not_called()
+
+    async def test_予選リーグ完了後に決勝トーナメントを生成できる(self) -> None:
+        contest = make_contest(format=ContestFormat.POOL_PLAY)
+        for i in range(2):
+            contest.add_player(name=f"Player{i}", seed=i + 3)
+        self.mock_contest_repo.find_by_id.return_value = contest
+        pools = list(self.bracket_generator.iter_pools(contest, pool_size=2))
+        for m in pools:
+            m.record_result(None, None, 2, 0, None, best_of=3)
+        self.mock_match_repo.find_by_contest_id.return_value = pools
+
+        result = await self.handler.handle_generate_top_cut(
+            GenerateTopCutCommand(contest_id=contest.contest_id, advance_per_pool=1)
+        )
+
+        assert result.total == 1  # 2プールの1位どうしの決勝
+        assert result.matches[0].pool is None
+
+    async def test_予選リーグが終わっていなければ決勝トーナメントを生成できない(
+        self,
+    ) -> None:
+        contest = make_contest(format=ContestFormat.POOL_PLAY)
+        self.mock_contest_repo.find_by_id.return_value = contest
+        self.mock_match_repo.find_by_contest_id.return_value = list(
+            self.bracket_generator.iter_pools(contest, pool_size=2)
+        )
+
+        with pytest.raises(ContestModificationError):
+            await self.handler.handle_generate_top_cut(
+                GenerateTopCutCommand(contest_id=contest.contest_id)
+            )
+        self.mock_match_repo.save_all.assert_not_called()
+
     async def test_ブラケット生成時にコンテストが見つからない場合例外(self) -> None:
         from src.application.contest.handlers import ContestNotFoundError
         self.mock_contest_repo.find_by_id.return_value = None
@@ -94,8 +257,7 @@ class TestMatchCommandHandler:
     async def test_試合結果を記録できる(self) -> None:
         contest = make_contest(status=ContestStatus.IN_PROGRESS)
         match = make_match(contest_id=contest.contest_id)
-        self.mock_contest_repo.find_by_id.return_value = contest
-        self.mock_match_repo.find_by_id.return_value = match
+        self.mock_match_repo.find_for_result.return_value = (contest.best_of, match, True)
 
         command = RecordMatchResultCommand(
             contest_id=contest.contest_id,
@@ -112,11 +274,194 @@ class TestMatchCommandHandler:
         assert result.player1_wins == 2
         assert result.player2_wins == 1
         assert result.player1_character == "Ryu"
+        self.mock_match_repo.update_result.assert_called_once_with(match)
+        self.mock_contest_repo.find_by_id.assert_not_called()
+
+    async def test_勝者を次の試合に進める(self) -> None:
+        contest = make_contest(status=ContestStatus.IN_PROGRESS)
+        match = make_match(contest_id=contest.contest_id)
+        match.next_match_id = uuid.uuid4()
+        match.next_match_slot = 2
+        self.mock_match_repo.find_for_result.return_value = (contest.best_of, match, True)
+        self.mock_match_repo.advance_player.return_value = True
+
+        await self.handler.handle_record_result(
+            RecordMatchResultCommand(
+                contest_id=contest.contest_id,
+                match_id=match.match_id,
+                player1_character=None,
+                player2_character=None,
+                player1_wins=0,
+                player2_wins=2,
+                comment=None,
+            )
+        )
+
+        self.mock_match_repo.advance_player.assert_called_once_with(
+            match.next_match_id, 2, match.player2_id
+        )
+
+    async def test_敗者を敗者側の試合に落とす(self) -> None:
+        contest = make_contest(status=ContestStatus.IN_PROGRESS)
+        match = make_match(contest_id=contest.contest_id)
+        match.next_match_id = uuid.uuid4()
+        match.next_match_slot = 1
+        match.loser_next_match_id = uuid.uuid4()
+        match.loser_next_match_slot = 2
+        self.mock_match_repo.find_for_result.return_value = (contest.best_of, match, True)
+        self.mock_match_repo.advance_player.return_value = True
+
+        await self.handler.handle_record_result(
+            RecordMatchResultCommand(
+                contest_id=contest.contest_id,
+                match_id=match.match_id,
+                player1_character=None,
+                player2_character=None,
+                player1_wins=2,
+                player2_wins=0,
+                comment=None,
+            )
+        )
+
+        assert [c.args for c in self.mock_match_repo.advance_player.call_args_list] == [
+            (match.next_match_id, 1, match.player1_id),
+            (match.loser_next_match_id, 2, match.player2_id),
+        ]
+
+    def grand_final(self, contest: Contest, round: int = 4) -> Match:
+        """勝者・敗者ともリセット戦に進むグランドファイナル"""
+        match = make_match(contest_id=contest.contest_id)
+        match.round = round
+        match.next_match_id = match.loser_next_match_id = uuid.uuid4()
+        match.next_match_slot, match.loser_next_match_slot = 1, 2
+        self.mock_match_repo.find_for_result.return_value = (3, match, True)
+        self.mock_match_repo.set_players.return_value = True
+        return match
+
+    def result(self, match: Match, p1_wins: int, p2_wins: int) -> RecordMatchResultCommand:
+        return RecordMatchResultCommand(
+            contest_id=match.contest_id,
+            match_id=match.match_id,
+            player1_character=None,
+            player2_character=None,
+            player1_wins=p1_wins,
+            player2_wins=p2_wins,
+            comment=None,
+        )
+
+    async def test_勝者側の優勝者がグランドファイナルに勝てばリセット戦は行わない(
+        self,
+    ) -> None:
+        match = self.grand_final(make_contest(status=ContestStatus.IN_PROGRESS))
+
+        await self.handler.handle_record_result(self.result(match, 2, 1))
+
+        self.mock_match_repo.advance_player.assert_not_called()
+        ((reset_id, player1_id, player2_id, status),) = [
+            c.args for c in self.mock_match_repo.set_players.call_args_list
+        ]
+        assert reset_id == match.next_match_id
+        assert status == MatchStatus.COMPLETED
+        assert player1_id == TBD_PLAYER_ID
+        assert player2_id not in (match.player1_id, match.player2_id, TBD_PLAYER_ID)
+
+    async def test_敗者側の勝者がグランドファイナルに勝てばリセット戦を行う(
+        self,
+    ) -> None:
+        match = self.grand_final(make_contest(status=ContestStatus.IN_PROGRESS))
+
+        await self.handler.handle_record_result(self.result(match, 1, 2))
+
+        self.mock_match_repo.advance_player.assert_not_called()
+        self.mock_match_repo.set_players.assert_called_once_with(
+            match.next_match_id,
+            match.player2_id,
+            match.player1_id,
+            MatchStatus.PENDING,
+        )
+
+    async def test_2人の勝者側の試合は勝者も敗者もグランドファイナルに進む(
+        self,
+    ) -> None:
+        match = self.grand_final(
+            make_contest(status=ContestStatus.IN_PROGRESS), round=1
+        )
+        self.mock_match_repo.advance_player.return_value = True
+
+        await self.handler.handle_record_result(self.result(match, 2, 1))
+
+        self.mock_match_repo.set_players.assert_not_called()
+        assert [c.args for c in self.mock_match_repo.advance_player.call_args_list] == [
+            (match.next_match_id, 1, match.player1_id),
+            (match.next_match_id, 2, match.player2_id),
+        ]
+
+    async def test_リセット戦の後はグランドファイナルの勝者を変更できない(
+        self,
+    ) -> None:
+        match = self.grand_final(make_contest(status=ContestStatus.IN_PROGRESS))
+        self.mock_match_repo.set_players.return_value = False
+
+        with pytest.raises(ContestModificationError):
+            await self.handler.handle_record_result(self.result(match, 2, 0))
+
+    async def test_次の試合が完了済みなら勝者を変更できない(self) -> None:
+        contest = make_contest(status=ContestStatus.IN_PROGRESS)
+        match = make_match(contest_id=contest.contest_id)
+        match.record_result(None, None, 2, 0, None, best_of=3)
+        match.next_match_id = uuid.uuid4()
+        match.next_match_slot = 1
+        self.mock_match_repo.find_for_result.return_value = (contest.best_of, match, True)
+        self.mock_match_repo.advance_player.return_value = False
+
+        def command(p1_wins: int, p2_wins: int) -> RecordMatchResultCommand:
+            return RecordMatchResultCommand(
+                contest_id=contest.contest_id,
+                match_id=match.match_id,
+                player1_character=None,
+                player2_character=None,
+                player1_wins=p1_wins,
+                player2_wins=p2_wins,
+                comment=None,
+            )
+
+        # 勝者が変わらない修正では進出先を更新しない
+        await self.handler.handle_record_result(command(2, 1))
+        self.mock_match_repo.advance_player.assert_not_called()
+
+        with pytest.raises(ContestModificationError):
+            await self.handler.handle_record_result(command(1, 2))
+
+    async def test_対戦者が決まっていない試合には結果を記録できない(self) -> None:
+        contest = make_contest(status=ContestStatus.IN_PROGRESS)
+        match = make_match(contest_id=contest.contest_id)
+        match.player1_id = TBD_PLAYER_ID
+        match.next_match_id = uuid.uuid4()
+        match.next_match_slot = 1
+        self.mock_match_repo.find_for_result.return_value = (
+            contest.best_of,
+            match,
+            False,
+        )
+
+        with pytest.raises(ContestModificationError):
+            await self.handler.handle_record_result(
+                RecordMatchResultCommand(
+                    contest_id=contest.contest_id,
+                    match_id=match.match_id,
+                    player1_character=None,
+                    player2_character=None,
+                    player1_wins=2,
+                    player2_wins=0,
+                    comment=None,
+                )
+            )
+        self.mock_match_repo.advance_player.assert_not_called()
+        self.mock_match_repo.update_result.assert_not_called()
 
     async def test_試合結果記録時に試合が見つからない場合例外(self) -> None:
         contest = make_contest()
-        self.mock_contest_repo.find_by_id.return_value = contest
-        self.mock_match_repo.find_by_id.return_value = None
+        self.mock_match_repo.find_for_result.return_value = (contest.best_of, None, False)
 
         command = RecordMatchResultCommand(
             contest_id=contest.contest_id,
@@ -130,6 +475,37 @@ class TestMatchCommandHandler:
         with pytest.raises(MatchNotFoundError):
             await self.handler.handle_record_result(command)
 
+    async def test_試合結果記録時にコンテストが見つからない場合例外(self) -> None:
+        from src.application.contest.handlers import ContestNotFoundError
+        self.mock_match_repo.find_for_result.return_value = None
+
+        command = RecordMatchResultCommand(
+            contest_id=uuid.uuid4(),
+            match_id=uuid.uuid4(),
+            player1_character=None,
+            player2_character=None,
+            player1_wins=2,
+            player2_wins=1,
+            comment=None,
+        )
+        with pytest.raises(ContestNotFoundError):
+            await self.handler.handle_record_result(command)
+
+    async def test_別のコンテストの試合は削除できない(self) -> None:
+        contest = make_contest()
+        self.mock_contest_repo.find_by_id.return_value = contest
+        other = make_match()
+        other.record_result(None, None, 2, 0, None, best_of=3)
+        self.mock_match_repo.find_by_id.return_value = other
+
+        with pytest.raises(MatchNotFoundError):
+            await self.handler.handle_delete_match(
+                DeleteMatchCommand(
+                    contest_id=contest.contest_id, match_id=other.match_id
+                )
+            )
+        self.mock_match_repo.delete.assert_not_called()
+
     async def test_IN_PROGRESS中は試合を削除できない(self) -> None:
         contest = make_contest(status=ContestStatus.IN_PROGRESS)
         self.mock_contest_repo.find_by_id.return_value = contest
@@ -142,10 +518,197 @@ class TestMatchCommandHandler:
             await self.handler.handle_delete_match(command)
 
 
+class TestCallNextMatch:
+    def setup_method(self) -> None:
+        self.mock_contest_repo = AsyncMock()
+        self.mock_match_repo = AsyncMock()
+        # コミットに成功したものとして、登録された処理をその場で呼ぶ
+        self.mock_match_repo.after_commit = MagicMock(
+            side_effect=lambda callback: callback()
+        )
+        self.handler = MatchCommandHandler(
+            self.mock_contest_repo,
+            self.mock_match_repo,
+            BracketGenerator(),
+            scheduler_cache=SchedulerCache(),
+        )
+        self.contest = make_contest(format=ContestFormat.SINGLE_ELIMINATION)
+        for i in range(6):
+            self.contest.add_player(name=f"Player{i}", seed=i + 3)
+        self.mock_contest_repo.find_by_id.return_value = self.contest
+        self.mock_match_repo.find_version.return_value = 1
+        self.mock_match_repo.find_by_contest_id.return_value = (
+            BracketGenerator().generate_single_elimination(self.contest)
+        )
+        self.command = CallNextMatchCommand(
+            contest_id=self.contest.contest_id, stations=2
+        )
+
+    async def test_空いている台に試合を割り当てる(self) -> None:
+        self.mock_match_repo.assign_station.return_value = True
+
+        first = await self.handler.handle_call_next_match(self.command)
+        second = await self.handler.handle_call_next_match(self.command)
+        third = await self.handler.handle_call_next_match(self.command)
+
+        assert first is not None and second is not None
+        assert (first.station, second.station) == (1, 2)
+        assert first.match.station == 1
+        assert first.match.match_id != second.match.match_id
+        assert third is None
+        # 版数が変わらない間はキューを組み直さない
+        self.mock_match_repo.find_by_contest_id.assert_called_once()
+        self.mock_match_repo.assign_station.assert_any_call(
+            self.contest.contest_id, first.match.match_id, 1
+        )
+
+    async def test_割り当てに失敗したら組み直して1度だけやり直す(self) -> None:
+        self.mock_match_repo.assign_station.side_effect = [False, True]
+
+        result = await self.handler.handle_call_next_match(self.command)
+
+        assert result is not None
+        assert self.mock_match_repo.find_by_contest_id.call_count == 2
+
+    async def test_再試行でも割り当てられなければ例外(self) -> None:
+        self.mock_match_repo.assign_station.return_value = False
+
+        with pytest.raises(ContestModificationError):
+            await self.handler.handle_call_next_match(self.command)
+
+    async def test_書き込めなかった割り当てはキューに残る(self) -> None:
+        self.mock_match_repo.assign_station.return_value = False
+        with pytest.raises(ContestModificationError):
+            await self.handler.handle_call_next_match(self.command)
+        self.mock_match_repo.assign_station.return_value = True
+
+        result = await self.handler.handle_call_next_match(self.command)
+
+        assert result is not None
+        assert result.station == 1
+        # 失敗時に組み直したキューを使い回す
+        assert self.mock_match_repo.find_by_contest_id.call_count == 2
+
+    async def test_コミットされなかった割り当てはキューに残る(self) -> None:
+        self.mock_match_repo.assign_station.return_value = True
+        # ロールバックされると登録した処理は呼ばれない
+        self.mock_match_repo.after_commit = MagicMock()
+
+        first = await self.handler.handle_call_next_match(self.command)
+        second = await self.handler.handle_call_next_match(self.command)
+
+        assert first is not None and second is not None
+        assert first.station == second.station == 1
+        assert first.match.match_id == second.match.match_id
+
+
+class TestMatchCommandHandlerStandings:
+    def setup_method(self) -> None:
+        self.mock_contest_repo = AsyncMock()
+        self.mock_match_repo = AsyncMock()
+        self.mock_match_repo.find_by_contest_id.return_value = []
+        self.mock_standings_repo = AsyncMock()
+        self.handler = MatchCommandHandler(
+            self.mock_contest_repo,
+            self.mock_match_repo,
+            BracketGenerator(),
+            self.mock_standings_repo,
+        )
+
+    def applied(self) -> dict[uuid.UUID, tuple[int, int, int, int, int]]:
+        """apply に渡された増分をプレイヤーごとに合計する"""
+        totals: dict[uuid.UUID, tuple[int, int, int, int, int]] = {}
+        for call in self.mock_standings_repo.apply.call_args_list:
+            for d in call.args[1]:
+                prev = totals.get(d.player_id, (0, 0, 0, 0, 0))
+                totals[d.player_id] = tuple(  # type: ignore[assignment]
+                    a + b
+                    for a, b in zip(
+                        prev,
+                        (d.wins, d.losses, d.matches_played, d.game_wins, d.game_losses),
+                    )
+                )
+        return totals
+
+    async def test_結果記録で順位表に加算する(self) -> None:
+        match = make_match()
+        self.mock_match_repo.find_for_result.return_value = (3, match, True)
+
+        await self.handler.handle_record_result(
+            RecordMatchResultCommand(
+                contest_id=match.contest_id,
+                match_id=match.match_id,
+                player1_character=None,
+                player2_character=None,
+                player1_wins=2,
+                player2_wins=1,
+                comment=None,
+            )
+        )
+
+        assert self.applied() == {
+            match.player1_id: (1, 0, 1, 2, 1),
+            match.player2_id: (0, 1, 1, 1, 2),
+        }
+
+    async def test_結果の修正では旧結果を取り消す(self) -> None:
+        match = make_match()
+        match.record_result(None, None, 2, 0, None, best_of=3)
+        self.mock_match_repo.find_for_result.return_value = (3, match, True)
+
+        await self.handler.handle_record_result(
+            RecordMatchResultCommand(
+                contest_id=match.contest_id,
+                match_id=match.match_id,
+                player1_character=None,
+                player2_character=None,
+                player1_wins=1,
+                player2_wins=2,
+                comment=None,
+            )
+        )
+
+        assert self.applied() == {
+            match.player1_id: (-1, 1, 0, -1, 2),
+            match.player2_id: (1, -1, 0, 2, -1),
+        }
+
+    async def test_完了済みの試合を削除すると取り消す(self) -> None:
+        contest = make_contest()
+        match = make_match(contest.contest_id)
+        match.record_result(None, None, 2, 1, None, best_of=3)
+        self.mock_contest_repo.find_by_id.return_value = contest
+        self.mock_match_repo.find_by_id.return_value = match
+
+        await self.handler.handle_delete_match(
+            DeleteMatchCommand(contest_id=contest.contest_id, match_id=match.match_id)
+        )
+
+        assert self.applied() == {
+            match.player1_id: (-1, 0, -1, -2, -1),
+            match.player2_id: (0, -1, -1, -1, -2),
+        }
+
+    async def test_ブラケット生成後に順位表を集計し直す(self) -> None:
+        contest = make_contest(format=ContestFormat.SINGLE_ELIMINATION)
+        contest.add_player(name="Charlie", seed=3)
+        self.mock_contest_repo.find_by_id.return_value = contest
+
+        await self.handler.handle_generate_bracket(
+            GenerateBracketCommand(contest_id=contest.contest_id)
+        )
+
+        self.mock_standings_repo.rebuild.assert_called_once_with(contest.contest_id)
+        self.mock_standings_repo.apply.assert_not_called()
+
+
 class TestMatchQueryHandler:
     def setup_method(self) -> None:
+        self.mock_contest_repo = AsyncMock()
         self.mock_match_repo = AsyncMock()
-        self.handler = MatchQueryHandler(self.mock_match_repo)
+        self.handler = MatchQueryHandler(
+            self.mock_contest_repo, self.mock_match_repo, BracketCache()
+        )
 
     async def test_コンテストの試合一覧を取得できる(self) -> None:
         contest_id = uuid.uuid4()
@@ -158,3 +721,73 @@ class TestMatchQueryHandler:
 
         assert len(result) == 2
         assert all(isinstance(dto, MatchDTO) for dto in result)
+
+    async def test_トーナメント表は版数が変わるまで組み立て直さない(self) -> None:
+        contest = make_contest(format=ContestFormat.SINGLE_ELIMINATION)
+        contest.add_player(name="Charlie", seed=3)
+        self.mock_contest_repo.find_by_id.return_value = contest
+        self.mock_match_repo.find_version.return_value = 5
+        self.mock_match_repo.find_by_contest_id.return_value = (
+            BracketGenerator().generate_single_elimination(contest)
+        )
+        query = GetBracketQuery(contest_id=contest.contest_id)
+
+        first = await self.handler.handle_get_bracket(query)
+        second = await self.handler.handle_get_bracket(query)
+
+        assert first == second
+        assert first.size == 4
+        assert len(first.slots) == 8
+        self.mock_match_repo.find_by_contest_id.assert_called_once()
+
+        self.mock_match_repo.find_version.return_value = 6
+        await self.handler.handle_get_bracket(query)
+
+        assert self.mock_match_repo.find_by_contest_id.call_count == 2
+
+    async def test_プレイヤーの次の試合と決勝までの経路を返す(self) -> None:
+        contest = make_contest(format=ContestFormat.SINGLE_ELIMINATION)
+        contest.add_player(name="Charlie", seed=3)
+        contest.add_player(name="Dave", seed=4)
+        self.mock_contest_repo.find_by_id.return_value = contest
+        self.mock_match_repo.find_version.return_value = 1
+        matches = BracketGenerator().generate_single_elimination(contest)
+        self.mock_match_repo.find_by_contest_id.return_value = matches
+        alice = contest.players[0].player_id
+        first = next(m for m in matches if alice in (m.player1_id, m.player2_id))
+
+        await self.handler.handle_get_bracket(
+            GetBracketQuery(contest_id=contest.contest_id)
+        )
+        result = await self.handler.handle_get_player_path(
+            GetPlayerPathQuery(contest_id=contest.contest_id, player_id=alice)
+        )
+
+        assert result.current_match_id == first.match_id
+        assert result.path == [first.match_id, first.next_match_id]
+        # 同じ版数のトーナメント表を使い回す
+        self.mock_match_repo.find_by_contest_id.assert_called_once()
+
+    async def test_トーナメントでない試合は表にできない(self) -> None:
+        contest = make_contest()
+        contest.add_player(name="Charlie", seed=3)
+        self.mock_contest_repo.find_by_id.return_value = contest
+        self.mock_match_repo.find_version.return_value = 1
+        self.mock_match_repo.find_by_contest_id.return_value = (
+            BracketGenerator().generate_round_robin(contest)
+        )
+
+        with pytest.raises(ContestModificationError):
+            await self.handler.handle_get_bracket(
+                GetBracketQuery(contest_id=contest.contest_id)
+            )
+
+    async def test_存在しないコンテストのトーナメント表は例外(self) -> None:
+        from src.application.contest.handlers import ContestNotFoundError
+
+        self.mock_match_repo.find_version.return_value = None
+
+        with pytest.raises(ContestNotFoundError):
+            await self.handler.handle_get_bracket(
+                GetBracketQuery(contest_id=uuid.uuid4())
+            )
@@ -5,12 +5,15 @@ from unittest.mock import AsyncMock
 
 import pytest
 
+from src.application.standings.cache import StandingsCache
 from src.application.standings.handlers import StandingsQueryHandler
 from src.application.standings.queries import GetStandingsQuery
 from src.domain.contest.contest import Contest
 from src.domain.contest.value_objects import ContestFormat, ContestStatus
 from src.domain.match.match import Match
 from src.domain.match.value_objects import MatchStatus
+from src.domain.standings.standing import Standing
+from src.domain.standings.tiebreak import Tiebreaker
 
 
 def make_contest(format: ContestFormat = ContestFormat.ROUND_ROBIN) -> Contest:
@@ -132,3 +135,112 @@ class TestStandingsQueryHandler:
             await self.handler.handle_get_standings(
                 GetStandingsQuery(contest_id=uuid.uuid4())
             )
+
+
+class TestStandingsQueryHandlerMaterialized:
+    def setup_method(self) -> None:
+        self.mock_contest_repo = AsyncMock()
+        self.mock_match_repo = AsyncMock()
+        self.mock_standings_repo = AsyncMock()
+        self.handler = StandingsQueryHandler(
+            self.mock_contest_repo,
+            self.mock_match_repo,
+            self.mock_standings_repo,
+        )
+
+    async def test_順位表テーブルをそのまま返す(self) -> None:
+        contest_id = uuid.uuid4()
+        standing = Standing(
+            player_id=uuid.uuid4(),
+            player_name="Alice",
+            wins=2,
+            losses=0,
+            matches_played=2,
+            game_wins=4,
+            game_losses=1,
+        )
+        self.mock_standings_repo.find_version.return_value = 1
+        self.mock_standings_repo.find_format.return_value = ContestFormat.ROUND_ROBIN
+        self.mock_standings_repo.find_by_contest_id.return_value = [standing]
+
+        result = await self.handler.handle_get_standings(
+            GetStandingsQuery(contest_id=contest_id)
+        )
+
+        assert result.entries[0].player_name == "Alice"
+        assert result.entries[0].wins == 2
+        self.mock_match_repo.find_by_contest_id.assert_not_called()
+
+    async def test_コンテストが見つからない場合例外(self) -> None:
+        from src.application.contest.handlers import ContestNotFoundError
+        self.mock_standings_repo.find_version.return_value = None
+
+        with pytest.raises(ContestNotFoundError):
+            await self.handler.handle_get_standings(
+                GetStandingsQuery(contest_id=uuid.uuid4())
+            )
+
+    async def test_同じ版数ならキャッシュから返す(self) -> None:
+        handler = StandingsQueryHandler(
+            self.mock_contest_repo,
+            self.mock_match_repo,
+            self.mock_standings_repo,
+            StandingsCache(maxsize=2),
+        )
+        contest_id = uuid.uuid4()
+        self.mock_standings_repo.find_version.return_value = 1
+        self.mock_standings_repo.find_format.return_value = ContestFormat.ROUND_ROBIN
+        self.mock_standings_repo.find_by_contest_id.return_value = []
+
+        first = await handler.handle_get_standings(GetStandingsQuery(contest_id))
+        second = await handler.handle_get_standings(GetStandingsQuery(contest_id))
+        self.mock_standings_repo.find_version.return_value = 2
+        await handler.handle_get_standings(GetStandingsQuery(contest_id))
+
+        assert second is first
+        assert self.mock_standings_repo.find_by_contest_id.call_count == 2
+
+    async def test_直接対決で同率を解消するときだけ試合を読む(self) -> None:
+        contest_id = uuid.uuid4()
+        alice, bob = (
+            Standing(
+                player_id=uuid.uuid4(),
+                player_name=name,
+                wins=1,
+                losses=1,
+                matches_played=2,
+                game_wins=3,
+                game_losses=3,
+            )
+            for name in ("Alice", "Bob")
+        )
+        self.mock_standings_repo.find_version.return_value = 1
+        self.mock_standings_repo.find_format.return_value = ContestFormat.ROUND_ROBIN
+        self.mock_standings_repo.find_by_contest_id.return_value = [alice, bob]
+        self.mock_match_repo.find_by_contest_id.return_value = [
+            Match(
+                match_id=uuid.uuid4(),
+                contest_id=contest_id,
+                player1_id=alice.player_id,
+                player2_id=bob.player_id,
+                player1_character=None,
+                player2_character=None,
+                player1_wins=1,
+                player2_wins=2,
+                comment=None,
+                status=MatchStatus.COMPLETED,
+                round=1,
+                match_order=1,
+            )
+        ]
+
+        result = await self.handler.handle_get_standings(
+            GetStandingsQuery(contest_id, tiebreakers=(Tiebreaker.HEAD_TO_HEAD,))
+        )
+
+        assert [(e.player_name, e.rank) for e in result.entries] == [
+            ("Bob", 1),
+            ("Alice", 2),
+        ]
+        assert result.entries[0].tiebreaks == {"HEAD_TO_HEAD": 1}
+        self.mock_match_repo.find_by_contest_id.assert_called_once_with(contest_id)
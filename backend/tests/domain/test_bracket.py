@@ -0,0 +1,129 @@
+"""配列で表したトーナメント表のテスト"""
+import uuid
+from datetime import datetime
+
+import pytest
+
+from src.domain.contest.contest import Contest
+from src.domain.contest.value_objects import ContestFormat, ContestStatus
+from src.domain.match.bracket import NO_PLAYER, Bracket
+from src.domain.match.bracket_generator import BracketGenerator
+from src.domain.match.match import Match
+
+
+def make_contest(n: int) -> Contest:
+    contest = Contest(
+        contest_id=uuid.uuid4(),
+        name="Test",
+        game_title_id=uuid.uuid4(),
+        format=ContestFormat.SINGLE_ELIMINATION,
+        best_of=3,
+        status=ContestStatus.PRE_REGISTRATION,
+        created_at=datetime.now(),
+        players=[],
+    )
+    for i in range(n):
+        contest.add_player(name=f"Player{i + 1}", seed=i + 1)
+    return contest
+
+
+def build(contest: Contest, matches: list[Match]) -> Bracket:
+    return Bracket.from_matches(matches, [p.player_id for p in contest.players])
+
+
+def win(matches: list[Match], match: Match, p1_wins: bool = True) -> None:
+    """結果を記録し、勝者を進出先の枠に入れる"""
+    match.record_result(None, None, *((2, 0) if p1_wins else (0, 2)), None, best_of=3)
+    target = next((m for m in matches if m.match_id == match.next_match_id), None)
+    if target is not None:
+        if match.next_match_slot == 1:
+            target.player1_id = match.winner_id  # type: ignore[assignment]
+        else:
+            target.player2_id = match.winner_id  # type: ignore[assignment]
+
+
+class TestBracketFromMatches:
+    def test_決勝を根とするヒープ順に試合が並ぶ(self) -> None:
+        contest = make_contest(8)
+        matches = BracketGenerator().generate_single_elimination(contest)
+        by_id = {m.match_id: m for m in matches}
+
+        bracket = build(contest, matches)
+
+        assert bracket.size == 8
+        assert bracket.rounds == 3
+        for node in range(2, bracket.size):
+            match = by_id[bracket.match_ids[node]]  # type: ignore[index]
+            assert match.next_match_id == bracket.match_ids[Bracket.parent(node)]
+            assert match.next_match_slot == node % 2 + 1
+            assert match.round == bracket.rounds - node.bit_length() + 1
+
+    def test_1回戦の枠にシード順のプレイヤー添字が入る(self) -> None:
+        contest = make_contest(8)
+        matches = BracketGenerator().generate_single_elimination(contest)
+        bracket = build(contest, matches)
+
+        # 添字はシード - 1。1v8, 4v5, 2v7, 3v6 の順
+        assert list(bracket.slots[8:]) == [0, 7, 3, 4, 1, 6, 2, 5]
+        assert bracket.slots[8:10] == (0, 7)
+
+    def test_BYEの枠は空で勝者は次の試合に進んでいる(self) -> None:
+        contest = make_contest(6)
+        matches = BracketGenerator().generate_single_elimination(contest)
+        bracket = build(contest, matches)
+
+        assert bracket.slots[8:10] == (0, NO_PLAYER)
+        assert bracket.slots[4] == 0
+        assert bracket.slots[1] == NO_PLAYER
+
+    def test_決勝までの経路はラウンド数の長さ(self) -> None:
+        contest = make_contest(16)
+        matches = BracketGenerator().generate_single_elimination(contest)
+        bracket = build(contest, matches)
+        seed1 = contest.players[0].player_id
+
+        path = bracket.path(seed1)
+
+        assert len(path) == 4
+        assert path[-1] == bracket.match_ids[1]
+        first = next(m for m in matches if m.match_id == path[0])
+        assert seed1 in (first.player1_id, first.player2_id)
+        by_id = {m.match_id: m for m in matches}
+        assert all(by_id[a].next_match_id == b for a, b in zip(path, path[1:]))
+
+    def test_勝ち上がりに応じて次の試合が分かる(self) -> None:
+        contest = make_contest(4)
+        matches = BracketGenerator().generate_single_elimination(contest)
+        seed1, seed4 = contest.players[0].player_id, contest.players[3].player_id
+        first = next(m for m in matches if m.player1_id == seed1)
+        win(matches, first)
+
+        bracket = build(contest, matches)
+
+        assert bracket.current_match(seed1) == bracket.match_ids[1]
+        assert bracket.current_match(seed4) is None
+        assert bracket.match_ids[2] == first.match_id
+
+    def test_優勝者に次の試合はない(self) -> None:
+        contest = make_contest(2)
+        matches = BracketGenerator().generate_single_elimination(contest)
+        win(matches, matches[0])
+
+        bracket = build(contest, matches)
+
+        assert bracket.slots[1] == 0
+        assert bracket.current_match(contest.players[0].player_id) is None
+
+    def test_総当たりの試合は例外(self) -> None:
+        contest = make_contest(4)
+        matches = BracketGenerator().generate_round_robin(contest)
+
+        with pytest.raises(ValueError):
+            build(contest, matches)
+
+    def test_ダブルエリミネーションは例外(self) -> None:
+        contest = make_contest(8)
+        matches = BracketGenerator().generate_double_elimination(contest)
+
+        with pytest.raises(ValueError):
+            build(contest, matches)
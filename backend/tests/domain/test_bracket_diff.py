@@ -0,0 +1,145 @@
+"""ブラケット再生成の差分のテスト"""
+import uuid
+from datetime import datetime
+
+import pytest
+
+from src.domain.contest.contest import Contest
+from src.domain.contest.value_objects import ContestFormat, ContestStatus
+from src.domain.match.bracket_diff import diff_bracket
+from src.domain.match.bracket_generator import TBD_PLAYER_ID, BracketGenerator
+from src.domain.match.match import Match
+from src.domain.match.value_objects import MatchStatus
+
+
+def make_contest(n: int, format: ContestFormat) -> Contest:
+    contest = Contest(
+        contest_id=uuid.uuid4(),
+        name="Test",
+        game_title_id=uuid.uuid4(),
+        format=format,
+        best_of=3,
+        status=ContestStatus.PRE_REGISTRATION,
+        created_at=datetime.now(),
+        players=[],
+    )
+    for i in range(n):
+        contest.add_player(name=f"Player{i + 1}", seed=i + 1)
+    return contest
+
+
+def entrants(contest: Contest) -> set[uuid.UUID]:
+    return {p.player_id for p in contest.players}
+
+
+def win(matches: list[Match], match: Match) -> None:
+    """player1 の勝ちを記録し、勝者を進出先の枠に入れる"""
+    match.record_result("Ryu", "Ken", 2, 1, "GG", best_of=3)
+    target = next((m for m in matches if m.match_id == match.next_match_id), None)
+    if target is not None:
+        if match.next_match_slot == 1:
+            target.player1_id = match.player1_id
+        else:
+            target.player2_id = match.player1_id
+
+
+def generate(contest: Contest) -> list[Match]:
+    generator = BracketGenerator()
+    if contest.format == ContestFormat.ROUND_ROBIN:
+        return generator.generate_round_robin(contest)
+    if contest.format == ContestFormat.DOUBLE_ELIMINATION:
+        return generator.generate_double_elimination(contest)
+    return generator.generate_single_elimination(contest)
+
+
+class TestDiffBracket:
+    @pytest.mark.parametrize(
+        ("n", "format"),
+        [
+            (5, ContestFormat.ROUND_ROBIN),
+            (6, ContestFormat.SINGLE_ELIMINATION),
+            (8, ContestFormat.DOUBLE_ELIMINATION),
+            # 同じラウンドに TBD どうしの試合が並び、保存順だけでは対応付かない
+            (6, ContestFormat.DOUBLE_ELIMINATION),
+            (13, ContestFormat.DOUBLE_ELIMINATION),
+            (33, ContestFormat.DOUBLE_ELIMINATION),
+        ],
+    )
+    def test_同じ顔ぶれの再生成では何も書き込まない(
+        self, n: int, format: ContestFormat
+    ) -> None:
+        contest = make_contest(n, format)
+        stored = generate(contest)
+
+        diff = diff_bracket(generate(contest), stored, entrants(contest))
+
+        assert (diff.inserts, diff.updates, diff.deletes) == ([], [], [])
+        assert {m.match_id for m in diff.matches} == {m.match_id for m in stored}
+
+    def test_進行中のトーナメントは勝ち上がりごと残る(self) -> None:
+        contest = make_contest(8, ContestFormat.SINGLE_ELIMINATION)
+        generator = BracketGenerator()
+        stored = generator.generate_single_elimination(contest)
+        for match in [m for m in stored if m.round == 1][:2]:
+            win(stored, match)
+        semifinal = next(m for m in stored if m.round == 2)
+        assert TBD_PLAYER_ID not in (semifinal.player1_id, semifinal.player2_id)
+
+        diff = diff_bracket(
+            generator.generate_single_elimination(contest),
+            stored,
+            entrants(contest),
+        )
+
+        assert (diff.inserts, diff.updates, diff.deletes) == ([], [], [])
+        kept = {m.match_id: m for m in diff.matches}
+        assert kept[semifinal.match_id] == semifinal
+
+    def test_棄権者の未消化の試合だけを削除し結果は残す(self) -> None:
+        contest = make_contest(5, ContestFormat.ROUND_ROBIN)
+        generator = BracketGenerator()
+        stored = generator.generate_round_robin(contest)
+        for match in stored[:4]:
+            match.record_result(None, None, 2, 0, None, best_of=3)
+        dropped = contest.players[-1].player_id
+        contest.remove_player(dropped)
+
+        diff = diff_bracket(
+            generator.generate_round_robin(contest), stored, entrants(contest)
+        )
+
+        by_id = {m.match_id: m for m in stored}
+        assert diff.deletes
+        for match_id in diff.deletes:
+            deleted = by_id[match_id]
+            assert deleted.status == MatchStatus.PENDING
+            assert dropped in (deleted.player1_id, deleted.player2_id)
+        assert all(m.status == MatchStatus.PENDING for m in diff.inserts)
+        remaining = [m for m in stored if m.match_id not in diff.deletes]
+        pairs = [frozenset((m.player1_id, m.player2_id)) for m in remaining]
+        pairs += [frozenset((m.player1_id, m.player2_id)) for m in diff.inserts]
+        assert len(pairs) == len(set(pairs))
+        assert not any(dropped in pair for pair in pairs[len(remaining) :])
+
+    def test_向きが入れ替わった試合は結果も入れ替えて引き継ぐ(self) -> None:
+        contest = make_contest(2, ContestFormat.ROUND_ROBIN)
+        alice, bob = (p.player_id for p in contest.players)
+        stored = BracketGenerator().generate_round_robin(contest)
+        stored[0].player1_id, stored[0].player2_id = bob, alice
+        stored[0].record_result("Ryu", "Ken", 2, 1, None, best_of=3)
+
+        diff = diff_bracket(
+            BracketGenerator().generate_round_robin(contest),
+            stored,
+            entrants(contest),
+        )
+
+        (updated,) = diff.updates
+        assert updated.match_id == stored[0].match_id
+        assert (updated.player1_id, updated.player2_id) == (alice, bob)
+        assert (updated.player1_wins, updated.player2_wins) == (1, 2)
+        assert (updated.player1_character, updated.player2_character) == (
+            "Ken",
+            "Ryu",
+        )
+        assert updated.winner_id == bob
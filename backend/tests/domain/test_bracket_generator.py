@@ -7,7 +7,8 @@ import pytest
 from src.domain.contest.contest import Contest
 from src.domain.contest.player import Player
 from src.domain.contest.value_objects import ContestFormat, ContestStatus
-from src.domain.match.bracket_generator import BracketGenerator
+from src.domain.match.bracket_generator import TBD_PLAYER_ID, BracketGenerator
+from src.domain.match.match import Match
 from src.domain.match.value_objects import MatchStatus
 
 
@@ -76,7 +77,76 @@ class TestRoundRobinGeneration:
                 ) in match_pairs
 
 
+    @pytest.mark.parametrize("n", [4, 7, 10])
+    def test_round_robin_各ラウンドで同じプレイヤーは1試合まで(self, n: int) -> None:
+        contest = make_contest_with_players(n)
+        matches = BracketGenerator().generate_round_robin(contest)
+
+        rounds: dict[int, list[uuid.UUID]] = {}
+        for m in matches:
+            assert m.round is not None
+            rounds.setdefault(m.round, []).extend([m.player1_id, m.player2_id])
+
+        # 偶数は N-1 ラウンド、奇数は不戦を含めて N ラウンド
+        assert len(rounds) == (n - 1 if n % 2 == 0 else n)
+        for players in rounds.values():
+            assert len(players) == len(set(players))
+            assert len(players) == (n // 2) * 2
+        assert len({frozenset((m.player1_id, m.player2_id)) for m in matches}) == (
+            n * (n - 1) // 2
+        )
+
+    def test_round_robin_ラウンド順に連番が振られる(self) -> None:
+        contest = make_contest_with_players(6)
+        matches = BracketGenerator().generate_round_robin(contest)
+
+        keys = [(m.round, m.match_order) for m in matches]
+        assert keys == sorted(keys)  # type: ignore[type-var]
+        assert [m.match_order for m in matches] == list(range(1, 16))
+
+    def test_round_robin_遅延生成は一括生成と同じ組み合わせ(self) -> None:
+        contest = make_contest_with_players(5)
+        generator = BracketGenerator()
+
+        lazy = generator.iter_round_robin(contest)
+        first = next(lazy)
+        rest = list(lazy)
+
+        assert first.match_order == 1
+        assert len(rest) == 9
+        expected = generator.generate_round_robin(contest)
+        def key(m: Match) -> tuple[uuid.UUID, uuid.UUID, int]:
+            return (m.player1_id, m.player2_id, m.match_order)
+
+        assert [key(m) for m in [first, *rest]] == [key(m) for m in expected]
+
 class TestSingleEliminationGeneration:
+    def test_single_elimination_8人は標準シードで組まれる(self) -> None:
+        contest = make_contest_with_players(8, ContestFormat.SINGLE_ELIMINATION)
+        matches = BracketGenerator().generate_single_elimination(contest)
+
+        seeds = {p.player_id: p.seed for p in contest.players}
+        first_round = [
+            (seeds[m.player1_id], seeds[m.player2_id]) for m in matches if m.round == 1
+        ]
+        assert first_round == [(1, 8), (4, 5), (2, 7), (3, 6)]
+
+    def test_single_elimination_勝者の進出先が次ラウンドの試合に張られる(self) -> None:
+        contest = make_contest_with_players(6, ContestFormat.SINGLE_ELIMINATION)
+        matches = BracketGenerator().generate_single_elimination(contest)
+
+        by_id = {m.match_id: m for m in matches}
+        final = max(matches, key=lambda m: m.round or 0)
+        assert final.next_match_id is None
+        feeders: dict[uuid.UUID, list[int]] = {}
+        for m in matches:
+            if m is final:
+                continue
+            assert m.next_match_id is not None
+            assert by_id[m.next_match_id].round == (m.round or 0) + 1
+            feeders.setdefault(m.next_match_id, []).append(m.next_match_slot or 0)
+        assert all(sorted(slots) == [1, 2] for slots in feeders.values())
+
     def test_single_elimination_2人のとき1試合生成される(self) -> None:
         contest = make_contest_with_players(2, ContestFormat.SINGLE_ELIMINATION)
         generator = BracketGenerator()
@@ -134,3 +204,102 @@ class TestSingleEliminationGeneration:
             all_player_ids_in_matches.add(m.player2_id)
 
         assert len(all_player_ids_in_matches) == 4
+
+
+def play_out(matches: list[Match], upset: bool) -> dict[uuid.UUID, int]:
+    """進出先リンクだけを辿って全試合を消化し、プレイヤーごとの敗戦数を返す。
+    upset=True なら常に player2 が勝つ。
+    """
+    by_id = {m.match_id: m for m in matches}
+    losses: dict[uuid.UUID, int] = {}
+    reset = max(matches, key=lambda m: m.round or 0)
+    for m in sorted(matches, key=lambda m: m.match_order):
+        if m is reset and losses.get(m.player1_id, 0) == 0:
+            continue  # 勝者側の勝者がグランドファイナルで勝てばリセット戦は不要
+        assert TBD_PLAYER_ID not in (m.player1_id, m.player2_id)
+        m.record_result(None, None, *((1, 2) if upset else (2, 1)), None, best_of=3)
+        assert m.winner_id is not None and m.loser_id is not None
+        losses[m.loser_id] = losses.get(m.loser_id, 0) + 1
+        for next_id, slot, player_id in (
+            (m.next_match_id, m.next_match_slot, m.winner_id),
+            (m.loser_next_match_id, m.loser_next_match_slot, m.loser_id),
+        ):
+            if next_id is not None:
+                target = by_id[next_id]
+                if slot == 1:
+                    target.player1_id = player_id
+                else:
+                    target.player2_id = player_id
+    return losses
+
+
+class TestDoubleEliminationGeneration:
+    @pytest.mark.parametrize("n", [2, 4, 5, 8, 13, 16])
+    @pytest.mark.parametrize("upset", [False, True])
+    def test_double_elimination_全員が2敗するまで進出先で消化できる(
+        self, n: int, upset: bool
+    ) -> None:
+        contest = make_contest_with_players(n, ContestFormat.DOUBLE_ELIMINATION)
+        matches = BracketGenerator().generate_double_elimination(contest)
+
+        losses = play_out(matches, upset)
+
+        # 優勝者以外はちょうど2敗、優勝者は0敗か（リセット戦があれば）1敗
+        player_ids = {p.player_id for p in contest.players}
+        eliminated = {pid for pid, count in losses.items() if count == 2}
+        assert eliminated <= player_ids
+        assert len(eliminated) == n - 1
+        champion = (player_ids - eliminated).pop()
+        assert losses.get(champion, 0) == (1 if upset else 0)
+
+    @pytest.mark.parametrize("n", [2, 4, 8, 13])
+    def test_double_elimination_ラウンドは進出元より後(self, n: int) -> None:
+        contest = make_contest_with_players(n, ContestFormat.DOUBLE_ELIMINATION)
+        matches = BracketGenerator().generate_double_elimination(contest)
+
+        by_id = {m.match_id: m for m in matches}
+        for m in matches:
+            for next_id in (m.next_match_id, m.loser_next_match_id):
+                if next_id is not None:
+                    assert (by_id[next_id].round or 0) > (m.round or 0)
+
+    def test_double_elimination_敗者側は勝者側の同時期のラウンドに並ぶ(self) -> None:
+        contest = make_contest_with_players(4, ContestFormat.DOUBLE_ELIMINATION)
+        matches = BracketGenerator().generate_double_elimination(contest)
+
+        # 勝者側 3 + 敗者側 2 + グランドファイナル 1 + リセット 1
+        assert len(matches) == 7
+        assert all((m.round or 0) > 0 for m in matches)
+        # 勝者側 1,1,2 / 敗者側 2,3 / グランドファイナル 4 / リセット 5
+        assert sorted(m.round or 0 for m in matches) == [1, 1, 2, 2, 3, 4, 5]
+
+    def test_double_elimination_リセット戦なし(self) -> None:
+        contest = make_contest_with_players(4, ContestFormat.DOUBLE_ELIMINATION)
+        matches = BracketGenerator().generate_double_elimination(
+            contest, grand_final_reset=False
+        )
+
+        assert len(matches) == 6
+        assert matches[-1].next_match_id is None
+
+
+class TestSwissGeneration:
+    def test_swiss_ラウンドを重ねても再戦しない(self) -> None:
+        contest = make_contest_with_players(9, ContestFormat.SWISS)
+        generator = BracketGenerator()
+        played: list[Match] = []
+
+        for round_num in range(1, 5):
+            matches = generator.generate_swiss_round(contest, played)
+            assert {m.round for m in matches} == {round_num}
+            byes = [m for m in matches if m.comment == "BYE"]
+            assert len(byes) == 1 and byes[0].status == MatchStatus.COMPLETED
+            for m in matches:
+                if m.status == MatchStatus.PENDING:
+                    m.record_result(None, None, 2, 0, None, best_of=3)
+            played.extend(matches)
+
+        real = [m for m in played if m.comment != "BYE"]
+        pairs = {frozenset((m.player1_id, m.player2_id)) for m in real}
+        assert len(pairs) == len(real) == 16
+        assert [m.match_order for m in played] == list(range(1, 21))
@@ -50,6 +50,19 @@ class TestContestPlayerManagement:
 
         assert len(contest.players) == 0
 
+    def test_contest_追加と削除の差分を追跡する(self) -> None:
+        contest = make_contest()
+        alice = contest.add_player(name="Alice", seed=None)
+        contest.clear_player_changes()
+        bob = contest.add_player(name="Bob", seed=None)
+        carol = contest.add_player(name="Carol", seed=None)
+
+        contest.remove_player(alice.player_id)
+        contest.remove_player(carol.player_id)
+
+        assert contest.added_players == [bob]
+        assert contest.removed_player_ids == {alice.player_id}
+
     def test_contest_プレイヤーを追加できない_IN_PROGRESS中(self) -> None:
         contest = make_contest(status=ContestStatus.IN_PROGRESS)
 
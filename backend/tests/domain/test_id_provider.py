@@ -0,0 +1,26 @@
+"""ID プロバイダのテスト"""
+import time
+
+from src.domain.shared.id_provider import new_id
+
+
+class TestNewId:
+    def test_UUIDv7が発行される(self) -> None:
+        issued = new_id()
+
+        assert issued.version == 7
+        assert issued.variant == "specified in RFC 4122"
+
+    def test_先頭48bitに現在時刻のミリ秒が入る(self) -> None:
+        before = time.time_ns() // 1_000_000
+        issued = new_id()
+        after = time.time_ns() // 1_000_000
+
+        timestamp_ms = issued.int >> 80
+        assert before <= timestamp_ms <= after + 1
+
+    def test_連続発行しても単調増加する(self) -> None:
+        ids = [new_id() for _ in range(10000)]
+
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
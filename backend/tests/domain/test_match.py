@@ -59,6 +59,12 @@ class TestMatchRecordResult:
         assert match.player2_character == "Ken"
         assert match.comment == "Good game"
 
+    def test_match_結果を記録すると台が空く(self) -> None:
+        match = make_match(station=3)
+        match.record_result(None, None, 2, 0, None, best_of=3)
+
+        assert match.station is None
+
     def test_match_勝利数がbest_ofを超えると例外(self) -> None:
         match = make_match()
         with pytest.raises(ValueError, match="wins"):
@@ -82,3 +88,11 @@ class TestMatchRecordResult:
                 comment=None,
                 best_of=3,
             )
+
+    def test_match_勝者は完了後にのみ決まる(self) -> None:
+        match = make_match()
+        assert match.winner_id is None
+
+        match.record_result(None, None, 1, 2, None, best_of=3)
+
+        assert match.winner_id == match.player2_id
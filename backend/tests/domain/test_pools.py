@@ -0,0 +1,85 @@
+"""予選リーグ（プール）のテスト"""
+import uuid
+from datetime import datetime
+
+import pytest
+
+from src.domain.contest.contest import Contest
+from src.domain.contest.value_objects import ContestFormat, ContestStatus
+from src.domain.match.bracket_generator import BracketGenerator
+from src.domain.match.pools import pool_placings, seed_top_cut, split_into_pools
+
+
+def make_contest(n: int) -> Contest:
+    contest = Contest(
+        contest_id=uuid.uuid4(),
+        name="Test",
+        game_title_id=uuid.uuid4(),
+        format=ContestFormat.POOL_PLAY,
+        best_of=3,
+        status=ContestStatus.PRE_REGISTRATION,
+        created_at=datetime.now(),
+        players=[],
+    )
+    for i in range(n):
+        contest.add_player(name=f"Player{i + 1}", seed=i + 1)
+    return contest
+
+
+class TestSplitIntoPools:
+    def test_シード順に蛇行で割り振る(self) -> None:
+        contest = make_contest(8)
+
+        pools = split_into_pools(contest.players, pool_size=4)
+
+        seeds = [[p.seed for p in pool] for pool in pools]
+        assert seeds == [[1, 4, 5, 8], [2, 3, 6, 7]]
+
+    def test_各プールは2人以上になる(self) -> None:
+        contest = make_contest(5)
+
+        pools = split_into_pools(contest.players, pool_size=2)
+
+        assert sorted(len(pool) for pool in pools) == [2, 3]
+
+    def test_プールの人数は2人以上を指定する(self) -> None:
+        with pytest.raises(ValueError):
+            split_into_pools(make_contest(4).players, pool_size=1)
+
+
+class TestTopCut:
+    def setup_method(self) -> None:
+        self.contest = make_contest(8)
+        self.generator = BracketGenerator()
+        self.pool_matches = list(self.generator.iter_pools(self.contest, pool_size=4))
+        # 各試合でシード上位が勝つ
+        seeds = {p.player_id: p.seed or 0 for p in self.contest.players}
+        for m in self.pool_matches:
+            wins = (2, 0) if seeds[m.player1_id] < seeds[m.player2_id] else (0, 2)
+            m.record_result(None, None, *wins, None, best_of=3)
+
+    def test_全プールの総当たりを同じラウンドで並行に生成する(self) -> None:
+        assert len(self.pool_matches) == 12
+        assert {m.pool for m in self.pool_matches} == {0, 1}
+        for pool in (0, 1):
+            rounds = [m.round for m in self.pool_matches if m.pool == pool]
+            assert sorted(set(rounds)) == [1, 2, 3]  # type: ignore[type-var]
+        assert [m.match_order for m in self.pool_matches] == list(range(1, 13))
+
+    def test_プール1位から順にシードを振る(self) -> None:
+        placings = pool_placings(self.contest, self.pool_matches)
+        seeded = seed_top_cut(self.contest, placings, advance_per_pool=2)
+
+        names = [p.name for p in seeded]
+        assert names == ["Player1", "Player2", "Player4", "Player3"]
+        assert [p.seed for p in seeded] == [1, 2, 3, 4]
+
+    def test_決勝トーナメントは予選の続きのラウンドになる(self) -> None:
+        top_cut = self.generator.generate_top_cut(
+            self.contest, self.pool_matches, advance_per_pool=2
+        )
+
+        assert len(top_cut) == 3
+        assert all(m.pool is None for m in top_cut)
+        assert sorted(m.round or 0 for m in top_cut) == [4, 4, 5]
+        assert min(m.match_order for m in top_cut) == 13
@@ -0,0 +1,157 @@
+"""台割り当てスケジューラのテスト"""
+import uuid
+from datetime import datetime
+
+import pytest
+
+from src.domain.contest.contest import Contest
+from src.domain.contest.value_objects import ContestFormat, ContestStatus
+from src.domain.match.bracket_generator import TBD_PLAYER_ID, BracketGenerator
+from src.domain.match.match import Match
+from src.domain.match.scheduler import StationScheduler
+from src.domain.match.value_objects import MatchStatus
+
+
+def make_contest(n: int, format: ContestFormat) -> Contest:
+    contest = Contest(
+        contest_id=uuid.uuid4(),
+        name="Test",
+        game_title_id=uuid.uuid4(),
+        format=format,
+        best_of=3,
+        status=ContestStatus.PRE_REGISTRATION,
+        created_at=datetime.now(),
+        players=[],
+    )
+    for i in range(n):
+        contest.add_player(name=f"Player{i + 1}", seed=i + 1)
+    return contest
+
+
+def entrants(contest: Contest) -> set[uuid.UUID]:
+    return {p.player_id for p in contest.players}
+
+
+def make_match(
+    player1_id: uuid.UUID, player2_id: uuid.UUID, order: int, **links: object
+) -> Match:
+    return Match(
+        match_id=uuid.uuid4(),
+        contest_id=uuid.uuid4(),
+        player1_id=player1_id,
+        player2_id=player2_id,
+        player1_character=None,
+        player2_character=None,
+        player1_wins=0,
+        player2_wins=0,
+        comment=None,
+        status=MatchStatus.PENDING,
+        round=1,
+        match_order=order,
+        **links,  # type: ignore[arg-type]
+    )
+
+
+def drain(scheduler: StationScheduler) -> list[tuple[Match, int]]:
+    assignments = []
+    while (assignment := scheduler.next_assignment()) is not None:
+        assignments.append((assignment.match, assignment.station))
+    return assignments
+
+
+class TestStationScheduler:
+    def test_確定した試合だけを空いている台に割り当てる(self) -> None:
+        contest = make_contest(8, ContestFormat.SINGLE_ELIMINATION)
+        matches = BracketGenerator().generate_single_elimination(contest)
+
+        assignments = drain(StationScheduler(matches, 6, entrants(contest)))
+
+        assert [station for _, station in assignments] == [1, 2, 3, 4]
+        assert all(match.round == 1 for match, _ in assignments)
+        assert all(match.station == station for match, station in assignments)
+        assert all(
+            TBD_PLAYER_ID not in (m.player1_id, m.player2_id) for m, _ in assignments
+        )
+
+    def test_台が埋まれば割り当てない(self) -> None:
+        contest = make_contest(8, ContestFormat.SINGLE_ELIMINATION)
+        matches = BracketGenerator().generate_single_elimination(contest)
+
+        assert len(drain(StationScheduler(matches, 3, entrants(contest)))) == 3
+
+    def test_対戦中のプレイヤーの試合は呼ばない(self) -> None:
+        contest = make_contest(4, ContestFormat.ROUND_ROBIN)
+        matches = BracketGenerator().generate_round_robin(contest)
+
+        assignments = drain(StationScheduler(matches, 3, entrants(contest)))
+
+        assert len(assignments) == 2
+        players = [p for m, _ in assignments for p in (m.player1_id, m.player2_id)]
+        assert len(set(players)) == 4
+
+    def test_保存済みの割り当ては使用中として扱う(self) -> None:
+        contest = make_contest(4, ContestFormat.ROUND_ROBIN)
+        matches = BracketGenerator().generate_round_robin(contest)
+        matches[0].station = 1
+
+        assignments = drain(StationScheduler(matches, 2, entrants(contest)))
+
+        [(match, station)] = assignments
+        assert station == 2
+        assert {match.player1_id, match.player2_id}.isdisjoint(
+            {matches[0].player1_id, matches[0].player2_id}
+        )
+
+    def test_後の試合を待たせている試合を先に呼ぶ(self) -> None:
+        a, b, c, d = (uuid.uuid4() for _ in range(4))
+        final = make_match(TBD_PLAYER_ID, uuid.uuid4(), 3)
+        standalone = make_match(a, b, 1)
+        feeder = make_match(c, d, 2, next_match_id=final.match_id, next_match_slot=1)
+
+        assignments = drain(
+            StationScheduler([standalone, feeder, final], 1, {a, b, c, d})
+        )
+
+        assert [m.match_id for m, _ in assignments] == [feeder.match_id]
+
+    def test_残り試合の多いプレイヤーの試合を先に呼ぶ(self) -> None:
+        a, b, c, d = (uuid.uuid4() for _ in range(4))
+        matches = [
+            make_match(a, b, 1),
+            make_match(c, d, 2),
+            make_match(c, a, 3),
+            make_match(c, b, 4),
+        ]
+
+        (first, _), *_ = drain(StationScheduler(matches, 1, {a, b, c, d}))
+
+        assert first.match_id == matches[1].match_id
+
+    def test_完了済みの試合は呼ばない(self) -> None:
+        contest = make_contest(2, ContestFormat.ROUND_ROBIN)
+        matches = BracketGenerator().generate_round_robin(contest)
+        matches[0].record_result(None, None, 2, 0, None, best_of=3)
+
+        assert drain(StationScheduler(matches, 1, entrants(contest))) == []
+
+    def test_確定するまで同じ割り当てを返す(self) -> None:
+        contest = make_contest(4, ContestFormat.ROUND_ROBIN)
+        matches = BracketGenerator().generate_round_robin(contest)
+        scheduler = StationScheduler(matches, 2, entrants(contest))
+
+        first = scheduler.peek()
+        assert first is not None
+        assert scheduler.peek() == first
+
+        scheduler.confirm(first)
+        second = scheduler.peek()
+
+        assert second is not None
+        assert second.station == 2
+        assert {second.match.player1_id, second.match.player2_id}.isdisjoint(
+            {first.match.player1_id, first.match.player2_id}
+        )
+
+    def test_台数は1以上(self) -> None:
+        with pytest.raises(ValueError):
+            StationScheduler([], 0, set())
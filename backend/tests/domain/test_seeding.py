@@ -0,0 +1,30 @@
+"""標準シード配置表のテスト"""
+import pytest
+
+from src.domain.match.seeding import seed_order, seed_slots
+
+
+class TestSeedOrder:
+    def test_16枠の標準シード配置(self) -> None:
+        assert seed_order(16) == (1, 16, 8, 9, 4, 13, 5, 12, 2, 15, 7, 10, 3, 14, 6, 11)
+
+    def test_1回戦の組はシードの合計が枠数プラス1(self) -> None:
+        order = seed_order(1024)
+
+        assert all(order[i] + order[i + 1] == 1025 for i in range(0, 1024, 2))
+        assert sorted(order) == list(range(1, 1025))
+
+    def test_逆引きでシードの枠が分かる(self) -> None:
+        order = seed_order(64)
+        slots = seed_slots(64)
+
+        assert all(order[slots[seed - 1]] == seed for seed in range(1, 65))
+
+    def test_表は枠数ごとに共有される(self) -> None:
+        assert seed_order(2**16) is seed_order(2**16)
+        assert seed_slots(256) is seed_slots(256)
+
+    @pytest.mark.parametrize("size", [0, 12, 2**17])
+    def test_2のべき乗以外は例外(self, size: int) -> None:
+        with pytest.raises(ValueError):
+            seed_order(size)
@@ -0,0 +1,48 @@
+"""順位表の増分のテスト"""
+import uuid
+
+from src.domain.match.match import Match
+from src.domain.match.value_objects import MatchStatus
+from src.domain.standings.standing import deltas_for
+
+
+def make_match(p1_wins: int, p2_wins: int, status: MatchStatus) -> Match:
+    return Match(
+        match_id=uuid.uuid4(),
+        contest_id=uuid.uuid4(),
+        player1_id=uuid.uuid4(),
+        player2_id=uuid.uuid4(),
+        player1_character=None,
+        player2_character=None,
+        player1_wins=p1_wins,
+        player2_wins=p2_wins,
+        comment=None,
+        status=status,
+        round=None,
+        match_order=1,
+    )
+
+
+class TestDeltasFor:
+    def test_完了した試合は両プレイヤーの増分を返す(self) -> None:
+        match = make_match(1, 2, MatchStatus.COMPLETED)
+
+        p1, p2 = deltas_for(match)
+
+        assert (p1.wins, p1.losses, p1.game_wins, p1.game_losses) == (0, 1, 1, 2)
+        assert (p2.wins, p2.losses, p2.game_wins, p2.game_losses) == (1, 0, 2, 1)
+        assert p1.matches_played == p2.matches_played == 1
+        assert (p1.opponent_id, p2.opponent_id) == (p2.player_id, p1.player_id)
+
+    def test_未完了の試合は増分なし(self) -> None:
+        assert deltas_for(make_match(0, 0, MatchStatus.PENDING)) == []
+
+    def test_取り消しは符号を反転する(self) -> None:
+        delta = deltas_for(make_match(2, 0, MatchStatus.COMPLETED))[0]
+
+        reversed_delta = delta.reversed()
+
+        assert reversed_delta.player_id == delta.player_id
+        assert reversed_delta.opponent_id == delta.opponent_id
+        assert reversed_delta.wins == -1
+        assert reversed_delta.game_wins == -2
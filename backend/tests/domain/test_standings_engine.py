@@ -0,0 +1,67 @@
+"""順位表計算エンジンのテスト"""
+import random
+import uuid
+from datetime import datetime
+
+from src.domain.contest.contest import Contest
+from src.domain.contest.value_objects import ContestFormat, ContestStatus
+from src.domain.match.bracket_generator import BracketGenerator
+from src.domain.match.match import Match
+from src.domain.match.value_objects import MatchStatus
+from src.domain.standings.engine import PythonStandingsEngine
+
+
+def make_contest(format: ContestFormat, n_players: int) -> Contest:
+    contest = Contest(
+        contest_id=uuid.uuid4(),
+        name="Test",
+        game_title_id=uuid.uuid4(),
+        format=format,
+        best_of=3,
+        status=ContestStatus.PRE_REGISTRATION,
+        created_at=datetime.now(),
+        players=[],
+    )
+    for i in range(n_players):
+        contest.add_player(name=f"Player{i + 1}", seed=i + 1)
+    return contest
+
+
+def play_all(matches: list[Match], rng: random.Random) -> list[Match]:
+    """PENDING の実プレイヤー同士の試合に結果を入れ、完了試合を返す"""
+    for match in matches:
+        if match.status == MatchStatus.PENDING:
+            loser_wins = rng.randint(0, 1)
+            if rng.random() < 0.5:
+                match.record_result(None, None, 2, loser_wins, None, best_of=3)
+            else:
+                match.record_result(None, None, loser_wins, 2, None, best_of=3)
+    return [m for m in matches if m.status == MatchStatus.COMPLETED]
+
+
+class TestPythonStandingsEngine:
+    def test_総当たりで非参加者との試合は数えない(self) -> None:
+        contest = make_contest(ContestFormat.ROUND_ROBIN, 2)
+        alice, bob = contest.players
+        matches = play_all(
+            BracketGenerator().generate_round_robin(contest), random.Random(0)
+        )
+        outsider = Match(
+            match_id=uuid.uuid4(),
+            contest_id=contest.contest_id,
+            player1_id=alice.player_id,
+            player2_id=uuid.uuid4(),
+            player1_character=None,
+            player2_character=None,
+            player1_wins=2,
+            player2_wins=0,
+            comment=None,
+            status=MatchStatus.COMPLETED,
+            round=None,
+            match_order=2,
+        )
+
+        standings = PythonStandingsEngine().compute(contest, matches + [outsider])
+
+        assert sum(s.matches_played for s in standings) == 2
+
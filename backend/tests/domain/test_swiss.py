@@ -0,0 +1,59 @@
+"""スイス式の組み合わせのテスト"""
+import uuid
+
+from src.domain.match.swiss import SwissHistory, pair_round
+
+
+def ids(n: int) -> list[uuid.UUID]:
+    return [uuid.uuid4() for _ in range(n)]
+
+
+class TestPairRound:
+    def test_第1ラウンドは上位半分と下位半分を当てる(self) -> None:
+        players = ids(8)
+
+        pairing = pair_round(players, SwissHistory())
+
+        assert pairing.bye is None
+        assert pairing.pairs == [(players[i], players[i + 4]) for i in range(4)]
+
+    def test_同じ勝数どうしで組む(self) -> None:
+        players = ids(4)
+        history = SwissHistory(
+            wins={players[0]: 1, players[1]: 1},
+            played={
+                frozenset((players[0], players[2])),
+                frozenset((players[1], players[3])),
+            },
+        )
+
+        pairing = pair_round(players, history)
+
+        assert pairing.pairs == [(players[0], players[1]), (players[2], players[3])]
+
+    def test_再戦を避けて次の候補と組む(self) -> None:
+        players = ids(4)
+        history = SwissHistory(played={frozenset((players[0], players[2]))})
+
+        pairing = pair_round(players, history)
+
+        assert pairing.pairs == [(players[0], players[3]), (players[1], players[2])]
+
+    def test_残った組が再戦なら既存の組と入れ替える(self) -> None:
+        a, b, c, d = ids(4)
+        # 勝数の並びで a-b が先に組まれ、残った c-d は対戦済み
+        history = SwissHistory(wins={a: 2, b: 2}, played={frozenset((c, d))})
+
+        pairing = pair_round([a, b, c, d], history)
+
+        assert pairing.pairs == [(a, c), (b, d)]
+
+    def test_奇数のとき不戦勝は未経験の最下位に与える(self) -> None:
+        players = ids(5)
+        history = SwissHistory(byes={players[4]})
+
+        pairing = pair_round(players, history)
+
+        assert pairing.bye == players[3]
+        paired = {p for pair in pairing.pairs for p in pair}
+        assert paired == set(players) - {players[3]}
@@ -0,0 +1,130 @@
+"""タイブレークのテスト"""
+import uuid
+
+import pytest
+
+from src.domain.match.match import Match
+from src.domain.match.value_objects import MatchStatus
+from src.domain.standings.standing import Standing
+from src.domain.standings.tiebreak import (
+    MatchResults,
+    Tiebreaker,
+    needs_match_results,
+    rank_standings,
+    tied_players,
+)
+
+
+def make_standing(name: str, wins: int, game_wins: int, game_losses: int) -> Standing:
+    return Standing(
+        player_id=uuid.uuid4(),
+        player_name=name,
+        wins=wins,
+        losses=3 - wins,
+        matches_played=3,
+        game_wins=game_wins,
+        game_losses=game_losses,
+    )
+
+
+def beat(winner: Standing, loser: Standing) -> Match:
+    return Match(
+        match_id=uuid.uuid4(),
+        contest_id=uuid.uuid4(),
+        player1_id=winner.player_id,
+        player2_id=loser.player_id,
+        player1_character=None,
+        player2_character=None,
+        player1_wins=2,
+        player2_wins=1,
+        comment=None,
+        status=MatchStatus.COMPLETED,
+        round=None,
+        match_order=1,
+    )
+
+
+class TestRankStandings:
+    def setup_method(self) -> None:
+        # A・B・C が2勝1敗で並び、D は3敗
+        # A>B, B>C, C>A の三すくみ、全員 D に勝利
+        self.a = make_standing("A", 2, 5, 3)
+        self.b = make_standing("B", 2, 5, 3)
+        self.c = make_standing("C", 2, 6, 3)
+        self.d = make_standing("D", 0, 0, 6)
+        self.standings = [self.a, self.b, self.c, self.d]
+        self.matches = [
+            beat(self.a, self.b),
+            beat(self.b, self.c),
+            beat(self.c, self.a),
+            beat(self.a, self.d),
+            beat(self.b, self.d),
+            beat(self.c, self.d),
+        ]
+        self.results = MatchResults(
+            tied_players(self.standings, [Tiebreaker.HEAD_TO_HEAD]), self.matches
+        )
+
+    def test_得失ゲーム差で同率を解消する(self) -> None:
+        ranked = rank_standings(self.standings, [Tiebreaker.GAME_DIFFERENCE])
+
+        assert [(r.standing.player_name, r.rank) for r in ranked] == [
+            ("C", 1),
+            ("A", 2),
+            ("B", 2),
+            ("D", 4),
+        ]
+        assert ranked[0].tiebreaks == {"GAME_DIFFERENCE": 3}
+
+    def test_直接対決が三すくみなら次のタイブレークに進む(self) -> None:
+        ranked = rank_standings(
+            self.standings,
+            [Tiebreaker.HEAD_TO_HEAD, Tiebreaker.GAME_RATIO],
+            self.results,
+        )
+
+        assert [r.standing.player_name for r in ranked] == ["C", "A", "B", "D"]
+        assert ranked[0].tiebreaks["HEAD_TO_HEAD"] == 1
+        assert ranked[0].tiebreaks["GAME_RATIO"] == pytest.approx(6 / 9)
+
+    def test_直接対決で2人の同率を解消する(self) -> None:
+        ranked = rank_standings(
+            self.standings,
+            [Tiebreaker.GAME_DIFFERENCE, Tiebreaker.HEAD_TO_HEAD],
+            self.results,
+        )
+
+        # A と B は得失ゲーム差で並び、直接対決で A が上
+        assert [(r.standing.player_name, r.rank) for r in ranked] == [
+            ("C", 1),
+            ("A", 2),
+            ("B", 3),
+            ("D", 4),
+        ]
+
+    def test_SOSは対戦相手の勝数の合計(self) -> None:
+        ranked = rank_standings(
+            self.standings, [Tiebreaker.STRENGTH_OF_SCHEDULE], self.results
+        )
+
+        # 全員が同じ相手と対戦しているため同順位
+        assert {r.rank for r in ranked[:3]} == {1}
+        assert ranked[0].tiebreaks["STRENGTH_OF_SCHEDULE"] == 4
+
+    def test_同率がなければ対戦結果は不要(self) -> None:
+        standings = [make_standing("A", 3, 6, 0), make_standing("B", 2, 4, 2)]
+
+        assert not needs_match_results(standings, [Tiebreaker.HEAD_TO_HEAD])
+        assert needs_match_results(self.standings, [Tiebreaker.HEAD_TO_HEAD])
+        assert not needs_match_results(self.standings, [Tiebreaker.GAME_RATIO])
+
+    def test_対戦結果は同率のプレイヤーの分だけ持つ(self) -> None:
+        tied = tied_players(self.standings, [Tiebreaker.STRENGTH_OF_SCHEDULE])
+
+        assert tied == {self.a.player_id, self.b.player_id, self.c.player_id}
+        # 同率でない D の対戦結果がなくても SOS は相手の勝数から求まる
+        ranked = rank_standings(
+            self.standings, [Tiebreaker.STRENGTH_OF_SCHEDULE], self.results
+        )
+        assert ranked[-1].standing == self.d
+        assert "STRENGTH_OF_SCHEDULE" not in ranked[-1].tiebreaks
@@ -0,0 +1,39 @@
+"""インフラ層テスト用設定
+
+TEST_DATABASE_URL の MySQL（docker-compose の mysql_test）に接続して実行する。
+接続できない環境ではスキップする。
+"""
+from collections.abc import AsyncGenerator
+
+import pytest
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from src.infrastructure.mysql.models import Base
+from src.infrastructure.settings import Settings
+
+
+@pytest.fixture
+async def engine() -> AsyncGenerator[AsyncEngine, None]:
+    engine = create_async_engine(Settings().test_database_url)
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+    except (OSError, DBAPIError) as e:
+        await engine.dispose()
+        pytest.skip(f"テスト用 MySQL に接続できません: {e}")
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def session(engine: AsyncEngine) -> AsyncGenerator[AsyncSession, None]:
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+        await session.rollback()
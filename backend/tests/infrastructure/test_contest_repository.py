@@ -0,0 +1,124 @@
+"""MySQLContestRepository のテスト"""
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.contest.contest import Contest
+from src.domain.contest.value_objects import ContestFormat, ContestStatus
+from src.domain.game_title.game_title import GameTitle
+from src.infrastructure.mysql.contest_repository import MySQLContestRepository
+from src.infrastructure.mysql.game_title_repository import MySQLGameTitleRepository
+
+
+async def save_contest(
+    session: AsyncSession, game_title_id: uuid.UUID, created_at: datetime
+) -> Contest:
+    contest = Contest(
+        contest_id=uuid.uuid4(),
+        name="Test",
+        game_title_id=game_title_id,
+        format=ContestFormat.ROUND_ROBIN,
+        best_of=3,
+        status=ContestStatus.PRE_REGISTRATION,
+        created_at=created_at,
+        players=[],
+    )
+    contest.add_player(name="Alice", seed=1)
+    await MySQLContestRepository(session).save(contest)
+    return contest
+
+
+class TestMySQLContestRepository:
+    async def test_保存したコンテストを読み出せる(self, session: AsyncSession) -> None:
+        game_title = GameTitle(game_title_id=uuid.uuid4(), name="SF6")
+        await MySQLGameTitleRepository(session).save(game_title)
+        created_at = datetime(2026, 10, 18, 12, 34, 56, 789012)
+        contest = await save_contest(session, game_title.game_title_id, created_at)
+        session.expunge_all()
+
+        found = await MySQLContestRepository(session).find_by_id(contest.contest_id)
+
+        assert found is not None
+        assert found.created_at == created_at
+        assert found.format == ContestFormat.ROUND_ROBIN
+        assert found.status == ContestStatus.PRE_REGISTRATION
+        assert [p.name for p in found.players] == ["Alice"]
+
+    async def test_プレイヤーの増減を差分で保存できる(self, session: AsyncSession) -> None:
+        game_title = GameTitle(game_title_id=uuid.uuid4(), name="SF6")
+        await MySQLGameTitleRepository(session).save(game_title)
+        contest = await save_contest(session, game_title.game_title_id, datetime.now())
+        repo = MySQLContestRepository(session)
+
+        alice = contest.players[0]
+        contest.add_player(name="Bob", seed=2)
+        contest.remove_player(alice.player_id)
+        contest.transition_status(ContestStatus.IN_PROGRESS)
+        await repo.save(contest)
+        session.expunge_all()
+
+        found = await repo.find_by_id(contest.contest_id)
+        assert found is not None
+        assert found.status == ContestStatus.IN_PROGRESS
+        assert [p.name for p in found.players] == ["Bob"]
+
+    async def test_作成日時の範囲で絞り込み新しい順に返す(
+        self, session: AsyncSession
+    ) -> None:
+        game_title = GameTitle(game_title_id=uuid.uuid4(), name="SF6")
+        await MySQLGameTitleRepository(session).save(game_title)
+        base = datetime(2026, 10, 1)
+        contests = [
+            await save_contest(session, game_title.game_title_id, base + timedelta(days=d))
+            for d in range(5)
+        ]
+
+        found = await MySQLContestRepository(session).find_summaries(
+            limit=10,
+            created_from=base + timedelta(days=1),
+            created_to=base + timedelta(days=4),
+        )
+
+        assert [c.contest_id for c in found] == [
+            contests[3].contest_id,
+            contests[2].contest_id,
+            contests[1].contest_id,
+        ]
+        assert all(c.player_count == 1 for c in found)
+
+    async def test_キーセットで次のページを取得できる(self, session: AsyncSession) -> None:
+        game_title = GameTitle(game_title_id=uuid.uuid4(), name="SF6")
+        await MySQLGameTitleRepository(session).save(game_title)
+        created_at = datetime(2026, 10, 1)
+        # 同一作成日時でも contest_id で順序が決まる
+        contests = [
+            await save_contest(session, game_title.game_title_id, created_at)
+            for _ in range(5)
+        ]
+        expected = sorted((c.contest_id for c in contests), reverse=True)
+        repo = MySQLContestRepository(session)
+
+        first = await repo.find_summaries(limit=3)
+        second = await repo.find_summaries(
+            limit=3, after=(first[-1].created_at, first[-1].contest_id)
+        )
+
+        assert [c.contest_id for c in first + second] == expected
+
+    async def test_状態で絞り込める(self, session: AsyncSession) -> None:
+        game_title = GameTitle(game_title_id=uuid.uuid4(), name="SF6")
+        await MySQLGameTitleRepository(session).save(game_title)
+        contest = await save_contest(session, game_title.game_title_id, datetime.now())
+        await save_contest(session, game_title.game_title_id, datetime.now())
+        contest.transition_status(ContestStatus.IN_PROGRESS)
+        repo = MySQLContestRepository(session)
+        await repo.save(contest)
+
+        found = await repo.find_summaries(
+            limit=10,
+            status=ContestStatus.IN_PROGRESS,
+            game_title_id=game_title.game_title_id,
+        )
+
+        assert [c.contest_id for c in found] == [contest.contest_id]
@@ -0,0 +1,29 @@
+"""読み取りセッションの振り分けのテスト"""
+from src.infrastructure.database import (
+    AsyncReadSessionLocal,
+    AsyncSessionLocal,
+    _settings,
+    get_pools,
+    read_sessionmaker,
+)
+
+
+class TestReadSessionmaker:
+    def test_書き込み履歴がなければレプリカを使う(self) -> None:
+        assert read_sessionmaker(None) is AsyncReadSessionLocal
+
+    def test_書き込み直後はプライマリを使う(self) -> None:
+        assert read_sessionmaker(1000.0, now=1001.0) is AsyncSessionLocal
+
+    def test_許容遅延を過ぎればレプリカに戻る(self) -> None:
+        now = 1000.0 + _settings.replica_max_lag_seconds
+        assert read_sessionmaker(1000.0, now=now) is AsyncReadSessionLocal
+
+
+class TestGetPools:
+    def test_プライマリのプールを含む(self) -> None:
+        pools = get_pools()
+
+        assert "primary" in pools
+        # レプリカを設定したときのみ読み取り側のプールが別にある
+        assert ("replica" in pools) == bool(_settings.database_replica_url)
@@ -0,0 +1,301 @@
+"""MySQLMatchRepository のテスト"""
+import uuid
+from datetime import datetime
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from src.domain.contest.value_objects import ContestFormat, ContestStatus
+from src.domain.match.bracket_diff import BracketDiff
+from src.domain.match.match import Match
+from src.domain.match.value_objects import MatchStatus
+from src.infrastructure.mysql.match_repository import (
+    BULK_INSERT_CHUNK_SIZE,
+    MySQLMatchRepository,
+)
+from src.infrastructure.mysql.models import (
+    ContestModel,
+    GameTitleModel,
+    MatchModel,
+    PlayerModel,
+)
+
+
+async def make_contest_row(session: AsyncSession) -> uuid.UUID:
+    game_title_id = uuid.uuid4()
+    contest_id = uuid.uuid4()
+    session.add(GameTitleModel(game_title_id=game_title_id, name="SF6"))
+    session.add(
+        ContestModel(
+            contest_id=contest_id,
+            name="Test",
+            game_title_id=game_title_id,
+            format=ContestFormat.ROUND_ROBIN,
+            best_of=3,
+            status=ContestStatus.PRE_REGISTRATION,
+            created_at=datetime.now(),
+        )
+    )
+    await session.flush()
+    return contest_id
+
+
+def make_match(contest_id: uuid.UUID, order: int) -> Match:
+    return Match(
+        match_id=uuid.uuid4(),
+        contest_id=contest_id,
+        player1_id=uuid.uuid4(),
+        player2_id=uuid.uuid4(),
+        player1_character=None,
+        player2_character=None,
+        player1_wins=0,
+        player2_wins=0,
+        comment=None,
+        status=MatchStatus.PENDING,
+        round=None,
+        match_order=order,
+    )
+
+
+class TestSaveAll:
+    async def test_チャンクサイズを超える試合を一括保存できる(
+        self, session: AsyncSession
+    ) -> None:
+        contest_id = await make_contest_row(session)
+        repo = MySQLMatchRepository(session)
+        matches = [
+            make_match(contest_id, i) for i in range(BULK_INSERT_CHUNK_SIZE * 2 + 1)
+        ]
+
+        await repo.save_all(matches)
+
+        count = await session.scalar(
+            select(func.count()).select_from(MatchModel)
+        )
+        assert count == len(matches)
+
+    async def test_既存の試合は結果列のみ更新される(self, session: AsyncSession) -> None:
+        contest_id = await make_contest_row(session)
+        repo = MySQLMatchRepository(session)
+        match = make_match(contest_id, 1)
+        await repo.save_all([match])
+
+        match.record_result("Ryu", "Ken", 2, 1, None, best_of=3)
+        await repo.save_all([match, make_match(contest_id, 2)])
+
+        found = await repo.find_by_contest_id(contest_id)
+        assert len(found) == 2
+        saved = next(m for m in found if m.match_id == match.match_id)
+        assert saved.status == MatchStatus.COMPLETED
+        assert saved.player1_wins == 2
+
+
+class TestRecordResult:
+    async def test_best_ofと試合を取得して結果列を更新できる(
+        self, session: AsyncSession
+    ) -> None:
+        contest_id = await make_contest_row(session)
+        repo = MySQLMatchRepository(session)
+        match = make_match(contest_id, 1)
+        await repo.save_all([match])
+
+        found = await repo.find_for_result(contest_id, match.match_id)
+        assert found is not None
+        best_of, loaded, players_entered = found
+        assert best_of == 3
+        assert loaded is not None
+        # 試合の2人はコンテストのプレイヤーとして登録していない
+        assert not players_entered
+
+        loaded.record_result("Ryu", "Ken", 2, 0, "GG", best_of=best_of)
+        await repo.update_result(loaded)
+        session.expunge_all()
+
+        saved = await repo.find_by_id(match.match_id)
+        assert saved is not None
+        assert saved.status == MatchStatus.COMPLETED
+        assert saved.comment == "GG"
+
+    async def test_2人ともプレイヤーかを返す(self, session: AsyncSession) -> None:
+        contest_id = await make_contest_row(session)
+        alice, bob = uuid.uuid4(), uuid.uuid4()
+        session.add_all(
+            PlayerModel(player_id=pid, contest_id=contest_id, name=name, seed=None)
+            for pid, name in ((alice, "Alice"), (bob, "Bob"))
+        )
+        await session.flush()
+        repo = MySQLMatchRepository(session)
+        decided = make_match(contest_id, 1)
+        decided.player1_id, decided.player2_id = alice, bob
+        undecided = make_match(contest_id, 2)
+        undecided.player1_id = alice
+        await repo.save_all([decided, undecided])
+
+        found = await repo.find_for_result(contest_id, decided.match_id)
+        assert found is not None and found[2]
+        found = await repo.find_for_result(contest_id, undecided.match_id)
+        assert found is not None and not found[2]
+
+    async def test_別コンテストの試合は取得しない(self, session: AsyncSession) -> None:
+        contest_id = await make_contest_row(session)
+        other_contest_id = await make_contest_row(session)
+        repo = MySQLMatchRepository(session)
+        match = make_match(other_contest_id, 1)
+        await repo.save_all([match])
+
+        assert await repo.find_for_result(contest_id, match.match_id) == (
+            3,
+            None,
+            False,
+        )
+        assert await repo.find_for_result(uuid.uuid4(), match.match_id) is None
+
+    async def test_勝者を次の試合の枠に入れる(self, session: AsyncSession) -> None:
+        contest_id = await make_contest_row(session)
+        repo = MySQLMatchRepository(session)
+        pending = make_match(contest_id, 1)
+        completed = make_match(contest_id, 2)
+        completed.record_result(None, None, 2, 0, None, best_of=3)
+        await repo.save_all([pending, completed])
+        winner_id = uuid.uuid4()
+
+        assert await repo.advance_player(pending.match_id, 2, winner_id)
+        assert not await repo.advance_player(completed.match_id, 1, winner_id)
+        session.expunge_all()
+
+        advanced = await repo.find_by_id(pending.match_id)
+        assert advanced is not None
+        assert advanced.player2_id == winner_id
+
+
+class TestLockContest:
+    async def test_同じコンテストの書き込みを待たせる(
+        self, session: AsyncSession, engine: AsyncEngine
+    ) -> None:
+        contest_id = await make_contest_row(session)
+        await session.commit()
+        await MySQLMatchRepository(session).lock_contest(contest_id)
+
+        async with async_sessionmaker(engine)() as other:
+            await other.execute(text("SET SESSION innodb_lock_wait_timeout = 1"))
+            with pytest.raises(OperationalError):
+                await MySQLMatchRepository(other).lock_contest(contest_id)
+
+
+class TestAfterCommit:
+    async def test_コミットの成功時にのみ呼ぶ(self, session: AsyncSession) -> None:
+        await make_contest_row(session)
+        repo = MySQLMatchRepository(session)
+        calls: list[str] = []
+        repo.after_commit(lambda: calls.append("rolled back"))
+        await session.rollback()
+
+        await make_contest_row(session)
+        repo.after_commit(lambda: calls.append("committed"))
+        await session.commit()
+
+        assert calls == ["committed"]
+
+
+class TestDelete:
+    async def test_削除した試合への進出先のリンクを外す(
+        self, session: AsyncSession
+    ) -> None:
+        contest_id = await make_contest_row(session)
+        repo = MySQLMatchRepository(session)
+        final = make_match(contest_id, 2)
+        feeder = make_match(contest_id, 1)
+        feeder.next_match_id, feeder.next_match_slot = final.match_id, 1
+        feeder.loser_next_match_id, feeder.loser_next_match_slot = final.match_id, 2
+        await repo.save_all([feeder, final])
+
+        await repo.delete(final.match_id)
+        session.expunge_all()
+
+        saved = await repo.find_by_id(feeder.match_id)
+        assert saved is not None
+        assert (saved.next_match_id, saved.next_match_slot) == (None, None)
+        assert (saved.loser_next_match_id, saved.loser_next_match_slot) == (None, None)
+        assert await repo.find_by_id(final.match_id) is None
+
+
+class TestApplyDiff:
+    async def test_削除_更新_挿入を1度に書き込む(self, session: AsyncSession) -> None:
+        contest_id = await make_contest_row(session)
+        repo = MySQLMatchRepository(session)
+        kept, removed = make_match(contest_id, 1), make_match(contest_id, 2)
+        await repo.save_all([kept, removed])
+        kept.match_order = 5
+        added = make_match(contest_id, 6)
+
+        await repo.apply_diff(
+            contest_id,
+            BracketDiff(
+                matches=[kept, added],
+                inserts=[added],
+                updates=[kept],
+                deletes=[removed.match_id],
+            ),
+        )
+        session.expunge_all()
+
+        saved = await repo.find_by_contest_id(contest_id)
+        assert [(m.match_id, m.match_order) for m in saved] == [
+            (kept.match_id, 5),
+            (added.match_id, 6),
+        ]
+
+
+class TestAssignStation:
+    async def test_空いている台だけを未完了の試合に割り当てる(
+        self, session: AsyncSession
+    ) -> None:
+        contest_id = await make_contest_row(session)
+        repo = MySQLMatchRepository(session)
+        first, second, completed = (make_match(contest_id, i) for i in range(3))
+        completed.record_result(None, None, 2, 0, None, best_of=3)
+        await repo.save_all([first, second, completed])
+        version = await repo.find_version(contest_id)
+
+        assert await repo.assign_station(contest_id, first.match_id, 1)
+        assert not await repo.assign_station(contest_id, first.match_id, 2)
+        assert not await repo.assign_station(contest_id, second.match_id, 1)
+        assert not await repo.assign_station(contest_id, completed.match_id, 2)
+        assert await repo.find_version(contest_id) == version
+        session.expunge_all()
+
+        saved = await repo.find_by_id(first.match_id)
+        assert saved is not None
+        assert saved.station == 1
+
+    async def test_対戦中のプレイヤーの試合には割り当てない(
+        self, session: AsyncSession
+    ) -> None:
+        contest_id = await make_contest_row(session)
+        repo = MySQLMatchRepository(session)
+        playing, other = make_match(contest_id, 1), make_match(contest_id, 2)
+        # 別のワーカーの古いキューが、台にいるプレイヤーの試合を呼ぼうとする
+        other.player2_id = playing.player1_id
+        await repo.save_all([playing, other])
+
+        assert await repo.assign_station(contest_id, playing.match_id, 1)
+        assert not await repo.assign_station(contest_id, other.match_id, 2)
+
+class TestFindVersion:
+    async def test_一括保存の後に版数を1つ進める(self, session: AsyncSession) -> None:
+        contest_id = await make_contest_row(session)
+        repo = MySQLMatchRepository(session)
+        initial = await repo.find_version(contest_id)
+
+        await repo.save_all([make_match(contest_id, 1)])
+        await repo.save_all([make_match(contest_id, 2)])
+        unchanged = await repo.find_version(contest_id)
+        await repo.bump_version(contest_id)
+
+        after = await repo.find_version(contest_id)
+        assert initial is not None and after is not None
+        assert unchanged == initial
+        assert after == initial + 1
+        assert await repo.find_version(uuid.uuid4()) is None
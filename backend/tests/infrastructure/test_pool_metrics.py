@@ -0,0 +1,58 @@
+"""接続プール計測のテスト"""
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.util import greenlet_spawn
+
+from src.infrastructure.pool_metrics import (
+    AcquireWaitRecorder,
+    InstrumentedQueuePool,
+    snapshot,
+)
+
+
+class TestAcquireWaitRecorder:
+    def test_待ち時間がバケットに振り分けられる(self) -> None:
+        recorder = AcquireWaitRecorder(buckets_ms=(1, 10))
+
+        recorder.observe(0.5)
+        recorder.observe(1)
+        recorder.observe(7)
+        recorder.observe(30)
+
+        histogram = recorder.histogram()
+        assert histogram.counts == (2, 1, 1)
+        assert histogram.count == 4
+        assert histogram.sum_ms == pytest.approx(38.5)
+
+
+class TestInstrumentedQueuePool:
+    async def test_チェックアウト数とオーバーフローを報告する(self) -> None:
+        pool = InstrumentedQueuePool(creator=MagicMock, pool_size=1, max_overflow=1)
+
+        first = await greenlet_spawn(pool.connect)
+        second = await greenlet_spawn(pool.connect)
+        busy = snapshot(pool)
+        await greenlet_spawn(second.close)
+        await greenlet_spawn(first.close)
+        released = snapshot(pool)
+
+        assert (busy.checked_out, busy.idle, busy.overflow) == (2, 0, 1)
+        assert released.checked_out == 0
+        assert released.acquire_wait.count == 2
+
+    async def test_取得タイムアウトを数える(self) -> None:
+        pool = InstrumentedQueuePool(
+            creator=MagicMock, pool_size=1, max_overflow=0, timeout=0.01
+        )
+        held = await greenlet_spawn(pool.connect)
+
+        with pytest.raises(exc.TimeoutError):
+            await greenlet_spawn(pool.connect)
+        await greenlet_spawn(held.close)
+
+        result = snapshot(pool)
+        assert result.timeouts == 1
+        assert result.acquire_wait.count == 2
+        assert result.acquire_wait.sum_ms >= 10
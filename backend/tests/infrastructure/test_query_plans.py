@@ -0,0 +1,183 @@
+"""リポジトリが発行するクエリの実行計画テスト
+
+リポジトリ経由で発行された SELECT を捕捉して EXPLAIN し、
+フルスキャン（type=ALL）や filesort に落ちていないことを確認する。
+"""
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import event, insert, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.domain.contest.value_objects import ContestFormat, ContestStatus
+from src.domain.match.match import Match
+from src.domain.match.value_objects import MatchStatus
+from src.infrastructure.mysql.contest_repository import MySQLContestRepository
+from src.infrastructure.mysql.match_repository import MySQLMatchRepository
+from src.infrastructure.mysql.models import (
+    ContestModel,
+    GameTitleModel,
+    PlayerModel,
+    StandingModel,
+)
+from src.infrastructure.mysql.standings_repository import MySQLStandingsRepository
+
+N_CONTESTS = 20
+PLAYERS_PER_CONTEST = 16
+MATCHES_PER_CONTEST = 100
+
+
+@contextmanager
+def capture_selects(engine: AsyncEngine) -> Iterator[list[tuple[str, Any]]]:
+    captured: list[tuple[str, Any]] = []
+
+    def listener(  # type: ignore[no-untyped-def]
+        conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", listener)
+    try:
+        yield captured
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", listener)
+
+
+async def seed(session: AsyncSession) -> list[uuid.UUID]:
+    game_title_id = uuid.uuid4()
+    await session.execute(
+        insert(GameTitleModel).values(game_title_id=game_title_id, name="SF6")
+    )
+    contest_ids = [uuid.uuid4() for _ in range(N_CONTESTS)]
+    await session.execute(
+        insert(ContestModel),
+        [
+            {
+                "contest_id": cid,
+                "name": "Test",
+                "game_title_id": game_title_id,
+                "format": ContestFormat.ROUND_ROBIN,
+                "best_of": 3,
+                "status": ContestStatus.IN_PROGRESS,
+                "created_at": datetime.now(),
+            }
+            for cid in contest_ids
+        ],
+    )
+    players = [
+        {
+            "player_id": uuid.uuid4(),
+            "contest_id": cid,
+            "name": f"Player{i}",
+            "seed": i + 1,
+        }
+        for cid in contest_ids
+        for i in range(PLAYERS_PER_CONTEST)
+    ]
+    await session.execute(insert(PlayerModel), players)
+    await session.execute(
+        insert(StandingModel),
+        [
+            {
+                "contest_id": p["contest_id"],
+                "player_id": p["player_id"],
+                "wins": i % 4,
+                "matches_played": i % 3,
+            }
+            for i, p in enumerate(players)
+        ],
+    )
+    await MySQLMatchRepository(session).save_all(
+        [
+            Match(
+                match_id=uuid.uuid4(),
+                contest_id=cid,
+                player1_id=uuid.uuid4(),
+                player2_id=uuid.uuid4(),
+                player1_character=None,
+                player2_character=None,
+                player1_wins=0,
+                player2_wins=0,
+                comment=None,
+                status=MatchStatus.PENDING,
+                round=i % 5 + 1,
+                match_order=i + 1,
+            )
+            for cid in contest_ids
+            for i in range(MATCHES_PER_CONTEST)
+        ]
+    )
+    await session.commit()
+    for table in ("contests", "players", "matches", "standings"):
+        await session.execute(text(f"ANALYZE TABLE {table}"))
+    return contest_ids
+
+
+async def assert_no_full_scan(
+    session: AsyncSession, captured: list[tuple[str, Any]]
+) -> None:
+    assert captured, "no SELECT statement was captured"
+    conn = await session.connection()
+    for statement, parameters in captured:
+        result = await conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+        for row in result.mappings():
+            assert row["type"] != "ALL", f"full scan on {row['table']}: {statement}"
+            assert "filesort" not in (row["Extra"] or ""), f"filesort: {statement}"
+
+
+class TestQueryPlans:
+    async def test_コンテスト取得はインデックスを使う(
+        self, engine: AsyncEngine, session: AsyncSession
+    ) -> None:
+        contest_ids = await seed(session)
+        repo = MySQLContestRepository(session)
+
+        with capture_selects(engine) as captured:
+            await repo.find_by_id(contest_ids[0])
+
+        await assert_no_full_scan(session, captured)
+
+    async def test_コンテスト一覧はインデックス順に読む(
+        self, engine: AsyncEngine, session: AsyncSession
+    ) -> None:
+        await seed(session)
+        repo = MySQLContestRepository(session)
+
+        with capture_selects(engine) as captured:
+            page = await repo.find_summaries(limit=5)
+            await repo.find_summaries(
+                limit=5, after=(page[-1].created_at, page[-1].contest_id)
+            )
+            await repo.find_summaries(limit=5, status=ContestStatus.COMPLETED)
+            await repo.find_summaries(
+                limit=5, created_from=datetime.now() + timedelta(days=1)
+            )
+
+        await assert_no_full_scan(session, captured)
+
+    async def test_コンテストの試合一覧はインデックス順に読む(
+        self, engine: AsyncEngine, session: AsyncSession
+    ) -> None:
+        contest_ids = await seed(session)
+        repo = MySQLMatchRepository(session)
+
+        with capture_selects(engine) as captured:
+            matches = await repo.find_by_contest_id(contest_ids[0])
+            await repo.find_by_id(matches[0].match_id)
+
+        await assert_no_full_scan(session, captured)
+
+    async def test_順位表はインデックス順に読む(
+        self, engine: AsyncEngine, session: AsyncSession
+    ) -> None:
+        contest_ids = await seed(session)
+        repo = MySQLStandingsRepository(session)
+
+        with capture_selects(engine) as captured:
+            await repo.find_by_contest_id(contest_ids[0])
+
+        await assert_no_full_scan(session, captured)
@@ -0,0 +1,176 @@
+"""MySQLStandingsRepository のテスト"""
+import uuid
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.contest.contest import Contest
+from src.domain.contest.value_objects import ContestFormat, ContestStatus
+from src.domain.game_title.game_title import GameTitle
+from src.domain.match.match import Match
+from src.domain.match.value_objects import MatchStatus
+from src.domain.standings.standing import StandingDelta, deltas_for
+from src.infrastructure.mysql.contest_repository import MySQLContestRepository
+from src.infrastructure.mysql.game_title_repository import MySQLGameTitleRepository
+from src.infrastructure.mysql.match_repository import MySQLMatchRepository
+from src.infrastructure.mysql.standings_repository import MySQLStandingsRepository
+
+
+async def save_contest(session: AsyncSession, names: list[str]) -> Contest:
+    game_title = GameTitle(game_title_id=uuid.uuid4(), name="SF6")
+    await MySQLGameTitleRepository(session).save(game_title)
+    contest = Contest(
+        contest_id=uuid.uuid4(),
+        name="Test",
+        game_title_id=game_title.game_title_id,
+        format=ContestFormat.ROUND_ROBIN,
+        best_of=3,
+        status=ContestStatus.PRE_REGISTRATION,
+        created_at=datetime.now(),
+        players=[],
+    )
+    for name in names:
+        contest.add_player(name=name, seed=None)
+    await MySQLContestRepository(session).save(contest)
+    return contest
+
+
+def delta(
+    player_id: uuid.UUID, opponent_id: uuid.UUID, won: bool, gw: int, gl: int
+) -> StandingDelta:
+    return StandingDelta(
+        player_id=player_id,
+        opponent_id=opponent_id,
+        wins=int(won),
+        losses=int(not won),
+        matches_played=1,
+        game_wins=gw,
+        game_losses=gl,
+    )
+
+
+def completed_match(
+    contest: Contest, p1: uuid.UUID, p2: uuid.UUID, p1_wins: int, p2_wins: int
+) -> Match:
+    return Match(
+        match_id=uuid.uuid4(),
+        contest_id=contest.contest_id,
+        player1_id=p1,
+        player2_id=p2,
+        player1_character=None,
+        player2_character=None,
+        player1_wins=p1_wins,
+        player2_wins=p2_wins,
+        comment=None,
+        status=MatchStatus.COMPLETED,
+        round=None,
+        match_order=1,
+    )
+
+
+class TestMySQLStandingsRepository:
+    async def test_プレイヤー登録時に0勝の行が作られる(self, session: AsyncSession) -> None:
+        contest = await save_contest(session, ["Alice", "Bob"])
+
+        standings = await MySQLStandingsRepository(session).find_by_contest_id(
+            contest.contest_id
+        )
+
+        assert standings is not None
+        assert {s.player_name for s in standings} == {"Alice", "Bob"}
+        assert all(s.wins == 0 and s.matches_played == 0 for s in standings)
+
+    async def test_増分を加算して勝数順に返す(self, session: AsyncSession) -> None:
+        contest = await save_contest(session, ["Alice", "Bob", "Charlie"])
+        alice, bob, charlie = contest.players
+        repo = MySQLStandingsRepository(session)
+
+        await repo.apply(
+            contest.contest_id,
+            [
+                delta(bob.player_id, charlie.player_id, True, 2, 0),
+                delta(charlie.player_id, bob.player_id, False, 0, 2),
+                # プレイヤーでない ID（BYE）は無視される
+                delta(uuid.uuid4(), alice.player_id, False, 0, 1),
+            ],
+        )
+        standings = await repo.find_by_contest_id(contest.contest_id)
+
+        assert standings is not None
+        assert [s.player_name for s in standings] == ["Bob", "Alice", "Charlie"]
+        assert standings[0].game_wins == 2
+
+    async def test_存在しないコンテストはNone(self, session: AsyncSession) -> None:
+        repo = MySQLStandingsRepository(session)
+
+        assert await repo.find_by_contest_id(uuid.uuid4()) is None
+
+    async def test_完了試合をSQLで集計して再構築できる(self, session: AsyncSession) -> None:
+        contest = await save_contest(session, ["Alice", "Bob", "Charlie"])
+        alice, bob, charlie = (p.player_id for p in contest.players)
+        await MySQLMatchRepository(session).save_all(
+            [
+                completed_match(contest, alice, bob, 2, 1),
+                completed_match(contest, alice, charlie, 2, 0),
+                completed_match(contest, bob, charlie, 0, 2),
+                # 総当たりではプレイヤーでない相手との試合は数えない
+                completed_match(contest, bob, uuid.uuid4(), 2, 0),
+            ]
+        )
+        repo = MySQLStandingsRepository(session)
+
+        computed = await repo.compute(contest.contest_id)
+        await repo.rebuild(contest.contest_id)
+        materialized = await repo.find_by_contest_id(contest.contest_id)
+
+        assert computed is not None
+        assert [(s.player_name, s.wins, s.losses) for s in computed] == [
+            ("Alice", 2, 0),
+            ("Charlie", 1, 1),
+            ("Bob", 0, 2),
+        ]
+        assert computed[0].game_wins == 4
+        assert computed[0].game_losses == 1
+        assert materialized == computed
+
+    async def test_増分の加算と再構築は同じ値になる(self, session: AsyncSession) -> None:
+        contest = await save_contest(session, ["Alice", "Bob"])
+        alice, bob = (p.player_id for p in contest.players)
+        matches = [
+            completed_match(contest, alice, bob, 2, 1),
+            # 総当たりではプレイヤーでない相手との試合は数えない
+            completed_match(contest, bob, uuid.uuid4(), 2, 0),
+        ]
+        await MySQLMatchRepository(session).save_all(matches)
+        repo = MySQLStandingsRepository(session)
+
+        await repo.apply(contest.contest_id, [d for m in matches for d in deltas_for(m)])
+        applied = await repo.find_by_contest_id(contest.contest_id)
+        await repo.rebuild(contest.contest_id)
+        rebuilt = await repo.find_by_contest_id(contest.contest_id)
+
+        assert applied is not None
+        assert [(s.player_name, s.wins, s.losses) for s in applied] == [
+            ("Alice", 1, 0),
+            ("Bob", 0, 1),
+        ]
+        assert applied == rebuilt
+
+    async def test_試合とプレイヤーの書き込みで版数が進む(
+        self, session: AsyncSession
+    ) -> None:
+        contest = await save_contest(session, ["Alice", "Bob"])
+        alice, bob = (p.player_id for p in contest.players)
+        repo = MySQLStandingsRepository(session)
+        initial = await repo.find_version(contest.contest_id)
+
+        match_repo = MySQLMatchRepository(session)
+        await match_repo.save_all([completed_match(contest, alice, bob, 2, 0)])
+        await match_repo.bump_version(contest.contest_id)
+        after_match = await repo.find_version(contest.contest_id)
+        contest.add_player(name="Charlie", seed=None)
+        await MySQLContestRepository(session).save(contest)
+        after_player = await repo.find_version(contest.contest_id)
+
+        assert initial is not None and after_match is not None
+        assert initial < after_match < after_player  # type: ignore[operator]
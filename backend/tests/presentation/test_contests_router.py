@@ -6,8 +6,13 @@ from unittest.mock import AsyncMock
 import pytest
 from fastapi.testclient import TestClient
 
-from src.application.contest.handlers import ContestNotFoundError
-from src.application.contest.queries import ContestDTO, PlayerDTO
+from src.application.contest.handlers import ContestNotFoundError, InvalidCursorError
+from src.application.contest.queries import (
+    ContestDTO,
+    ContestPageDTO,
+    ContestSummaryDTO,
+    PlayerDTO,
+)
 from src.domain.contest.value_objects import ContestFormat, ContestStatus
 
 
@@ -26,21 +31,76 @@ def make_contest_dto(
     )
 
 
+def make_contest_summary_dto() -> ContestSummaryDTO:
+    return ContestSummaryDTO(
+        contest_id=uuid.uuid4(),
+        name="SF6 Tournament",
+        game_title_id=uuid.uuid4(),
+        format=ContestFormat.ROUND_ROBIN,
+        best_of=3,
+        status=ContestStatus.IN_PROGRESS,
+        created_at=datetime.now(),
+        player_count=8,
+    )
+
+
 class TestContestsRouter:
     def test_コンテスト一覧を取得できる(
         self,
         client: TestClient,
         mock_contest_query_handler: AsyncMock,
     ) -> None:
-        dto = make_contest_dto()
-        mock_contest_query_handler.handle_list.return_value = [dto]
+        summary = make_contest_summary_dto()
+        mock_contest_query_handler.handle_list.return_value = ContestPageDTO(
+            items=[summary], next_cursor="next"
+        )
 
         response = client.get("/api/v1/contests")
 
         assert response.status_code == 200
         data = response.json()
-        assert len(data) == 1
-        assert data[0]["name"] == "SF6 Tournament"
+        assert len(data["items"]) == 1
+        assert data["items"][0]["name"] == "SF6 Tournament"
+        assert data["items"][0]["player_count"] == 8
+        assert data["next_cursor"] == "next"
+
+    def test_絞り込み条件とカーソルを指定してコンテスト一覧を取得できる(
+        self,
+        client: TestClient,
+        mock_contest_query_handler: AsyncMock,
+    ) -> None:
+        mock_contest_query_handler.handle_list.return_value = ContestPageDTO(
+            items=[], next_cursor=None
+        )
+
+        response = client.get(
+            "/api/v1/contests",
+            params={
+                "limit": 20,
+                "cursor": "abc",
+                "status": "IN_PROGRESS",
+                "created_from": "2026-10-12T00:00:00",
+            },
+        )
+
+        assert response.status_code == 200
+        query = mock_contest_query_handler.handle_list.call_args.args[0]
+        assert query.limit == 20
+        assert query.cursor == "abc"
+        assert query.status == ContestStatus.IN_PROGRESS
+        assert query.created_from == datetime(2026, 10, 12)
+        assert query.created_to is None
+
+    def test_不正なカーソルは400(
+        self,
+        client: TestClient,
+        mock_contest_query_handler: AsyncMock,
+    ) -> None:
+        mock_contest_query_handler.handle_list.side_effect = InvalidCursorError("x")
+
+        response = client.get("/api/v1/contests", params={"cursor": "x"})
+
+        assert response.status_code == 400
 
     def test_コンテストを作成できる(
         self,
@@ -63,6 +123,19 @@ class TestContestsRouter:
         assert response.status_code == 201
         data = response.json()
         assert data["name"] == "SF6 Tournament"
+        assert "last_write_at" in response.cookies
+
+    def test_読み取りでは書き込み時刻Cookieを設定しない(
+        self,
+        client: TestClient,
+        mock_contest_query_handler: AsyncMock,
+    ) -> None:
+        mock_contest_query_handler.handle_get.return_value = make_contest_dto()
+
+        response = client.get(f"/api/v1/contests/{uuid.uuid4()}")
+
+        assert response.status_code == 200
+        assert "last_write_at" not in response.cookies
 
     def test_コンテスト詳細を取得できる(
         self,
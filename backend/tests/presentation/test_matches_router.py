@@ -5,7 +5,13 @@ from unittest.mock import AsyncMock
 import pytest
 from fastapi.testclient import TestClient
 
-from src.application.match.queries import MatchDTO
+from src.application.match.queries import (
+    BracketDTO,
+    GeneratedBracketDTO,
+    MatchDTO,
+    PlayerPathDTO,
+    StationAssignmentDTO,
+)
 from src.domain.match.value_objects import MatchStatus
 
 
@@ -42,6 +48,85 @@ class TestMatchesRouter:
         data = response.json()
         assert len(data) == 1
 
+    def test_トーナメント表を配列で取得できる(
+        self,
+        client: TestClient,
+        mock_match_query_handler: AsyncMock,
+    ) -> None:
+        contest_id = uuid.uuid4()
+        player_ids = [uuid.uuid4(), uuid.uuid4()]
+        final_id = uuid.uuid4()
+        mock_match_query_handler.handle_get_bracket.return_value = BracketDTO(
+            contest_id=contest_id,
+            size=2,
+            player_ids=player_ids,
+            slots=[-1, 0, 0, 1],
+            match_ids=[None, final_id],
+        )
+
+        response = client.get(f"/api/v1/contests/{contest_id}/matches/bracket")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["size"] == 2
+        assert data["slots"] == [-1, 0, 0, 1]
+        assert data["match_ids"] == [None, str(final_id)]
+
+    def test_プレイヤーの次の試合と決勝までの経路を取得できる(
+        self,
+        client: TestClient,
+        mock_match_query_handler: AsyncMock,
+    ) -> None:
+        contest_id, player_id = uuid.uuid4(), uuid.uuid4()
+        path = [uuid.uuid4(), uuid.uuid4()]
+        mock_match_query_handler.handle_get_player_path.return_value = PlayerPathDTO(
+            player_id=player_id, current_match_id=path[0], path=path
+        )
+
+        response = client.get(
+            f"/api/v1/contests/{contest_id}/matches/bracket/players/{player_id}"
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["current_match_id"] == str(path[0])
+        assert data["path"] == [str(m) for m in path]
+        query = mock_match_query_handler.handle_get_player_path.call_args.args[0]
+        assert query.player_id == player_id
+
+    def test_次の試合を台に割り当てる(
+        self,
+        client: TestClient,
+        mock_match_cmd_handler: AsyncMock,
+    ) -> None:
+        contest_id = uuid.uuid4()
+        dto = make_match_dto(contest_id)
+        mock_match_cmd_handler.handle_call_next_match.return_value = (
+            StationAssignmentDTO(station=3, match=dto)
+        )
+
+        response = client.post(
+            f"/api/v1/contests/{contest_id}/matches/call", params={"stations": 20}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["station"] == 3
+        assert data["match"]["match_id"] == str(dto.match_id)
+
+    def test_呼べる試合がなければ204(
+        self,
+        client: TestClient,
+        mock_match_cmd_handler: AsyncMock,
+    ) -> None:
+        mock_match_cmd_handler.handle_call_next_match.return_value = None
+
+        response = client.post(
+            f"/api/v1/contests/{uuid.uuid4()}/matches/call", params={"stations": 20}
+        )
+
+        assert response.status_code == 204
+
     def test_ブラケットを生成できる(
         self,
         client: TestClient,
@@ -49,15 +134,55 @@ class TestMatchesRouter:
     ) -> None:
         contest_id = uuid.uuid4()
         dtos = [make_match_dto(contest_id), make_match_dto(contest_id)]
-        mock_match_cmd_handler.handle_generate_bracket.return_value = dtos
+        mock_match_cmd_handler.handle_generate_bracket.return_value = (
+            GeneratedBracketDTO(total=1035, matches=dtos)
+        )
 
         response = client.post(
-            f"/api/v1/contests/{contest_id}/matches/generate"
+            f"/api/v1/contests/{contest_id}/matches/generate",
+            params={"page_size": 2},
         )
 
         assert response.status_code == 201
         data = response.json()
-        assert len(data) == 2
+        assert data["total"] == 1035
+        assert len(data["matches"]) == 2
+        command = mock_match_cmd_handler.handle_generate_bracket.call_args.args[0]
+        assert command.page_size == 2
+
+    def test_スイス式の次のラウンドを生成できる(
+        self,
+        client: TestClient,
+        mock_match_cmd_handler: AsyncMock,
+    ) -> None:
+        contest_id = uuid.uuid4()
+        mock_match_cmd_handler.handle_generate_next_round.return_value = (
+            GeneratedBracketDTO(total=1, matches=[make_match_dto(contest_id)])
+        )
+
+        response = client.post(f"/api/v1/contests/{contest_id}/matches/next-round")
+
+        assert response.status_code == 201
+        assert response.json()["total"] == 1
+
+    def test_決勝トーナメントを生成できる(
+        self,
+        client: TestClient,
+        mock_match_cmd_handler: AsyncMock,
+    ) -> None:
+        contest_id = uuid.uuid4()
+        mock_match_cmd_handler.handle_generate_top_cut.return_value = (
+            GeneratedBracketDTO(total=0, matches=[])
+        )
+
+        response = client.post(
+            f"/api/v1/contests/{contest_id}/matches/top-cut",
+            params={"advance_per_pool": 4},
+        )
+
+        assert response.status_code == 201
+        command = mock_match_cmd_handler.handle_generate_top_cut.call_args.args[0]
+        assert command.advance_per_pool == 4
 
     def test_試合を手動で追加できる(
         self,
@@ -0,0 +1,36 @@
+"""Metrics ルーターのテスト"""
+from fastapi.testclient import TestClient
+
+from src.infrastructure.pool_metrics import PoolSnapshot, WaitHistogram
+from src.presentation.dependencies import get_pool_snapshots
+from src.presentation.main import app
+
+
+def make_snapshot(checked_out: int, idle: int) -> PoolSnapshot:
+    return PoolSnapshot(
+        pool_size=5,
+        checked_out=checked_out,
+        idle=idle,
+        overflow=0,
+        timeouts=1,
+        acquire_wait=WaitHistogram(
+            buckets_ms=(1, 10), counts=(4, 1, 0), count=5, sum_ms=12.5
+        ),
+    )
+
+
+class TestMetricsRouter:
+    def test_接続プールの状態を役割ごとに取得できる(self, client: TestClient) -> None:
+        app.dependency_overrides[get_pool_snapshots] = lambda: {
+            "primary": make_snapshot(checked_out=1, idle=4),
+            "replica": make_snapshot(checked_out=3, idle=2),
+        }
+
+        response = client.get("/metrics/pool")
+
+        assert response.status_code == 200
+        primary, replica = response.json()
+        assert (primary["role"], primary["checked_out"]) == ("primary", 1)
+        assert (replica["role"], replica["checked_out"]) == ("replica", 3)
+        assert replica["idle"] == 2
+        assert replica["acquire_wait"]["counts"] == [4, 1, 0]
@@ -40,14 +40,86 @@ class TestStandingsRouter:
                 ),
             ],
         )
+        mock_standings_query_handler.handle_get_version.return_value = 3
         mock_standings_query_handler.handle_get_standings.return_value = dto
 
         response = client.get(f"/api/v1/contests/{contest_id}/standings")
 
         assert response.status_code == 200
+        assert response.headers["etag"] == '"3"'
         data = response.json()
         assert data["contest_id"] == str(contest_id)
         assert len(data["entries"]) == 2
         assert data["entries"][0]["player_name"] == "Alice"
         assert data["entries"][0]["wins"] == 2
         assert data["entries"][1]["player_name"] == "Bob"
+
+    def test_ETagが一致すれば304を返す(
+        self,
+        client: TestClient,
+        mock_standings_query_handler: AsyncMock,
+    ) -> None:
+        mock_standings_query_handler.handle_get_version.return_value = 3
+
+        response = client.get(
+            f"/api/v1/contests/{uuid.uuid4()}/standings",
+            headers={"If-None-Match": 'W/"2", "3"'},
+        )
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == '"3"'
+        mock_standings_query_handler.handle_get_standings.assert_not_called()
+
+    def test_存在しないコンテストは404を返す(
+        self,
+        client: TestClient,
+        mock_standings_query_handler: AsyncMock,
+    ) -> None:
+        from src.application.contest.handlers import ContestNotFoundError
+
+        contest_id = uuid.uuid4()
+        mock_standings_query_handler.handle_get_version.side_effect = (
+            ContestNotFoundError(contest_id)
+        )
+
+        response = client.get(f"/api/v1/contests/{contest_id}/standings")
+
+        assert response.status_code == 404
+
+    def test_タイブレークを指定できる(
+        self,
+        client: TestClient,
+        mock_standings_query_handler: AsyncMock,
+    ) -> None:
+        from src.domain.standings.tiebreak import Tiebreaker
+
+        contest_id = uuid.uuid4()
+        mock_standings_query_handler.handle_get_version.return_value = 1
+        mock_standings_query_handler.handle_get_standings.return_value = StandingsDTO(
+            contest_id=contest_id,
+            entries=[
+                StandingsEntryDTO(
+                    player_id=uuid.uuid4(),
+                    player_name="Alice",
+                    wins=1,
+                    losses=1,
+                    matches_played=2,
+                    game_wins=3,
+                    game_losses=3,
+                    rank=1,
+                    tiebreaks={"HEAD_TO_HEAD": 1},
+                ),
+            ],
+        )
+
+        response = client.get(
+            f"/api/v1/contests/{contest_id}/standings",
+            params=[("tiebreakers", "HEAD_TO_HEAD"), ("tiebreakers", "GAME_RATIO")],
+        )
+
+        assert response.status_code == 200
+        entry = response.json()["entries"][0]
+        assert entry["rank"] == 1
+        assert entry["tiebreaks"] == {"HEAD_TO_HEAD": 1}
+        query = mock_standings_query_handler.handle_get_standings.call_args.args[0]
+        assert query.tiebreakers == (Tiebreaker.HEAD_TO_HEAD, Tiebreaker.GAME_RATIO)
@@ -24,6 +24,7 @@ function ContestPage({ contestId, onBack }: { contestId: UUID; onBack: () => voi
             players={contest.players}
             contestStatus={contest.status}
             bestOf={contest.best_of}
+            format={contest.format}
           />
           <StandingsTable contestId={contestId} />
         </>
@@ -1,5 +1,12 @@
 import apiClient from "../../../shared/api/client";
-import type { Contest, ContestFormat, ContestStatus, Player, UUID } from "../../../shared/types";
+import type {
+  Contest,
+  ContestFormat,
+  ContestPage,
+  ContestStatus,
+  Player,
+  UUID,
+} from "../../../shared/types";
 
 export interface CreateContestInput {
   name: string;
@@ -9,8 +16,10 @@ export interface CreateContestInput {
 }
 
 export const contestApi = {
-  getAll: async (): Promise<Contest[]> => {
-    const { data } = await apiClient.get<Contest[]>("/contests");
+  getPage: async (cursor?: string | null): Promise<ContestPage> => {
+    const { data } = await apiClient.get<ContestPage>("/contests", {
+      params: cursor ? { cursor } : undefined,
+    });
     return data;
   },
 
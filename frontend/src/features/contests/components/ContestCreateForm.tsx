@@ -71,6 +71,9 @@ export function ContestCreateForm({ onCreated }: Props) {
           >
             <option value="ROUND_ROBIN">総当たり</option>
             <option value="SINGLE_ELIMINATION">シングルエリミネーション</option>
+            <option value="DOUBLE_ELIMINATION">ダブルエリミネーション</option>
+            <option value="SWISS">スイス式</option>
+            <option value="POOL_PLAY">予選リーグ＋決勝トーナメント</option>
           </select>
         </label>
       </div>
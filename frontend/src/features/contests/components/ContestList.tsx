@@ -6,7 +6,9 @@ interface Props {
 }
 
 export function ContestList({ onSelectContest }: Props) {
-  const { data: contests, isLoading, isError } = useContests();
+  const { data, isLoading, isError, hasNextPage, fetchNextPage, isFetchingNextPage } =
+    useContests();
+  const contests = data?.pages.flatMap((page) => page.items);
 
   if (isLoading) return <p>読み込み中...</p>;
   if (isError) return <p>エラーが発生しました</p>;
@@ -24,6 +26,11 @@ export function ContestList({ onSelectContest }: Props) {
           </li>
         ))}
       </ul>
+      {hasNextPage && (
+        <button onClick={() => fetchNextPage()} disabled={isFetchingNextPage}>
+          {isFetchingNextPage ? "読み込み中..." : "さらに表示"}
+        </button>
+      )}
     </div>
   );
 }
@@ -1,4 +1,9 @@
-import { useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
+import {
+  useInfiniteQuery,
+  useMutation,
+  useQuery,
+  useQueryClient,
+} from "@tanstack/react-query";
 import { contestApi, type CreateContestInput } from "../api/contestApi";
 import type { ContestStatus, UUID } from "../../../shared/types";
 
@@ -8,10 +13,13 @@ export function contestQueryKey(contestId: UUID) {
   return [...CONTESTS_QUERY_KEY, contestId] as const;
 }
 
+// 一覧はキーセットのページ単位で読み込む（next_cursor が null なら最後のページ）
 export function useContests() {
-  return useQuery({
+  return useInfiniteQuery({
     queryKey: CONTESTS_QUERY_KEY,
-    queryFn: contestApi.getAll,
+    queryFn: ({ pageParam }) => contestApi.getPage(pageParam),
+    initialPageParam: null as string | null,
+    getNextPageParam: (lastPage) => lastPage.next_cursor,
   });
 }
 
@@ -1,5 +1,12 @@
 import apiClient from "../../../shared/api/client";
-import type { Match, UUID } from "../../../shared/types";
+import type {
+  Bracket,
+  BracketGeneration,
+  Match,
+  PlayerPath,
+  StationAssignment,
+  UUID,
+} from "../../../shared/types";
 
 export interface RecordMatchResultInput {
   player1_character?: string | null;
@@ -24,13 +31,57 @@ export const matchApi = {
     return data;
   },
 
-  generateBracket: async (contestId: UUID): Promise<Match[]> => {
-    const { data } = await apiClient.post<Match[]>(
+  getBracket: async (contestId: UUID): Promise<Bracket> => {
+    const { data } = await apiClient.get<Bracket>(
+      `/contests/${contestId}/matches/bracket`
+    );
+    return data;
+  },
+
+  getPlayerPath: async (
+    contestId: UUID,
+    playerId: UUID
+  ): Promise<PlayerPath> => {
+    const { data } = await apiClient.get<PlayerPath>(
+      `/contests/${contestId}/matches/bracket/players/${playerId}`
+    );
+    return data;
+  },
+
+  generateBracket: async (contestId: UUID): Promise<BracketGeneration> => {
+    const { data } = await apiClient.post<BracketGeneration>(
       `/contests/${contestId}/matches/generate`
     );
     return data;
   },
 
+  generateNextRound: async (contestId: UUID): Promise<BracketGeneration> => {
+    const { data } = await apiClient.post<BracketGeneration>(
+      `/contests/${contestId}/matches/next-round`
+    );
+    return data;
+  },
+
+  generateTopCut: async (contestId: UUID): Promise<BracketGeneration> => {
+    const { data } = await apiClient.post<BracketGeneration>(
+      `/contests/${contestId}/matches/top-cut`
+    );
+    return data;
+  },
+
+  // 呼べる試合がない（204）ときは null
+  callNextMatch: async (
+    contestId: UUID,
+    stations: number
+  ): Promise<StationAssignment | null> => {
+    const { data, status } = await apiClient.post<StationAssignment>(
+      `/contests/${contestId}/matches/call`,
+      null,
+      { params: { stations } }
+    );
+    return status === 204 ? null : data;
+  },
+
   addMatch: async (contestId: UUID, input: AddMatchInput): Promise<Match> => {
     const { data } = await apiClient.post<Match>(
       `/contests/${contestId}/matches`,
@@ -0,0 +1,100 @@
+import { useState } from "react";
+import { useBracket, usePlayerPath } from "../hooks/useMatches";
+import type { Bracket, Player, UUID } from "../../../shared/types";
+
+interface Props {
+  contestId: UUID;
+  players: Player[];
+}
+
+// ラウンド r（1 始まり）の試合は節点 size >> r 以上 size >> (r - 1) 未満
+function roundNodes(size: number, round: number): number[] {
+  const nodes: number[] = [];
+  for (let node = size >> round; node < size >> (round - 1); node++) {
+    nodes.push(node);
+  }
+  return nodes;
+}
+
+function slotPlayerId(bracket: Bracket, node: number): UUID | null {
+  const index = bracket.slots[node];
+  return index >= 0 ? bracket.player_ids[index] : null;
+}
+
+export function BracketView({ contestId, players }: Props) {
+  const { data: bracket, isLoading, isError } = useBracket(contestId);
+  const [selectedPlayerId, setSelectedPlayerId] = useState<UUID | null>(null);
+  const { data: playerPath } = usePlayerPath(contestId, selectedPlayerId);
+
+  if (isLoading) return <p>読み込み中...</p>;
+  if (isError || !bracket) return null;
+
+  const rounds = Math.log2(bracket.size);
+  const path = new Set(playerPath?.path ?? []);
+  const playerName = (playerId: UUID | null) =>
+    playerId === null
+      ? "未定"
+      : players.find((p) => p.player_id === playerId)?.name ?? playerId.slice(0, 8);
+
+  return (
+    <div>
+      <h3>トーナメント表</h3>
+      <p>プレイヤーを選ぶと決勝までの経路を表示します</p>
+      <div style={{ display: "flex", gap: "16px" }}>
+        {Array.from({ length: rounds }, (_, i) => i + 1).map((round) => (
+          <div key={round}>
+            <h4>{round === rounds ? "決勝" : `${round}回戦`}</h4>
+            {roundNodes(bracket.size, round).map((node) => {
+              const matchId = bracket.match_ids[node];
+              const current =
+                matchId !== null && matchId === playerPath?.current_match_id;
+              return (
+                <div
+                  key={node}
+                  style={{
+                    border: current ? "2px solid #333" : "1px solid #ccc",
+                    background: matchId !== null && path.has(matchId) ? "#eef" : undefined,
+                    margin: "8px 0",
+                    padding: "4px",
+                  }}
+                >
+                  {[2 * node, 2 * node + 1].map((child) => {
+                    const playerId = slotPlayerId(bracket, child);
+                    return (
+                      <div key={child}>
+                        <button
+                          type="button"
+                          onClick={() => setSelectedPlayerId(playerId)}
+                          disabled={playerId === null}
+                          style={{
+                            fontWeight:
+                              playerId !== null && playerId === slotPlayerId(bracket, node)
+                                ? "bold"
+                                : undefined,
+                          }}
+                        >
+                          {playerName(playerId)}
+                        </button>
+                      </div>
+                    );
+                  })}
+                </div>
+              );
+            })}
+          </div>
+        ))}
+      </div>
+      {selectedPlayerId && playerPath && (
+        <p>
+          {playerName(selectedPlayerId)}:{" "}
+          {playerPath.current_match_id === null
+            ? "次の試合はありません"
+            : `あと ${
+                playerPath.path.length -
+                playerPath.path.indexOf(playerPath.current_match_id)
+              } 勝で優勝`}
+        </p>
+      )}
+    </div>
+  );
+}
@@ -1,12 +1,21 @@
 import { useState } from "react";
-import { useMatches, useGenerateBracket, useRecordMatchResult } from "../hooks/useMatches";
-import type { Match, Player, UUID } from "../../../shared/types";
+import {
+  useMatches,
+  useGenerateBracket,
+  useGenerateNextRound,
+  useGenerateTopCut,
+  useCallNextMatch,
+  useRecordMatchResult,
+} from "../hooks/useMatches";
+import { BracketView } from "./BracketView";
+import type { ContestFormat, Match, Player, UUID } from "../../../shared/types";
 
 interface Props {
   contestId: UUID;
   players: Player[];
   contestStatus: string;
   bestOf: number;
+  format: ContestFormat;
 }
 
 function getPlayerName(playerId: UUID, players: Player[]): string {
@@ -98,9 +107,19 @@ function MatchResultForm({
   );
 }
 
-export function MatchList({ contestId, players, contestStatus, bestOf }: Props) {
+export function MatchList({ contestId, players, contestStatus, bestOf, format }: Props) {
   const { data: matches, isLoading, isError } = useMatches(contestId);
   const generateMutation = useGenerateBracket();
+  const nextRoundMutation = useGenerateNextRound();
+  const topCutMutation = useGenerateTopCut();
+  const callMutation = useCallNextMatch();
+  const [stations, setStations] = useState(20);
+  const roundFinished =
+    (matches?.length ?? 0) > 0 && matches!.every((m) => m.status === "COMPLETED");
+  // トーナメント表はシングルエリミネーションと予選リーグ後の決勝トーナメントのみ
+  const hasBracket =
+    format === "SINGLE_ELIMINATION" ||
+    (format === "POOL_PLAY" && (matches?.some((m) => m.pool === null) ?? false));
 
   if (isLoading) return <p>読み込み中...</p>;
   if (isError) return <p>エラーが発生しました</p>;
@@ -118,11 +137,58 @@ export function MatchList({ contestId, players, contestStatus, bestOf }: Props)
         </button>
       )}
 
+      {format === "SWISS" && contestStatus !== "COMPLETED" && roundFinished && (
+        <button
+          onClick={() => nextRoundMutation.mutate(contestId)}
+          disabled={nextRoundMutation.isPending}
+        >
+          次のラウンドを生成
+        </button>
+      )}
+
+      {format === "POOL_PLAY" &&
+        contestStatus !== "COMPLETED" &&
+        roundFinished &&
+        matches!.every((m) => m.pool !== null) && (
+          <button
+            onClick={() => topCutMutation.mutate(contestId)}
+            disabled={topCutMutation.isPending}
+          >
+            決勝トーナメント生成
+          </button>
+        )}
+
+      {contestStatus === "IN_PROGRESS" && (matches?.length ?? 0) > 0 && (
+        <div>
+          <input
+            type="number"
+            min={1}
+            value={stations}
+            onChange={(e) => setStations(Number(e.target.value))}
+            aria-label="台数"
+          />
+          <button
+            onClick={() => callMutation.mutate({ contestId, stations })}
+            disabled={callMutation.isPending}
+          >
+            次の試合を呼ぶ
+          </button>
+          {callMutation.isSuccess && callMutation.data === null && (
+            <span>呼べる試合がありません</span>
+          )}
+        </div>
+      )}
+
+      {hasBracket && (matches?.length ?? 0) > 0 && (
+        <BracketView contestId={contestId} players={players} />
+      )}
+
       {matches?.map((match) => (
         <div key={match.match_id} style={{ border: "1px solid #ccc", margin: "8px", padding: "8px" }}>
           <div>
             {getPlayerName(match.player1_id, players)} vs{" "}
             {getPlayerName(match.player2_id, players)}
+            {match.station !== null && <span> (台 {match.station})</span>}
           </div>
           {match.status === "COMPLETED" ? (
             <div>
@@ -14,6 +14,23 @@ export function useMatches(contestId: UUID) {
   });
 }
 
+export function useBracket(contestId: UUID) {
+  return useQuery({
+    // 試合一覧と同じキーの下に置き、試合の更新時にまとめて無効化する
+    queryKey: [...matchesQueryKey(contestId), "bracket"] as const,
+    queryFn: () => matchApi.getBracket(contestId),
+    enabled: !!contestId,
+  });
+}
+
+export function usePlayerPath(contestId: UUID, playerId: UUID | null) {
+  return useQuery({
+    queryKey: [...matchesQueryKey(contestId), "bracket", "players", playerId] as const,
+    queryFn: () => matchApi.getPlayerPath(contestId, playerId!),
+    enabled: !!contestId && !!playerId,
+  });
+}
+
 export function useGenerateBracket() {
   const queryClient = useQueryClient();
 
@@ -25,6 +42,40 @@ export function useGenerateBracket() {
   });
 }
 
+export function useGenerateNextRound() {
+  const queryClient = useQueryClient();
+
+  return useMutation({
+    mutationFn: (contestId: UUID) => matchApi.generateNextRound(contestId),
+    onSuccess: (_data, contestId) => {
+      queryClient.invalidateQueries({ queryKey: matchesQueryKey(contestId) });
+    },
+  });
+}
+
+export function useGenerateTopCut() {
+  const queryClient = useQueryClient();
+
+  return useMutation({
+    mutationFn: (contestId: UUID) => matchApi.generateTopCut(contestId),
+    onSuccess: (_data, contestId) => {
+      queryClient.invalidateQueries({ queryKey: matchesQueryKey(contestId) });
+    },
+  });
+}
+
+export function useCallNextMatch() {
+  const queryClient = useQueryClient();
+
+  return useMutation({
+    mutationFn: ({ contestId, stations }: { contestId: UUID; stations: number }) =>
+      matchApi.callNextMatch(contestId, stations),
+    onSuccess: (_data, { contestId }) => {
+      queryClient.invalidateQueries({ queryKey: matchesQueryKey(contestId) });
+    },
+  });
+}
+
 export function useRecordMatchResult() {
   const queryClient = useQueryClient();
 
@@ -28,9 +28,9 @@ export function StandingsTable({ contestId }: Props) {
           </tr>
         </thead>
         <tbody>
-          {standings.entries.map((entry, index) => (
+          {standings.entries.map((entry) => (
             <tr key={entry.player_id}>
-              <td>{index + 1}</td>
+              <td>{entry.rank}</td>
               <td>{entry.player_name}</td>
               <td>{entry.wins}</td>
               <td>{entry.losses}</td>
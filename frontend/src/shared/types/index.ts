@@ -1,6 +1,11 @@
 export type UUID = string;
 
-export type ContestFormat = "ROUND_ROBIN" | "SINGLE_ELIMINATION";
+export type ContestFormat =
+  | "ROUND_ROBIN"
+  | "SINGLE_ELIMINATION"
+  | "DOUBLE_ELIMINATION"
+  | "SWISS"
+  | "POOL_PLAY";
 export type ContestStatus = "PRE_REGISTRATION" | "IN_PROGRESS" | "COMPLETED";
 export type MatchStatus = "PENDING" | "COMPLETED";
 
@@ -27,6 +32,22 @@ export interface Contest {
   players: Player[];
 }
 
+export interface ContestSummary {
+  contest_id: UUID;
+  name: string;
+  game_title_id: UUID;
+  format: ContestFormat;
+  best_of: number;
+  status: ContestStatus;
+  created_at: string;
+  player_count: number;
+}
+
+export interface ContestPage {
+  items: ContestSummary[];
+  next_cursor: string | null;
+}
+
 export interface Match {
   match_id: UUID;
   contest_id: UUID;
@@ -40,6 +61,45 @@ export interface Match {
   status: MatchStatus;
   round: number | null;
   match_order: number;
+  next_match_id: UUID | null;
+  next_match_slot: number | null;
+  loser_next_match_id: UUID | null;
+  loser_next_match_slot: number | null;
+  pool: number | null;
+  // 対戦中の台の番号。呼び出し前と完了後は null
+  station: number | null;
+}
+
+export interface StationAssignment {
+  station: number;
+  match: Match;
+}
+
+export interface BracketGeneration {
+  total: number;
+  matches: Match[];
+  // 書き込んだ行数（再生成では保存済みの試合との差分のみ）
+  inserted: number;
+  updated: number;
+  deleted: number;
+}
+
+// 二分ヒープの並び（決勝が 1、節点 i の子は 2i と 2i+1）
+// slots[1..size-1] は各試合の勝者、slots[size..] は1回戦の枠。
+// 値は player_ids の添字で、未定・BYE は -1
+export interface Bracket {
+  contest_id: UUID;
+  size: number;
+  player_ids: UUID[];
+  slots: number[];
+  match_ids: (UUID | null)[];
+}
+
+// 次に戦う試合（敗退済み・優勝済みなら null）と、決勝まで勝ち進む場合の試合
+export interface PlayerPath {
+  player_id: UUID;
+  current_match_id: UUID | null;
+  path: UUID[];
 }
 
 export interface StandingsEntry {
@@ -50,6 +110,8 @@ export interface StandingsEntry {
   matches_played: number;
   game_wins: number;
   game_losses: number;
+  rank: number;
+  tiebreaks: Record<string, number>;
 }
 
 export interface Standings {
@@ -1,5 +1,11 @@
 import { http, HttpResponse } from "msw";
-import type { GameTitle, Contest, Match, Standings } from "../../src/shared/types";
+import type {
+  GameTitle,
+  Contest,
+  ContestPage,
+  Match,
+  Standings,
+} from "../../src/shared/types";
 
 const mockGameTitles: GameTitle[] = [
   { game_title_id: "gt-1", name: "Street Fighter 6" },
@@ -66,7 +72,14 @@ export const handlers = [
   }),
 
   http.get("/api/v1/contests", () => {
-    return HttpResponse.json(mockContests);
+    const page: ContestPage = {
+      items: mockContests.map(({ players, ...contest }) => ({
+        ...contest,
+        player_count: players.length,
+      })),
+      next_cursor: null,
+    };
+    return HttpResponse.json(page);
   }),
 
   http.post("/api/v1/contests", async ({ request }) => {